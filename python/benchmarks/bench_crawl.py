@@ -0,0 +1,241 @@
+"""
+오프라인 엔드투엔드 수집 벤치마크
+로컬 fmkorea 대역 서버를 상대로 헤드리스 Chromium으로 collect_posts_by_member / collect_posts를 실행하고
+설정(모드 × 레이아웃 × 게시물 탭 × 실행 방식 × 동시성)별로 초당 게시물 수, 첫 게시물까지 걸린 시간, 게시물당 전송량,
+게시물 탐색 시간, 최대 메모리, 프로세스 트리(Chromium 렌더러 포함) CPU 시간을 측정하여 JSON으로 저장
+
+게시물 탭:
+    static     쿠키를 얻은 뒤 JavaScript를 끈 컨텍스트로 게시물 로딩 (기본값)
+    js         모든 게시물을 JavaScript가 켜진 컨텍스트로 로딩
+
+실행 방식:
+    tasks      한 프로세스에서 collect_posts를 동시성 수만큼 asyncio로 동시 실행
+    processes  collect_posts_parallel 워커 프로세스 (동시성 = 워커 수, --max-rps로 전체 요청 한도)
+
+사용법:
+    python python/benchmarks/bench_crawl.py --modes member,urls --concurrency 1,2,4 --posts 60
+    python python/benchmarks/bench_crawl.py --modes urls --executors tasks,processes --concurrency 1,2,4,8
+    python python/benchmarks/bench_crawl.py --modes urls --layouts desktop,mobile    # 모바일 사이트 모드 비교
+    python python/benchmarks/bench_crawl.py --modes urls --post-pages static,js      # JavaScript 없는 게시물 탭 비교
+    python python/benchmarks/bench_crawl.py --modes member --posts 400 --since-days 7,30,0  # 작성일 구간 (0 = 전체)
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from procstats import run_measured  # noqa: E402
+
+RESULTS_DIR = BENCH_DIR / "results"
+
+
+async def _run_setting(setting: dict) -> dict:
+    """한 설정을 실행 (자식 프로세스에서 호출)"""
+    # 워커 프로세스도 같은 설정을 쓰도록 수집 모듈을 불러오기 전에 환경 변수로 지정
+    os.environ["FMK_STATIC_POSTS"] = "1" if setting["post_pages"] == "static" else "0"
+    from metrics import enable_metrics, snapshot
+    from scraper import collect_posts, collect_posts_by_member, collect_posts_parallel, set_delay_scale, set_mobile_mode
+    from standin_server import ServerConfig, StandInServer
+
+    set_delay_scale(setting["delay_scale"])
+    set_mobile_mode(setting["layout"] == "mobile")
+    # 게시물 탐색 시간 (post.goto) - processes 방식은 워커 프로세스에서 측정되므로 없음
+    enable_metrics(snapshot_interval=0)
+    config = ServerConfig(**setting["server"])
+    first_post_at = []
+
+    def on_post(post, filepath):
+        if not first_post_at:
+            first_post_at.append(time.perf_counter())
+
+    with StandInServer(config) as server, tempfile.TemporaryDirectory() as tmp:
+        # 에셋 캐시(tmp/cache/assets)도 설정마다 비어 있는 상태에서 시작
+        output_dir = str(Path(tmp) / "raw")
+        start = time.perf_counter()
+
+        if setting["mode"] == "member":
+            # 작성일 구간은 대역 서버의 기준 시각에서 since_days일 전부터
+            since = server.now - timedelta(days=setting["since_days"]) if setting["since_days"] else None
+            urls = await collect_posts_by_member(
+                member_id="3902132645",
+                max_pages=config.total_pages + 1,
+                base_url=server.base_url,
+                headless=True,
+                output_dir=output_dir,
+                since=since,
+            )
+        else:
+            urls = server.post_urls()
+        discovered_at = time.perf_counter()
+
+        concurrency = max(1, setting["concurrency"])
+        if setting["executor"] == "processes":
+            saved_files = await collect_posts_parallel(
+                urls, output_dir=output_dir, workers=concurrency, post_callback=on_post,
+                headless=True, max_rps=setting["max_rps"]
+            )
+            saved = len(saved_files)
+        else:
+            shards = [urls[i::concurrency] for i in range(concurrency)]
+            results = await asyncio.gather(*(
+                collect_posts(shard, output_dir=output_dir, post_callback=on_post, headless=True)
+                for shard in shards if shard
+            ))
+            saved = sum(len(files) for files in results)
+        elapsed = time.perf_counter() - start
+        server_stats = dict(server.stats)
+    goto = snapshot()["stages"].get("post.goto")
+
+    return {
+        "mode": setting["mode"],
+        "layout": setting["layout"],
+        "post_pages": setting["post_pages"],
+        "executor": setting["executor"],
+        "concurrency": concurrency,
+        "since_days": setting["since_days"],
+        "urls": len(urls),
+        "posts_saved": saved,
+        "elapsed_s": round(elapsed, 3),
+        "discovery_s": round(discovered_at - start, 3),
+        "posts_per_sec": round(saved / elapsed, 3) if elapsed else None,
+        "time_to_first_post_s": round(first_post_at[0] - start, 3) if first_post_at else None,
+        "bytes_per_post": round(server_stats["bytes"] / saved) if saved else None,
+        "post_goto_p50_ms": goto["p50_ms"] if goto else None,
+        "post_goto_p95_ms": goto["p95_ms"] if goto else None,
+        "server": server_stats,
+    }
+
+
+def run_one(setting_json: str, result_file: str):
+    """자식 프로세스 진입점: 결과를 result_file에 기록"""
+    result = asyncio.run(_run_setting(json.loads(setting_json)))
+    with open(result_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False)
+
+
+def measure_setting(setting: dict) -> dict:
+    """설정 하나를 별도 프로세스로 실행하며 프로세스 트리의 최대 메모리를 샘플링"""
+    with tempfile.TemporaryDirectory() as tmp:
+        result_file = Path(tmp) / "result.json"
+        measured = run_measured(
+            [sys.executable, __file__, "--run-one", json.dumps(setting), "--result-file", str(result_file)]
+        )
+
+        if measured["returncode"] != 0 or not result_file.exists():
+            return {
+                "mode": setting["mode"],
+                "layout": setting["layout"],
+                "post_pages": setting["post_pages"],
+                "executor": setting["executor"],
+                "concurrency": setting["concurrency"],
+                "since_days": setting["since_days"],
+                "error": measured["error"] or "unknown",
+            }
+
+        result = json.loads(result_file.read_text(encoding='utf-8'))
+        result["peak_rss_mb"] = measured["peak_rss_mb"]
+        result["cpu_s"] = measured["cpu_s"]
+        result["cpu_ms_per_post"] = (
+            round(measured["cpu_s"] * 1000 / result["posts_saved"], 1)
+            if measured["cpu_s"] and result["posts_saved"] else None
+        )
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 엔드투엔드 수집 벤치마크")
+    parser.add_argument("--modes", default="member,urls", help="쉼표로 구분한 모드 (member, urls)")
+    parser.add_argument("--layouts", default="desktop", help="쉼표로 구분한 사이트 레이아웃 (desktop, mobile)")
+    parser.add_argument("--post-pages", default="static", help="쉼표로 구분한 게시물 탭 (static, js)")
+    parser.add_argument("--executors", default="tasks", help="쉼표로 구분한 실행 방식 (tasks, processes)")
+    parser.add_argument("--concurrency", default="1,2", help="쉼표로 구분한 동시 수집기 수")
+    parser.add_argument("--max-rps", type=float, default=0.0, help="processes 방식의 전체 초당 요청 한도 (기본 0 = 제한 없음)")
+    parser.add_argument("--posts", type=int, default=40, help="회원의 전체 게시물 수")
+    parser.add_argument("--since-days", default="0", help="쉼표로 구분한 member 모드 작성일 구간 (일, 0 = 전체)")
+    parser.add_argument("--posts-per-page", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--padding-kb", type=int, default=60, help="게시물 페이지의 본문 외 마크업 크기")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--challenge-rate", type=float, default=0.0)
+    parser.add_argument("--delay-scale", type=float, default=0.0, help="random_delay 배율 (기본 0 = 지연 없음)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/crawl_<시각>.json)")
+    parser.add_argument("--run-one", help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        run_one(args.run_one, args.result_file)
+        return
+
+    server = {
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "padding_kb": args.padding_kb,
+        "posts_per_page": args.posts_per_page,
+        "total_posts": args.posts,
+        "error_rate": args.error_rate,
+        "challenge_rate": args.challenge_rate,
+    }
+
+    runs = []
+    def split(value: str) -> list:
+        return [item.strip() for item in value.split(",") if item.strip()]
+
+    windows = [float(days) for days in split(args.since_days)]
+    for mode, layout, post_pages, executor, concurrency, since_days in itertools.product(
+        split(args.modes), split(args.layouts), split(args.post_pages), split(args.executors),
+        [int(c) for c in split(args.concurrency)], windows
+    ):
+        if mode != "member" and since_days != windows[0]:
+            # 작성일 구간은 member 모드에만 적용 (urls 모드는 한 번만 측정)
+            continue
+        setting = {
+            "mode": mode,
+            "layout": layout,
+            "post_pages": post_pages,
+            "executor": executor,
+            "concurrency": concurrency,
+            "max_rps": args.max_rps,
+            "server": server,
+            "delay_scale": args.delay_scale,
+            "since_days": since_days if mode == "member" else 0,
+        }
+        print(f"⏱️  {mode} × {layout} × {post_pages} × {executor} × 동시성 {concurrency}"
+              + (f" × 최근 {since_days:g}일" if setting["since_days"] else "") + " 측정 중...", file=sys.stderr)
+        result = measure_setting(setting)
+        runs.append(result)
+        print(json.dumps(result, ensure_ascii=False), file=sys.stderr)
+
+    report = {
+        "benchmark": "crawl_offline",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "server": server,
+        "delay_scale": args.delay_scale,
+        "max_rps": args.max_rps,
+        "runs": runs,
+    }
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"crawl_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(json.dumps(report, ensure_ascii=False))
+    print(f"📁 결과 저장: {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
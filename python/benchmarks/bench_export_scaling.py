@@ -0,0 +1,189 @@
+"""
+Exporter 규모 확장 벤치마크
+합성 코퍼스(1k, 100k, 1M ...)에서 내보내기 모드별 실행 시간, 최대 메모리(RSS), 초당 출력 바이트를 측정
+각 실행은 별도 프로세스에서 수행하므로 모드 간 메모리가 섞이지 않으며, 제한 시간을 넘긴 실행은 timeout으로 기록
+
+모드:
+    combined      export_to_notebooklm(combine=True)
+    per_post      export_to_notebooklm(combine=False)
+    incremental   export_to_notebooklm(incremental=True) 재실행 (캐시가 채워진 상태)
+    parallel      export_to_notebooklm(workers=0)
+    <형식 이름>    export_formats([형식]) (jsonl, csv, html, markdown 등 EXPORTERS 전체)
+
+사용법:
+    python python/benchmarks/bench_export_scaling.py --sizes 1k,100k --modes combined,per_post,jsonl
+    python python/benchmarks/bench_export_scaling.py --sizes 1m --timeout 3600
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from corpus import corpus_bytes, ensure_corpus, parse_size  # noqa: E402
+from procstats import run_measured  # noqa: E402
+
+RESULTS_DIR = BENCH_DIR / "results"
+DEFAULT_CORPUS_ROOT = BENCH_DIR / "corpora"
+
+NOTEBOOKLM_MODES = {
+    "combined": {"combine": True},
+    "per_post": {"combine": False},
+    "incremental": {"combine": True, "incremental": True},
+    "parallel": {"combine": True, "workers": 0},
+}
+
+
+def _output_bytes(output_dir: Path) -> tuple:
+    """출력 디렉토리의 (파일 수, 전체 바이트) (.cache 제외)"""
+    files = 0
+    total = 0
+    for path in output_dir.rglob("*"):
+        if path.is_file() and ".cache" not in path.parts:
+            files += 1
+            total += path.stat().st_size
+    return files, total
+
+
+def run_one(mode: str, data_dir: str, output_dir: str, result_file: str):
+    """자식 프로세스 진입점: 모드 하나를 실행하고 결과를 result_file에 기록"""
+    from exporter import EXPORTERS, export_formats, export_to_notebooklm
+
+    output_path = Path(output_dir)
+    warmup_s = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode in NOTEBOOKLM_MODES:
+            options = NOTEBOOKLM_MODES[mode]
+            if options.get("incremental"):
+                # 캐시를 채우는 첫 실행은 따로 기록하고 두 번째 실행을 측정
+                warm_start = time.perf_counter()
+                export_to_notebooklm(data_dir, output_dir, **options)
+                warmup_s = time.perf_counter() - warm_start
+            start = time.perf_counter()
+            export_to_notebooklm(data_dir, output_dir, **options)
+        elif mode in EXPORTERS:
+            start = time.perf_counter()
+            export_formats(data_dir, output_dir, [mode])
+        else:
+            raise ValueError(f"알 수 없는 모드: {mode}")
+        elapsed = time.perf_counter() - start
+
+    files, total = _output_bytes(output_path)
+    result = {
+        "export_s": round(elapsed, 3),
+        "output_files": files,
+        "output_bytes": total,
+        "output_mb_per_sec": round(total / elapsed / 1024 / 1024, 2) if elapsed else None,
+    }
+    if warmup_s is not None:
+        result["warmup_s"] = round(warmup_s, 3)
+    if resource:
+        # 샘플링 간격보다 짧은 실행도 정확한 최대값을 얻기 위해 커널 집계값도 기록
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result["maxrss_mb"] = round(maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+    with open(result_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+
+def measure(mode: str, data_dir: Path, timeout: float) -> dict:
+    """모드 하나를 별도 프로세스로 실행하며 실행 시간과 최대 메모리 측정"""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp) / "out"
+        result_file = Path(tmp) / "result.json"
+        measured = run_measured(
+            [sys.executable, __file__, "--run-one", mode, str(data_dir), str(output_dir), str(result_file)],
+            timeout=timeout,
+        )
+        result = {
+            "mode": mode,
+            "wall_s": measured["elapsed_s"],
+            "peak_rss_mb": measured["peak_rss_mb"],
+        }
+        if measured["error"] or not result_file.exists():
+            result["error"] = measured["error"] or "no result"
+            return result
+        result.update(json.loads(result_file.read_text(encoding='utf-8')))
+        maxrss = result.pop("maxrss_mb", None)
+        if maxrss and (result["peak_rss_mb"] or 0) < maxrss:
+            result["peak_rss_mb"] = maxrss
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporter 규모 확장 벤치마크")
+    parser.add_argument("--sizes", default="1k,100k,1m", help="쉼표로 구분한 코퍼스 규모 (예: 1k,100k,1m)")
+    parser.add_argument("--modes", default="combined,per_post,incremental,parallel,jsonl,csv,html",
+                        help="쉼표로 구분한 내보내기 모드")
+    parser.add_argument("--corpus-format", default="raw", help="코퍼스 저장 형식 (corpus.CORPUS_FORMATS)")
+    parser.add_argument("--corpus-root", default=str(DEFAULT_CORPUS_ROOT), help="생성한 코퍼스 보관 위치 (재사용)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=1800.0, help="실행당 제한 시간 (초)")
+    parser.add_argument("--keep-corpus", action="store_true", help="측정 후 코퍼스를 삭제하지 않음")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: benchmarks/results/export_scaling_<시각>.json)")
+    parser.add_argument("--run-one", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        run_one(*args.run_one)
+        return
+
+    modes = [m.strip() for m in args.modes.split(",") if m.strip()]
+    corpus_root = Path(args.corpus_root)
+    corpora = []
+    runs = []
+
+    for size in [parse_size(s) for s in args.sizes.split(",") if s.strip()]:
+        gen_start = time.perf_counter()
+        data_dir = ensure_corpus(corpus_root, size, args.seed, args.corpus_format)
+        generate_s = time.perf_counter() - gen_start
+        input_bytes = corpus_bytes(data_dir)
+
+        for mode in modes:
+            print(f"⏱️  {size:,}개 × {mode} 측정 중...", file=sys.stderr)
+            result = {"posts": size, **measure(mode, data_dir, args.timeout)}
+            runs.append(result)
+            print(json.dumps(result, ensure_ascii=False), file=sys.stderr)
+
+        corpora.append({
+            "posts": size,
+            "input_mb": round(input_bytes / 1024 / 1024, 1),
+            "generate_s": round(generate_s, 3),
+        })
+        if not args.keep_corpus:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    report = {
+        "benchmark": "export_scaling",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus_format": args.corpus_format,
+        "corpora": corpora,
+        "runs": runs,
+    }
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"export_scaling_{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(json.dumps(report, ensure_ascii=False))
+    print(f"📁 결과 저장: {output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
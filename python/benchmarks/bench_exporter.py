@@ -0,0 +1,67 @@
+"""
+Exporter 벤치마크 - 직렬 vs 병렬 변환 속도 비교
+합성 게시물 코퍼스를 만들어 export_to_notebooklm의 두 경로를 측정하고 결과를 JSON으로 출력
+
+사용법:
+    python python/benchmarks/bench_exporter.py [게시물 수] [워커 수]
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from exporter import export_to_notebooklm  # noqa: E402
+
+from corpus import write_corpus  # noqa: E402
+
+
+def timed_export(data_dir: Path, output_dir: Path, workers: int) -> tuple:
+    """export_to_notebooklm 실행 시간 측정 (진행 출력은 버림)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        files = export_to_notebooklm(str(data_dir), str(output_dir), combine=True, workers=workers)
+    elapsed = time.perf_counter() - start
+    return elapsed, Path(files[0])
+
+
+def body_of(path: Path) -> str:
+    """생성 시각 헤더를 제외한 통합 파일 본문"""
+    text = path.read_text(encoding='utf-8')
+    return text.split("---\n\n", 1)[1]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        data_dir = tmp_path / "raw"
+        write_corpus(data_dir, count)
+
+        serial_time, serial_file = timed_export(data_dir, tmp_path / "serial", workers=1)
+        parallel_time, parallel_file = timed_export(data_dir, tmp_path / "parallel", workers=workers)
+
+        report = {
+            "benchmark": "exporter_parallel",
+            "posts": count,
+            "workers": workers,
+            "serial_sec": round(serial_time, 3),
+            "parallel_sec": round(parallel_time, 3),
+            "speedup": round(serial_time / parallel_time, 2) if parallel_time else None,
+            "identical_output": body_of(serial_file) == body_of(parallel_file),
+        }
+
+    print(json.dumps(report, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+데스크톱 / 모바일 레이아웃 비교 벤치마크
+같은 게시물의 데스크톱 페이지(www.fmkorea.com)와 모바일 페이지(m.fmkorea.com) 픽스처 쌍을 읽어
+게시물당 전송량(원본 / gzip), 게시물당 파싱 시간, 두 레이아웃의 파싱 결과 일치 여부를 측정
+
+데스크톱 픽스처는 파서 벤치마크와 공유 (fixtures/parser), 모바일 픽스처는 같은 파일명으로 fixtures/parser_mobile에 둠
+디렉토리가 비어 있으면 fmkorea_pages로 생성하며, 실제로 저장한 페이지 쌍을 같은 파일명으로 넣어도 그대로 측정됨
+
+사용법:
+    python python/benchmarks/bench_layouts.py                  # 측정 (파싱 결과가 다르면 종료 코드 1)
+    python python/benchmarks/bench_layouts.py --rounds 20      # 반복 횟수
+"""
+
+import argparse
+import contextlib
+import gzip
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from bench_parser import DEFAULT_FIXTURES, FIXTURE_PADDING_KB, load_fixtures, write_fixtures  # noqa: E402
+from fmkorea_pages import LAYOUTS, NEWEST_SRL, POST_KINDS, post_html  # noqa: E402
+from metrics import disable_metrics  # noqa: E402
+from scraper.parser import detect_layout, parse_post_html  # noqa: E402
+
+DEFAULT_MOBILE_FIXTURES = BENCH_DIR / "fixtures" / "parser_mobile"
+
+
+def write_mobile_fixtures(desktop_dir: Path, mobile_dir: Path) -> int:
+    """
+    데스크톱 합성 픽스처와 같은 게시물의 모바일 페이지 생성 (파일명 <종류>_<srl>.html로 짝을 맞춤)
+
+    Args:
+        desktop_dir: 데스크톱 픽스처 디렉토리
+        mobile_dir: 저장할 디렉토리
+
+    Returns:
+        생성한 파일 수
+    """
+    mobile_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for path in sorted(desktop_dir.glob("*.html")):
+        kind, _, srl = path.stem.rpartition("_")
+        if kind not in POST_KINDS or not srl.isdigit():
+            continue
+        # write_fixtures와 같은 본문 외 마크업 크기 기준 (모바일은 이 중 일부만 사용)
+        index = NEWEST_SRL - POST_KINDS.index(kind) * 100 - int(srl)
+        padding_kb = FIXTURE_PADDING_KB[index % len(FIXTURE_PADDING_KB)]
+        page = post_html(int(srl), kind, padding_kb, layout="mobile")
+        (mobile_dir / path.name).write_text(page, encoding='utf-8')
+        count += 1
+    return count
+
+
+def load_pairs(desktop_dir: Path, mobile_dir: Path) -> list:
+    """파일명이 같은 (이름, 종류, URL, 데스크톱 HTML, 모바일 HTML) 목록"""
+    mobile = {name: page for name, _, _, page in load_fixtures(mobile_dir)}
+    return [
+        (name, kind, url, page, mobile[name])
+        for name, kind, url, page in load_fixtures(desktop_dir)
+        if name in mobile
+    ]
+
+
+def measure_layout(pages: list, rounds: int) -> dict:
+    """
+    레이아웃 하나의 게시물당 전송량과 파싱 시간
+
+    Args:
+        pages: (URL, HTML) 목록
+        rounds: 파싱 반복 횟수 (게시물마다 중앙값 사용)
+
+    Returns:
+        {"bytes_per_post", "gzip_bytes_per_post", "parse_ms_per_post", "detected"}
+    """
+    raw = [len(page.encode('utf-8')) for _, page in pages]
+    compressed = [len(gzip.compress(page.encode('utf-8'))) for _, page in pages]
+    timings = []
+    detected = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        for url, page in pages:
+            samples = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                parse_post_html(page, url)
+                samples.append(time.perf_counter() - start)
+            timings.append(statistics.median(samples))
+    for _, page in pages:
+        layout = detect_layout(BeautifulSoup(page, 'lxml'))
+        detected[layout] = detected.get(layout, 0) + 1
+
+    return {
+        "bytes_per_post": round(statistics.mean(raw)),
+        "gzip_bytes_per_post": round(statistics.mean(compressed)),
+        "parse_ms_per_post": round(statistics.mean(timings) * 1000, 3),
+        "detected": detected,
+    }
+
+
+def compare_records(pairs: list) -> list:
+    """두 레이아웃의 파싱 결과가 다른 픽스처 목록 ([{"name", "fields"}])"""
+    mismatches = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name, _, url, desktop, mobile in pairs:
+            a = parse_post_html(desktop, url)
+            b = parse_post_html(mobile, url)
+            if a is None or b is None:
+                mismatches.append({"name": name, "fields": ["parse"]})
+                continue
+            fields = [key for key in set(a) | set(b) if a.get(key) != b.get(key)]
+            if fields:
+                mismatches.append({"name": name, "fields": sorted(fields)})
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데스크톱 / 모바일 레이아웃 비교 벤치마크")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="데스크톱 게시물 HTML 픽스처 디렉토리")
+    parser.add_argument("--mobile-fixtures", default=str(DEFAULT_MOBILE_FIXTURES), help="모바일 게시물 HTML 픽스처 디렉토리")
+    parser.add_argument("--rounds", type=int, default=10, help="게시물당 파싱 반복 횟수")
+    parser.add_argument("--regenerate", action="store_true", help="합성 픽스처 다시 생성")
+    args = parser.parse_args()
+
+    desktop_dir = Path(args.fixtures)
+    mobile_dir = Path(args.mobile_fixtures)
+    if args.regenerate or not any(desktop_dir.glob("*.html")):
+        created = write_fixtures(desktop_dir)
+        print(f"🧪 데스크톱 합성 픽스처 {created}개 생성: {desktop_dir}", file=sys.stderr)
+    if args.regenerate or not any(mobile_dir.glob("*.html")):
+        created = write_mobile_fixtures(desktop_dir, mobile_dir)
+        print(f"🧪 모바일 합성 픽스처 {created}개 생성: {mobile_dir}", file=sys.stderr)
+
+    pairs = load_pairs(desktop_dir, mobile_dir)
+    if not pairs:
+        print(f"❌ 파일명이 같은 픽스처 쌍이 없습니다: {desktop_dir}, {mobile_dir}", file=sys.stderr)
+        sys.exit(1)
+    print(f"⏱️  픽스처 {len(pairs)}쌍 측정 중...", file=sys.stderr)
+
+    disable_metrics()
+    layouts = {}
+    for index, layout in enumerate(LAYOUTS):
+        layouts[layout] = measure_layout([(pair[2], pair[3 + index]) for pair in pairs], args.rounds)
+
+    per_kind = {}
+    for kind in sorted({pair[1] for pair in pairs}):
+        subset = [pair for pair in pairs if pair[1] == kind]
+        per_kind[kind] = {
+            layout: measure_layout([(pair[2], pair[3 + index]) for pair in subset], args.rounds)
+            for index, layout in enumerate(LAYOUTS)
+        }
+
+    desktop, mobile = layouts["desktop"], layouts["mobile"]
+    report = {
+        "benchmark": "layouts",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pairs": len(pairs),
+        "layouts": layouts,
+        "per_kind": per_kind,
+        "mobile_vs_desktop": {
+            "bytes_ratio": round(mobile["bytes_per_post"] / desktop["bytes_per_post"], 3),
+            "gzip_bytes_ratio": round(mobile["gzip_bytes_per_post"] / desktop["gzip_bytes_per_post"], 3),
+            "parse_time_ratio": round(mobile["parse_ms_per_post"] / desktop["parse_ms_per_post"], 3),
+        },
+        "mismatches": compare_records(pairs),
+    }
+
+    ratios = report["mobile_vs_desktop"]
+    print(f"📦 게시물당 전송량: 데스크톱 {desktop['bytes_per_post'] / 1024:.1f} KB → 모바일 "
+          f"{mobile['bytes_per_post'] / 1024:.1f} KB ({ratios['bytes_ratio']:.0%})", file=sys.stderr)
+    print(f"⏱️  게시물당 파싱 시간: 데스크톱 {desktop['parse_ms_per_post']:.2f} ms → 모바일 "
+          f"{mobile['parse_ms_per_post']:.2f} ms ({ratios['parse_time_ratio']:.0%})", file=sys.stderr)
+
+    exit_code = 0
+    if report["mismatches"]:
+        exit_code = 1
+        print(f"❌ 레이아웃별 파싱 결과 불일치 {len(report['mismatches'])}건", file=sys.stderr)
+    else:
+        print("✅ 두 레이아웃의 파싱 결과 일치", file=sys.stderr)
+
+    print(json.dumps(report, ensure_ascii=False))
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+파서 마이크로 벤치마크 + 처리량 회귀 검사
+저장된 fmkorea 게시물 페이지 디렉토리를 읽어 parse_post_html의 초당 페이지 수, 필드별 추출 시간,
+페이지당 메모리 할당량을 측정하고 저장된 기준값(baseline)과 비교
+
+픽스처 디렉토리가 비어 있으면 fmkorea_pages로 종류별(일반, 장문, 이미지 다수, 댓글 다수) 페이지를 생성
+실제 페이지를 브라우저에서 "다른 이름으로 저장"한 *.html 파일을 넣어도 그대로 측정됨
+본문 content가 예전 get_text 방식과 바이트 단위로 같은지도 픽스처와 인라인 마크업 샘플로 검사 (다르면 종료 코드 1)
+
+사용법:
+    python python/benchmarks/bench_parser.py                     # 측정 후 기준값과 비교 (하락 시 종료 코드 1)
+    python python/benchmarks/bench_parser.py --save-baseline     # 현재 결과를 기준값으로 저장
+    python python/benchmarks/bench_parser.py --tolerance 0.2     # 허용 하락폭 20%
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from fmkorea_pages import NEWEST_SRL, POST_KINDS, post_html  # noqa: E402
+from metrics import disable_metrics, enable_metrics, snapshot  # noqa: E402
+from scraper.parser import PARSER_PROFILES, extract_content, parse_post_html  # noqa: E402
+
+DEFAULT_FIXTURES = BENCH_DIR / "fixtures" / "parser"
+DEFAULT_BASELINE = BENCH_DIR / "baselines" / "parser.json"
+DEFAULT_TOLERANCE = 0.15
+
+# content 호환성 검사용 인라인 마크업 본문 (예전 get_text 방식과 content가 바이트 단위로 같아야 함)
+MARKUP_SAMPLES = (
+    "<p>삼성 <b>전자</b> 좋다</p>",
+    "<p>a<span>b</span>c</p>",
+    "<p>x&nbsp;&nbsp;&nbsp;y &nbsp;</p>",
+    "<p>go <a href=\"https://www.fmkorea.com/1\">here</a> now</p>",
+    "<p><a href=\"https://www.fmkorea.com/2\">링크만 있는 문단</a></p>",
+    "<blockquote><p>인용 <i>강조</i></p><p>둘째 줄</p><img src=\"https://image.fmkorea.com/q.jpg\"></blockquote><p>뒤</p>",
+    "<a href=\"https://empty\"></a><div>줄1<br><br>줄2 <a href=\"u\">링크 <b>굵게</b></a>.</div>",
+    "<script>var x = 1;</script><style>.a {}</style><noscript>ns</noscript><!-- 주석 --><p>본문</p>",
+    "<video>대체 텍스트 <source src=\"https://v.mp4\"></video><iframe src=\"https://www.youtube.com/embed/x\"></iframe>",
+    "<p><a href=\"https://image.fmkorea.com/i.jpg\"><img src=\"https://image.fmkorea.com/i.jpg\"></a> 캡션</p>",
+    "<ul><li>하나 <em>둘</em></li><li>셋</li></ul><table><tr><td>표</td><td><span>칸</span></td></tr></table>",
+)
+
+# 종류별 픽스처 수와 본문 외 마크업 크기 (KB)
+FIXTURES_PER_KIND = 3
+FIXTURE_PADDING_KB = (20, 60, 120)
+
+
+def write_fixtures(fixtures_dir: Path) -> int:
+    """
+    합성 게시물 페이지 픽스처 생성
+
+    Args:
+        fixtures_dir: 저장할 디렉토리
+
+    Returns:
+        생성한 파일 수
+    """
+    fixtures_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for kind_idx, kind in enumerate(POST_KINDS):
+        for i in range(FIXTURES_PER_KIND):
+            srl = NEWEST_SRL - kind_idx * 100 - i
+            padding_kb = FIXTURE_PADDING_KB[i % len(FIXTURE_PADDING_KB)]
+            page = post_html(srl, kind, padding_kb)
+            (fixtures_dir / f"{kind}_{srl}.html").write_text(page, encoding='utf-8')
+            count += 1
+    return count
+
+
+def load_fixtures(fixtures_dir: Path) -> list:
+    """(이름, 종류, URL, HTML) 목록 (종류는 파일명 접두사, 없으면 'saved')"""
+    pages = []
+    for path in sorted(fixtures_dir.glob("*.html")):
+        prefix = path.stem.rsplit("_", 1)[0]
+        kind = prefix if prefix in POST_KINDS else "saved"
+        srl = path.stem.rsplit("_", 1)[-1]
+        url = f"https://www.fmkorea.com/{srl}" if srl.isdigit() else f"https://www.fmkorea.com/{path.stem}"
+        pages.append((path.name, kind, url, path.read_text(encoding='utf-8', errors='replace')))
+    return pages
+
+
+def legacy_content(content_elem) -> str:
+    """예전 파서의 content (get_text + 이미지 URL 목록)"""
+    content = content_elem.get_text(strip=True, separator='\n')
+    image_urls = [img.get('src') for img in content_elem.find_all('img') if img.get('src')]
+    if image_urls:
+        content += "\n\n[이미지]\n" + "\n".join(image_urls)
+    return content
+
+
+def check_content_compat(pages: list) -> dict:
+    """
+    픽스처 본문과 인라인 마크업 샘플에서 extract_content의 content가 예전 방식과 같은지 검사
+
+    Returns:
+        {"checked", "mismatches": [이름, ...]}
+    """
+    from bs4 import BeautifulSoup
+
+    bodies = []
+    for name, _, _, page in pages:
+        soup = BeautifulSoup(page, 'lxml')
+        for profile in PARSER_PROFILES.values():
+            elem = soup.select_one(profile["content"])
+            if elem:
+                bodies.append((name, elem))
+                break
+    for index, sample in enumerate(MARKUP_SAMPLES):
+        soup = BeautifulSoup(f"<div class=\"xe_content\">{sample}</div>", 'lxml')
+        bodies.append((f"markup_{index}", soup.select_one(".xe_content")))
+
+    mismatches = [name for name, elem in bodies if extract_content(elem)[0] != legacy_content(elem)]
+    return {"checked": len(bodies), "mismatches": mismatches}
+
+
+def measure_throughput(pages: list, min_seconds: float) -> dict:
+    """계측을 끈 상태에서 전체 코퍼스를 반복 파싱하여 초당 페이지 수 측정"""
+    disable_metrics()
+    parsed = 0
+    failures = 0
+    per_kind = {}
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        while True:
+            for _, kind, url, page in pages:
+                page_start = time.perf_counter()
+                result = parse_post_html(page, url)
+                stats = per_kind.setdefault(kind, [0, 0.0])
+                stats[0] += 1
+                stats[1] += time.perf_counter() - page_start
+                parsed += 1
+                if result is None or result["title"] == "제목 없음":
+                    failures += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_seconds:
+                break
+
+    return {
+        "pages_parsed": parsed,
+        "elapsed_s": round(elapsed, 3),
+        "pages_per_sec": round(parsed / elapsed, 2),
+        "failures": failures,
+        "per_kind_pages_per_sec": {
+            kind: round(count / seconds, 2) for kind, (count, seconds) in sorted(per_kind.items())
+        },
+    }
+
+
+def measure_fields(pages: list, rounds: int) -> dict:
+    """parse.* 계측 구간으로 필드별 추출 시간 측정"""
+    enable_metrics(snapshot_interval=0)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(rounds):
+            for _, _, url, page in pages:
+                parse_post_html(page, url)
+    stages = snapshot()["stages"]
+    disable_metrics()
+    return {name: stats for name, stats in stages.items() if name.startswith("parse.")}
+
+
+def measure_allocations(pages: list) -> dict:
+    """tracemalloc으로 페이지 한 건 파싱 중 최대 할당량과 파싱 후 남은 할당량 측정"""
+    peaks = []
+    retained = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _, _, url, page in pages:
+            tracemalloc.start()
+            result = parse_post_html(page, url)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            peaks.append(peak)
+            retained.append(current)
+            del result
+
+    return {
+        "peak_kb_per_page_mean": round(sum(peaks) / len(peaks) / 1024, 1),
+        "peak_kb_per_page_max": round(max(peaks) / 1024, 1),
+        "retained_kb_per_page_mean": round(sum(retained) / len(retained) / 1024, 1),
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> dict:
+    """
+    기준값 대비 처리량 비교
+
+    Args:
+        report: 이번 측정 결과
+        baseline: 저장된 기준 결과
+        tolerance: 허용 하락 비율 (0.15 = 15%)
+
+    Returns:
+        {"baseline_pages_per_sec", "ratio", "regressed", "kinds": {...}}
+    """
+    base = baseline["throughput"]["pages_per_sec"]
+    current = report["throughput"]["pages_per_sec"]
+    kinds = {}
+    for kind, value in report["throughput"]["per_kind_pages_per_sec"].items():
+        base_kind = baseline["throughput"]["per_kind_pages_per_sec"].get(kind)
+        if base_kind:
+            kinds[kind] = round(value / base_kind, 3)
+    ratio = current / base if base else 1.0
+    return {
+        "baseline_pages_per_sec": base,
+        "ratio": round(ratio, 3),
+        "kinds": kinds,
+        "tolerance": tolerance,
+        "regressed": ratio < 1.0 - tolerance,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파서 마이크로 벤치마크")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="게시물 HTML 픽스처 디렉토리")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="기준값 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="허용 처리량 하락 비율")
+    parser.add_argument("--min-seconds", type=float, default=3.0, help="처리량 측정 최소 시간")
+    parser.add_argument("--field-rounds", type=int, default=3, help="필드별 측정 반복 횟수")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값으로 저장")
+    parser.add_argument("--regenerate", action="store_true", help="합성 픽스처 다시 생성")
+    args = parser.parse_args()
+
+    fixtures_dir = Path(args.fixtures)
+    if args.regenerate or not any(fixtures_dir.glob("*.html")):
+        created = write_fixtures(fixtures_dir)
+        print(f"🧪 합성 픽스처 {created}개 생성: {fixtures_dir}", file=sys.stderr)
+
+    pages = load_fixtures(fixtures_dir)
+    corpus_bytes = sum(len(page.encode('utf-8')) for *_, page in pages)
+    print(f"⏱️  픽스처 {len(pages)}개 ({corpus_bytes / 1024:.0f} KB) 측정 중...", file=sys.stderr)
+
+    report = {
+        "benchmark": "parser",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "fixtures": len(pages),
+        "corpus_kb": round(corpus_bytes / 1024, 1),
+        "throughput": measure_throughput(pages, args.min_seconds),
+        "fields": measure_fields(pages, args.field_rounds),
+        "allocations": measure_allocations(pages),
+        "content_compat": check_content_compat(pages),
+    }
+
+    baseline_path = Path(args.baseline)
+    exit_code = 0
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"📁 기준값 저장: {baseline_path}", file=sys.stderr)
+    elif baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding='utf-8'))
+        report["comparison"] = compare(report, baseline, args.tolerance)
+        if report["comparison"]["regressed"]:
+            exit_code = 1
+            print(f"❌ 처리량 하락: 기준값 대비 {report['comparison']['ratio']:.0%} "
+                  f"(허용 {1 - args.tolerance:.0%} 이상)", file=sys.stderr)
+        else:
+            print(f"✅ 기준값 대비 {report['comparison']['ratio']:.0%}", file=sys.stderr)
+    else:
+        print(f"⚠️  기준값 없음 ({baseline_path}) - --save-baseline으로 저장하세요", file=sys.stderr)
+
+    if report["content_compat"]["mismatches"]:
+        exit_code = 1
+        print(f"❌ content가 예전 형식과 다름: {', '.join(report['content_compat']['mismatches'])}", file=sys.stderr)
+
+    if report["throughput"]["failures"]:
+        exit_code = 1
+        print(f"❌ 파싱 실패 {report['throughput']['failures']}건", file=sys.stderr)
+
+    print(json.dumps(report, ensure_ascii=False))
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+main.py 콜드 스타트 벤치마크 + import 시간 보고서
+1) 프로세스 시작부터 Tauri가 받는 첫 이벤트(stdout 첫 줄)까지 걸린 시간을 측정하여 목표값과 비교
+2) 모드별 코드 경로가 불러오는 모듈을 `python -X importtime`으로 수집하여 무거운 모듈이 섞이지 않았는지 검사
+
+목표값:
+    첫 이벤트까지 중앙값 FIRST_EVENT_TARGET_MS 이하 (인터프리터 시작 시간 포함)
+    각 경로에서 IMPORT_PATHS의 forbidden 모듈이 로딩되지 않을 것
+
+사용법:
+    python python/benchmarks/bench_startup.py                  # 측정 + 목표 검사 (실패 시 종료 코드 1)
+    python python/benchmarks/bench_startup.py --importtime     # 경로별 누적 import 시간 상위 목록 출력
+    python python/benchmarks/bench_startup.py --importtime collect --top 40
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+PYTHON_DIR = BENCH_DIR.parent
+MAIN_SCRIPT = PYTHON_DIR / "main.py"
+
+# 첫 이벤트 목표 (ms) - 인터프리터 시작 + main.py 로딩 + 첫 줄 출력
+FIRST_EVENT_TARGET_MS = 150
+
+# 코드 경로별 실행 코드와 로딩되면 안 되는 모듈
+HEAVY_MODULES = ("playwright", "bs4", "lxml")
+IMPORT_PATHS = {
+    "startup": {
+        "code": "import main",
+        "forbidden": HEAVY_MODULES + ("asyncio", "exporter", "index", "scraper", "sqlite3"),
+    },
+    "export": {
+        "code": "import main; from exporter import export_to_notebooklm, create_analysis_guide",
+        "forbidden": HEAVY_MODULES + ("exporter.formats", "exporter.records", "csv", "index"),
+    },
+    "export_formats": {
+        "code": "import main; from exporter import export_formats",
+        "forbidden": HEAVY_MODULES + ("index",),
+    },
+    "search": {
+        "code": "import main; from index import SearchIndex",
+        "forbidden": HEAVY_MODULES + ("index.mentions", "exporter.formats"),
+    },
+    "parser": {
+        "code": "from scraper import parse_post_html",
+        "forbidden": ("playwright",),
+    },
+    "collect": {
+        "code": "import main; from scraper import collect_posts; from index import SearchIndex, MentionIndex",
+        "forbidden": ("exporter.formats", "exporter.records"),
+    },
+}
+
+
+def parse_importtime(stderr: str) -> list:
+    """-X importtime 출력 → [(모듈, 자체 µs, 누적 µs, 깊이)]"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        # 모듈 이름 앞 공백 1칸 + 깊이당 2칸
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def import_report(path_name: str) -> dict:
+    """
+    코드 경로 하나를 새 인터프리터에서 실행하여 import 목록과 금지 모듈 로딩 여부 확인
+
+    Args:
+        path_name: IMPORT_PATHS 키
+
+    Returns:
+        {"path", "total_ms", "modules", "forbidden_loaded", "rows"}
+    """
+    spec = IMPORT_PATHS[path_name]
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", spec["code"]],
+        cwd=str(PYTHON_DIR),
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{path_name} 경로 실행 실패: {proc.stderr.strip().splitlines()[-1:]}")
+
+    rows = parse_importtime(proc.stderr)
+    loaded = {name for name, *_ in rows}
+    forbidden_loaded = [
+        mod for mod in spec["forbidden"]
+        if any(name == mod or name.startswith(mod + ".") for name in loaded)
+    ]
+    # 최상위(깊이 0) 모듈의 누적 시간 합 = 이 경로의 전체 import 시간
+    total_us = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+    return {
+        "path": path_name,
+        "total_ms": round(total_us / 1000, 1),
+        "modules": len(rows),
+        "forbidden_loaded": forbidden_loaded,
+        "rows": rows,
+    }
+
+
+def first_event_ms(runs: int) -> list:
+    """main.py를 인자 없이 실행하여 stdout 첫 줄이 나올 때까지 걸린 시간 (ms) 목록"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            [sys.executable, str(MAIN_SCRIPT)],
+            cwd=str(PYTHON_DIR),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        line = proc.stdout.readline()
+        elapsed = (time.perf_counter() - start) * 1000
+        proc.stdout.close()
+        proc.wait()
+        if not line:
+            raise RuntimeError("main.py가 아무것도 출력하지 않았습니다")
+        timings.append(elapsed)
+    return timings
+
+
+def interpreter_ms(runs: int) -> float:
+    """빈 인터프리터 시작 시간 중앙값 (ms) - 첫 이벤트 시간 중 줄일 수 없는 부분"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def print_import_tree(report: dict, top: int):
+    """누적 시간 상위 모듈 출력"""
+    print(f"📦 {report['path']}: 모듈 {report['modules']}개, 전체 {report['total_ms']} ms")
+    print(f"{'누적 ms':>9} {'자체 ms':>8}  모듈")
+    for name, self_us, cumulative_us, depth in sorted(report["rows"], key=lambda r: -r[2])[:top]:
+        print(f"{cumulative_us / 1000:9.1f} {self_us / 1000:8.1f}  {'  ' * depth}{name}")
+    if report["forbidden_loaded"]:
+        print(f"❌ 로딩되면 안 되는 모듈: {', '.join(report['forbidden_loaded'])}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="main.py 콜드 스타트 벤치마크")
+    parser.add_argument("--runs", type=int, default=15, help="첫 이벤트 측정 반복 횟수")
+    parser.add_argument("--target-ms", type=float, default=FIRST_EVENT_TARGET_MS, help="첫 이벤트 목표 (ms)")
+    parser.add_argument("--importtime", nargs="*", metavar="PATH",
+                        help=f"import 시간 보고서 출력 (경로: {', '.join(IMPORT_PATHS)}; 생략 시 전체)")
+    parser.add_argument("--top", type=int, default=25, help="보고서에 표시할 모듈 수")
+    args = parser.parse_args()
+
+    if args.importtime is not None:
+        for path_name in args.importtime or IMPORT_PATHS:
+            print_import_tree(import_report(path_name), args.top)
+        return
+
+    timings = first_event_ms(args.runs)
+    median = statistics.median(timings)
+    paths = [import_report(name) for name in IMPORT_PATHS]
+
+    report = {
+        "benchmark": "startup",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "interpreter_ms": round(interpreter_ms(args.runs), 1),
+        "first_event_ms": {
+            "median": round(median, 1),
+            "min": round(min(timings), 1),
+            "max": round(max(timings), 1),
+            "target": args.target_ms,
+        },
+        "import_paths": {
+            p["path"]: {"total_ms": p["total_ms"], "modules": p["modules"], "forbidden_loaded": p["forbidden_loaded"]}
+            for p in paths
+        },
+    }
+
+    failures = []
+    if median > args.target_ms:
+        failures.append(f"첫 이벤트 {median:.0f} ms > 목표 {args.target_ms:.0f} ms")
+    for p in paths:
+        if p["forbidden_loaded"]:
+            failures.append(f"{p['path']} 경로에서 {', '.join(p['forbidden_loaded'])} 로딩")
+
+    print(json.dumps(report, ensure_ascii=False))
+    for failure in failures:
+        print(f"❌ {failure}", file=sys.stderr)
+    if not failures:
+        print(f"✅ 첫 이벤트 {median:.0f} ms (목표 {args.target_ms:.0f} ms), 모든 경로 통과", file=sys.stderr)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+합성 게시물 코퍼스 생성기
+현재 JSON 스키마(data/raw/post_*.json)의 게시물을 원하는 규모(1k, 100k, 1M ...)로 생성
+저장 형식은 CORPUS_FORMATS 레지스트리로 확장 가능 (새 저장 형식이 생기면 @register_corpus_format으로 추가)
+
+사용법:
+    python python/benchmarks/corpus.py <규모> <출력 디렉토리> [형식]
+    python python/benchmarks/corpus.py 100k /tmp/corpus_100k raw
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterator
+
+NEWEST_SRL = 8_000_000_000
+
+# 생성 완료 표시 파일 (중단된 생성물을 재사용하지 않기 위함)
+COMPLETE_MARKER = ".complete"
+
+CORPUS_FORMATS: Dict[str, Callable] = {}
+
+
+def register_corpus_format(name: str):
+    """
+    코퍼스 저장 형식 등록 데코레이터
+
+    Args:
+        name: 형식 이름 (CLI와 ensure_corpus에서 사용)
+    """
+    def decorator(func):
+        CORPUS_FORMATS[name] = func
+        return func
+    return decorator
+
+
+def parse_size(text: str) -> int:
+    """'1k', '100k', '1m', '2500' → 게시물 수"""
+    text = text.strip().lower()
+    multiplier = {"k": 1_000, "m": 1_000_000}.get(text[-1:], 1)
+    number = text[:-1] if multiplier > 1 else text
+    return int(float(number) * multiplier)
+
+
+def make_post(idx: int, rng: random.Random) -> dict:
+    """현재 JSON 스키마의 합성 게시물 한 건"""
+    srl = NEWEST_SRL + idx
+    paragraphs = [
+        " ".join(rng.choice(("삼성전자", "하이닉스", "매수", "손절", "배당", "실적", "금리", "반도체", "ETF", "환율"))
+                 for _ in range(rng.randint(8, 40)))
+        for _ in range(rng.randint(1, 12))
+    ]
+    return {
+        "url": f"https://www.fmkorea.com/{srl}",
+        "title": f"합성 게시물 {idx} - {rng.choice(('시황', '종목 분석', '매매 일지', '잡담'))}",
+        "content": "\n".join(paragraphs),
+        "date": f"2026.01.{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}",
+        "views": rng.randint(0, 50_000),
+        "metadata": {
+            "author": "벤치마크",
+            "comments": rng.randint(0, 300),
+            "votes": rng.randint(0, 500),
+        },
+    }
+
+
+def synthetic_posts(count: int, seed: int = 42) -> Iterator[tuple]:
+    """
+    (파일 순번, 게시물) 생성기
+
+    파일명 순서와 document_srl 순서가 다르도록 섞어서 정렬 비용도 측정에 포함되게 함
+    """
+    rng = random.Random(seed)
+    order = list(range(count))
+    rng.shuffle(order)
+    for name_idx, idx in enumerate(order):
+        yield name_idx, make_post(idx, rng)
+
+
+@register_corpus_format("raw")
+def write_raw(data_dir: Path, posts: Iterator[tuple]) -> int:
+    """수집기가 저장하는 것과 같은 post_*.json 파일 (게시물당 파일 1개)"""
+    count = 0
+    for name_idx, post in posts:
+        with open(data_dir / f"post_{name_idx:08x}.json", 'w', encoding='utf-8') as f:
+            json.dump(post, f, ensure_ascii=False, indent=2)
+        count += 1
+    return count
+
+
+def write_corpus(data_dir: Path, count: int, seed: int = 42, fmt: str = "raw") -> int:
+    """
+    data_dir에 합성 코퍼스 생성
+
+    Args:
+        data_dir: 출력 디렉토리
+        count: 게시물 수
+        seed: 난수 시드 (같은 시드 → 같은 코퍼스)
+        fmt: 저장 형식 (CORPUS_FORMATS 참고)
+
+    Returns:
+        생성한 게시물 수
+    """
+    if fmt not in CORPUS_FORMATS:
+        raise ValueError(f"알 수 없는 코퍼스 형식: {fmt} (지원: {', '.join(CORPUS_FORMATS)})")
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return CORPUS_FORMATS[fmt](data_dir, synthetic_posts(count, seed))
+
+
+def ensure_corpus(root: Path, count: int, seed: int = 42, fmt: str = "raw") -> Path:
+    """
+    root/<형식>_<수>_<시드>에 코퍼스가 완성되어 있으면 재사용, 없으면 생성
+
+    Returns:
+        코퍼스 디렉토리
+    """
+    data_dir = root / f"{fmt}_{count}_{seed}"
+    marker = data_dir / COMPLETE_MARKER
+    if marker.exists():
+        return data_dir
+
+    if data_dir.exists():
+        for path in data_dir.iterdir():
+            if path.is_file():
+                path.unlink()
+    print(f"🧪 합성 코퍼스 생성 중: {count:,}개 ({fmt}) → {data_dir}", file=sys.stderr)
+    write_corpus(data_dir, count, seed, fmt)
+    marker.write_text(json.dumps({"count": count, "seed": seed, "format": fmt}), encoding='utf-8')
+    return data_dir
+
+
+def corpus_bytes(data_dir: Path) -> int:
+    """코퍼스 디렉토리의 전체 크기 (표시 파일 제외)"""
+    return sum(path.stat().st_size for path in data_dir.iterdir()
+               if path.is_file() and path.name != COMPLETE_MARKER)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("사용법: python corpus.py <규모(예: 1k, 100k, 1m)> <출력 디렉토리> [형식]")
+        print(f"   형식: {', '.join(CORPUS_FORMATS)} (기본: raw)")
+        sys.exit(1)
+
+    size = parse_size(sys.argv[1])
+    out_dir = Path(sys.argv[2])
+    fmt = sys.argv[3] if len(sys.argv) > 3 else "raw"
+    written = write_corpus(out_dir, size, fmt=fmt)
+    print(f"✅ {written:,}개 게시물 생성: {out_dir}")
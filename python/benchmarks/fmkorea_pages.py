@@ -0,0 +1,182 @@
+"""
+합성 fmkorea 페이지 생성기
+벤치마크용 대역 서버와 파서 픽스처가 공유하는 검색 결과 / 게시물 / 챌린지 페이지 마크업
+(수집기와 파서가 사용하는 선택자: a.hx, h1.np_18px, .xe_content, span.date.m_no,
+ .rd_hd .side.fr, a.member_plate, a.vote_label / 모바일: .rd_hd .meta의 span.date, .m_views, .m_votes, .m_comments)
+"""
+
+import html
+import random
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+KST = timezone(timedelta(hours=9))
+
+# 게시물 srl은 최신 글일수록 큼
+NEWEST_SRL = 8_000_000_000
+
+_WORDS = (
+    "삼성전자", "하이닉스", "매수", "손절", "익절", "배당", "실적", "금리", "반도체", "ETF",
+    "환율", "코스피", "나스닥", "물타기", "존버", "분할매수", "PER", "PBR", "시총", "공매도",
+)
+
+POST_KINDS = ("normal", "long_text", "image_heavy", "many_comments")
+
+LAYOUTS = ("desktop", "mobile")
+
+# 모바일 페이지의 본문 외 마크업 비율 (헤더 + 광고 한두 개, 사이드바 없음)
+MOBILE_PADDING_RATIO = 0.15
+
+
+def _paragraph(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _chrome(rng: random.Random, padding_kb: int) -> str:
+    """실제 데스크톱 페이지의 헤더/사이드바/광고 영역을 흉내 낸 부피"""
+    blocks = []
+    size = 0
+    while size < padding_kb * 1024:
+        block = (
+            f"<div class=\"ad_wrap\"><script>window.__ad_{rng.randint(0, 10**9)} = "
+            f"{{slot: '{rng.randint(0, 10**6)}', sizes: [[300, 250], [728, 90]]}};</script>"
+            f"<ul class=\"side_menu\">{''.join(f'<li><a href=/best/{i}>{_paragraph(rng, 3)}</a></li>' for i in range(8))}</ul></div>"
+        )
+        blocks.append(block)
+        size += len(block.encode('utf-8'))
+    return "\n".join(blocks)
+
+
+def post_date(index: int, now: datetime, step_hours: float = 7.0) -> datetime:
+    """index번째(0 = 최신) 게시물의 작성 시각"""
+    return now - timedelta(hours=index * step_hours)
+
+
+def post_html(srl: int, kind: str = "normal", padding_kb: int = 60,
+              written_at: datetime = None, member_id: str = "3902132645", layout: str = "desktop") -> str:
+    """
+    게시물 상세 페이지
+
+    Args:
+        srl: document_srl
+        kind: normal / long_text / image_heavy / many_comments
+        padding_kb: 본문 외 헤더/사이드바/광고 마크업 크기 (데스크톱 기준)
+        written_at: 작성 시각 (기본: srl로부터 결정)
+        member_id: 작성자 회원번호
+        layout: desktop (www.fmkorea.com) / mobile (m.fmkorea.com) - 같은 srl이면 본문과 수치가 같음
+    """
+    rng = random.Random(srl)
+    if written_at is None:
+        written_at = post_date(NEWEST_SRL - srl, datetime(2026, 1, 6, 0, 0, tzinfo=KST))
+
+    paragraphs = {"normal": 6, "long_text": 120, "image_heavy": 4, "many_comments": 6}[kind]
+    images = {"normal": 1, "long_text": 0, "image_heavy": 40, "many_comments": 1}[kind]
+    comments = {"normal": 10, "long_text": 5, "image_heavy": 10, "many_comments": 400}[kind]
+
+    body = "".join(f"<p>{html.escape(_paragraph(rng, rng.randint(10, 40)))}</p>" for _ in range(paragraphs))
+    body += "".join(
+        f"<p><img src=\"https://image.fmkorea.com/files/attach/new4/{srl}_{i}.jpg\" "
+        f"alt=\"image\" style=\"width:100%\"></p>"
+        for i in range(images)
+    )
+    comment_items = "".join(
+        f"<li class=\"fdb_itm clear\"><div class=\"meta\"><a class=\"member_plate\" href=\"#\">댓글러{i}</a>"
+        f"<span class=\"date\">{written_at.strftime('%m.%d %H:%M')}</span></div>"
+        f"<div class=\"comment-content\"><div class=\"xe_content_comment\">{html.escape(_paragraph(rng, 12))}</div></div></li>"
+        for i in range(comments)
+    )
+    views = rng.randint(100, 90_000)
+    votes = rng.randint(0, 300)
+    title = html.escape(f"{_paragraph(rng, 3)} ({srl})")
+
+    if layout == "mobile":
+        return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title} - 주식 - 에펨코리아</title><link rel="stylesheet" href="/static/css/mobile.css"></head>
+<body class="m_body"><div id="m_header">{_chrome(random.Random(-srl), int(padding_kb * MOBILE_PADDING_RATIO))}</div>
+<div class="bd_wrp"><div class="rd clear">
+<div class="rd_hd clear"><h1 class="np_18px"><span class="np_18px_span">{title}</span></h1>
+<div class="meta"><a href="#popup_menu_area" class="member_plate member_{member_id}">작성자닉네임</a>
+<span class="date">{written_at.strftime('%Y.%m.%d %H:%M')}</span><span class="m_views">조회 <b>{views:,}</b></span>
+<span class="m_votes">추천 <b>{votes}</b></span><span class="m_comments">댓글 <b>{comments}</b></span></div></div>
+<div class="rd_body clear"><article><div class="document_{srl}_{member_id} xe_content">{body}</div></article></div>
+<div class="fdb_lst_wrp"><ul class="fdb_lst_ul">{comment_items}</ul></div>
+</div></div></body></html>"""
+
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>{title} - 주식 - 에펨코리아</title>
+<link rel="stylesheet" href="/static/css/site.css"><script src="/static/js/site.js"></script></head>
+<body><div id="header">{_chrome(rng, padding_kb // 2)}</div>
+<div class="bd_wrp"><div class="rd rd_nav_style2 clear">
+<div class="rd_hd clear"><div class="board clear"><div class="top_area ngeb">
+<h1 class="np_18px"><span class="np_18px_span">{title}</span></h1>
+<span class="date m_no">{written_at.strftime('%Y.%m.%d %H:%M')}</span></div>
+<div class="btm_area clear"><div class="side"><a href="#popup_menu_area" class="member_plate member_{member_id}">작성자닉네임</a></div>
+<div class="side fr"><span>조회 수 <b>{views:,}</b></span><span>추천 수 <b>{votes}</b></span><span>댓글 <b>{comments}</b></span></div>
+</div></div></div>
+<div class="rd_body clear"><article><div class="document_{srl}_{member_id} xe_content">{body}</div></article></div>
+<div class="rd_vote"><a class="vote_label" href="#">추천 {votes}</a></div>
+<div class="fdb_lst_wrp"><ul class="fdb_lst_ul">{comment_items}</ul></div>
+</div></div>
+<div id="sidebar">{_chrome(rng, padding_kb // 2)}</div></body></html>"""
+
+
+def relative_date_text(written_at: datetime, now: datetime) -> str:
+    """검색 목록에 표시되는 작성일 (하루 이내는 상대 시간, 이후는 YYYY.MM.DD)"""
+    delta = now - written_at
+    if delta < timedelta(hours=1):
+        return f"{max(1, int(delta.total_seconds() // 60))}분 전"
+    if delta < timedelta(days=1):
+        return f"{int(delta.total_seconds() // 3600)}시간 전"
+    return written_at.strftime('%Y.%m.%d')
+
+
+def search_html(member_id: str, page: int, srls: List[int], total_pages: int,
+                now: datetime, dates: List[datetime], padding_kb: int = 40, layout: str = "desktop") -> str:
+    """
+    회원 검색 결과 페이지
+
+    Args:
+        member_id: 회원번호
+        page: 페이지 번호
+        srls: 이 페이지에 표시할 document_srl (비어 있으면 결과 없음)
+        total_pages: 전체 페이지 수 (페이지네이션 링크용)
+        now: 기준 시각 (상대 시간 표기용)
+        dates: srls별 작성 시각
+        padding_kb: 헤더/사이드바 마크업 크기 (데스크톱 기준)
+        layout: desktop / mobile (모바일은 같은 목록에 헤더만 가볍게)
+    """
+    rng = random.Random(page * 7919 + int(member_id) % 1000)
+    if layout == "mobile":
+        padding_kb = int(padding_kb * MOBILE_PADDING_RATIO)
+    rows = "".join(
+        f"<li><dl><dt><a class=\"hx\" href=\"/{srl}\">{html.escape(_paragraph(rng, 4))}</a>"
+        f" <a class=\"replyNum\" href=\"/board/{srl}#comment\">[{rng.randint(0, 99)}]</a></dt>"
+        f"<dd>{html.escape(_paragraph(rng, 15))}</dd>"
+        f"<address><strong>작성자닉네임</strong> <span class=\"time\">{relative_date_text(written_at, now)}</span>"
+        f" <span class=\"readNum\">조회 {rng.randint(100, 90_000)}</span></address></dl></li>"
+        for srl, written_at in zip(srls, dates)
+    )
+    current = ' class="this"'
+    pagination = "".join(
+        f"<a href=\"/search.php?mid=stock&search_target=member_srl&search_keyword={member_id}&page={p}\""
+        f"{current if p == page else ''}>{p}</a>"
+        for p in range(1, total_pages + 1)
+    )
+    return f"""<!DOCTYPE html>
+<html lang="ko"><head><meta charset="utf-8"><title>검색 - 에펨코리아</title></head>
+<body><div id="header">{_chrome(rng, padding_kb)}</div>
+<div class="search_result"><ul class="searchResult">{rows}</ul>
+<div class="pagination">{pagination}</div></div></body></html>"""
+
+
+def challenge_html(turnstile_src: str) -> str:
+    """Cloudflare 챌린지 대기 페이지 (handle_cloudflare_challenge가 감지하는 iframe 포함)"""
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Just a moment...</title></head>
+<body><div class="main-wrapper"><h1>www.fmkorea.com</h1><p>Verify you are human by completing the action below.</p>
+<iframe src="{turnstile_src}" width="300" height="65"></iframe></div></body></html>"""
+
+
+TURNSTILE_HTML = """<!DOCTYPE html>
+<html><body><label><input type="checkbox"> Verify you are human</label></body></html>"""
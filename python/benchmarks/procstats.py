@@ -0,0 +1,136 @@
+"""
+벤치마크 공용 프로세스 측정 도구
+하위 프로세스를 실행하면서 프로세스 트리(Chromium 등 자식 포함)의 최대 RSS와 CPU 시간을 샘플링
+"""
+
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def tree_rss(pid: int) -> int:
+    """프로세스와 모든 하위 프로세스의 RSS 합계 (바이트, 측정 불가 시 0)"""
+    if psutil:
+        try:
+            proc = psutil.Process(pid)
+            procs = [proc, *proc.children(recursive=True)]
+            return sum(p.memory_info().rss for p in procs if p.is_running())
+        except psutil.Error:
+            return 0
+
+    proc_root = Path("/proc")
+    if not proc_root.exists():
+        return 0
+    total = 0
+    stack = [pid]
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    while stack:
+        current = stack.pop()
+        try:
+            total += int((proc_root / str(current) / "statm").read_text().split()[1]) * page_size
+            for task in (proc_root / str(current) / "task").iterdir():
+                children = (task / "children").read_text().split()
+                stack.extend(int(child) for child in children)
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+def tree_cpu(pid: int) -> Dict[int, float]:
+    """프로세스와 모든 하위 프로세스의 누적 CPU 시간 (PID → user + system 초, 측정 불가 시 빈 딕셔너리)"""
+    if psutil:
+        try:
+            proc = psutil.Process(pid)
+            procs = [proc, *proc.children(recursive=True)]
+        except psutil.Error:
+            return {}
+        times = {}
+        for p in procs:
+            try:
+                cpu = p.cpu_times()
+                times[p.pid] = cpu.user + cpu.system
+            except psutil.Error:
+                continue
+        return times
+
+    proc_root = Path("/proc")
+    if not proc_root.exists():
+        return {}
+    ticks = os.sysconf("SC_CLK_TCK")
+    times = {}
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            # comm에 공백이 있을 수 있으므로 마지막 ')' 뒤에서 utime(14), stime(15) 필드를 읽음
+            fields = (proc_root / str(current) / "stat").read_text().rsplit(")", 1)[1].split()
+            times[current] = (int(fields[11]) + int(fields[12])) / ticks
+            for task in (proc_root / str(current) / "task").iterdir():
+                stack.extend(int(child) for child in (task / "children").read_text().split())
+        except (OSError, ValueError, IndexError):
+            continue
+    return times
+
+
+def run_measured(cmd: List[str], timeout: Optional[float] = None, interval: float = 0.2) -> dict:
+    """
+    명령을 실행하며 최대 RSS와 실행 시간 측정
+
+    Args:
+        cmd: 실행할 명령
+        timeout: 제한 시간 (초, 초과 시 종료하고 timed_out=True)
+        interval: RSS 샘플링 간격 (초)
+
+    Returns:
+        {"returncode", "elapsed_s", "peak_rss_mb", "cpu_s", "timed_out", "error"}
+        (cpu_s는 샘플링 시점까지 관측한 프로세스별 누적 CPU 시간의 합 - 샘플 사이에 끝난 자식은 일부 누락)
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    peak = 0
+    cpu: Dict[int, float] = {}
+    stop = threading.Event()
+
+    def sample():
+        nonlocal peak
+        while not stop.is_set():
+            peak = max(peak, tree_rss(proc.pid))
+            for pid, seconds in tree_cpu(proc.pid).items():
+                cpu[pid] = max(cpu.get(pid, 0.0), seconds)
+            stop.wait(interval)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    timed_out = False
+    try:
+        _, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        _, stderr = proc.communicate()
+        timed_out = True
+    elapsed = time.perf_counter() - start
+    stop.set()
+    sampler.join()
+
+    error = None
+    if proc.returncode != 0:
+        lines = stderr.decode('utf-8', 'replace').strip().splitlines()
+        errors = [line for line in lines if "Error" in line]
+        error = "timeout" if timed_out else (errors or lines or ["unknown"])[-1].strip()
+
+    return {
+        "returncode": proc.returncode,
+        "elapsed_s": round(elapsed, 3),
+        "peak_rss_mb": round(peak / 1024 / 1024, 1) if peak else None,
+        "cpu_s": round(sum(cpu.values()), 2) if cpu else None,
+        "timed_out": timed_out,
+        "error": error,
+    }
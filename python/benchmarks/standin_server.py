@@ -0,0 +1,178 @@
+"""
+로컬 fmkorea 대역 HTTP 서버
+합성 검색 결과 페이지와 게시물 페이지를 제공하며 지연 시간, 페이지 크기, 에러/챌린지 주입을 설정 가능
+
+단독 실행:
+    python python/benchmarks/standin_server.py [포트]
+"""
+
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fmkorea_pages import (  # noqa: E402
+    KST, NEWEST_SRL, POST_KINDS, TURNSTILE_HTML, challenge_html, post_date, post_html, search_html,
+)
+
+
+@dataclass
+class ServerConfig:
+    """대역 서버 설정"""
+    latency_ms: float = 50.0        # 응답마다 추가되는 지연
+    jitter_ms: float = 20.0         # 지연의 무작위 편차 (±)
+    padding_kb: int = 60            # 게시물 페이지의 본문 외 마크업 크기
+    posts_per_page: int = 20        # 검색 결과 페이지당 게시물 수
+    total_posts: int = 100          # 회원의 전체 게시물 수
+    error_rate: float = 0.0         # 게시물 요청 중 HTTP 500 비율
+    challenge_rate: float = 0.0     # 게시물 요청 중 Cloudflare 챌린지 페이지 비율
+    seed: int = 42
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, -(-self.total_posts // self.posts_per_page))
+
+
+class StandInServer:
+    """백그라운드 스레드에서 동작하는 대역 서버"""
+
+    def __init__(self, config: ServerConfig = None, port: int = 0):
+        self.config = config or ServerConfig()
+        self.now = datetime(2026, 1, 6, 0, 0, tzinfo=KST)
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "bytes": 0, "errors": 0, "challenges": 0}
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def post_urls(self, count: int = None) -> list:
+        """직접 URL 모드용 게시물 URL 목록 (최신순)"""
+        count = self.config.total_posts if count is None else count
+        return [f"{self.base_url}/{NEWEST_SRL - i}" for i in range(count)]
+
+    def _roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < rate
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status: int, body: str, content_type: str = "text/html; charset=utf-8", headers: dict = None):
+                config = server.config
+                delay = config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)
+                if delay > 0:
+                    time.sleep(delay / 1000)
+                data = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+                with server._lock:
+                    server.stats["requests"] += 1
+                    server.stats["bytes"] += len(data)
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                path = parsed.path.strip("/")
+                config = server.config
+                # 실제 사이트처럼 모바일 기기 User-Agent에는 모바일 레이아웃 제공
+                layout = "mobile" if "Mobile" in self.headers.get("User-Agent", "") else "desktop"
+
+                if path == "search.php":
+                    query = parse_qs(parsed.query)
+                    member_id = query.get("search_keyword", ["0"])[0]
+                    page = int(query.get("page", ["1"])[0])
+                    first = (page - 1) * config.posts_per_page
+                    last = min(config.total_posts, first + config.posts_per_page)
+                    indexes = list(range(first, last))
+                    self._send(200, search_html(
+                        member_id, page,
+                        [NEWEST_SRL - i for i in indexes],
+                        config.total_pages,
+                        server.now,
+                        [post_date(i, server.now) for i in indexes],
+                        layout=layout,
+                    ))
+                elif path == "challenge/turnstile":
+                    self._send(200, TURNSTILE_HTML)
+                elif path.isdigit():
+                    srl = int(path)
+                    if server._roll(config.error_rate):
+                        with server._lock:
+                            server.stats["errors"] += 1
+                        self._send(500, "<html><body>500 Internal Server Error</body></html>")
+                    elif server._roll(config.challenge_rate):
+                        with server._lock:
+                            server.stats["challenges"] += 1
+                        self._send(403, challenge_html(f"{server.base_url}/challenge/turnstile"))
+                    else:
+                        index = NEWEST_SRL - srl
+                        kind = POST_KINDS[srl % len(POST_KINDS)]
+                        self._send(200, post_html(
+                            srl, kind, config.padding_kb, post_date(index, server.now), layout=layout
+                        ))
+                elif path.startswith("static/"):
+                    content_type = "text/css" if path.endswith(".css") else "application/javascript"
+                    # 실제 CDN처럼 캐시 검증 헤더를 붙이고 조건부 요청에는 304
+                    cache_headers = {"Cache-Control": "max-age=3600", "ETag": f'"{path}-v1"'}
+                    if self.headers.get("If-None-Match") == cache_headers["ETag"]:
+                        self._send(304, "", content_type, cache_headers)
+                    else:
+                        self._send(200, "/* static */\n" + "x" * 50_000, content_type, cache_headers)
+                else:
+                    self._send(404, "<html><body>404</body></html>")
+
+        return Handler
+
+    def describe(self) -> dict:
+        return {"base_url": self.base_url, **asdict(self.config)}
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    with StandInServer(port=port) as server:
+        print(f"🧪 fmkorea 대역 서버 실행 중: {server.base_url}")
+        print(f"   검색: {server.base_url}/search.php?mid=stock&search_target=member_srl&search_keyword=1&page=1")
+        print(f"   게시물: {server.post_urls(1)[0]}")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
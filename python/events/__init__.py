@@ -0,0 +1,23 @@
+"""Python → UI 이벤트 프로토콜 (RS 프레이밍 JSON, 진행률 병합)"""
+
+from .protocol import (
+    PROTOCOL_VERSION,
+    RECORD_SEPARATOR,
+    EVENT_TYPES,
+    EventWriter,
+    decode_event,
+    emit_event,
+    emit_progress,
+    flush_events,
+)
+
+__all__ = [
+    'PROTOCOL_VERSION',
+    'RECORD_SEPARATOR',
+    'EVENT_TYPES',
+    'EventWriter',
+    'decode_event',
+    'emit_event',
+    'emit_progress',
+    'flush_events',
+]
@@ -0,0 +1,132 @@
+"""
+Python → UI 이벤트 프로토콜 (버전 1)
+
+기계용 이벤트는 stdout에 레코드 구분 문자(RS, 0x1E)로 시작하는 JSON 한 줄로 출력하고
+RS로 시작하지 않는 줄은 사람이 읽는 로그(이모지 print 등)로 취급 (RFC 7464 JSON text sequence 형식)
+
+    \\x1e{"v": 1, "type": "progress", "ts": 1767625200.123, "message": "...", "progress": 42}
+
+이벤트 종류:
+    progress  진행률 (message, progress 0~100) - 최대 초당 progress_hz회로 병합, 최신 값만 전송
+    log       구조화된 로그 (level, message, 추가 필드)
+    metric    단계별 계측 요약 (metrics, final)
+    result    모드별 최종 결과 (saved_files, notebooklm_files, search_results ...)
+    new_post  감시 모드에서 새 게시물 저장 (member_id, url, title, date, file)
+    error     치명적 에러 (message)
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Dict, Optional, TextIO
+
+PROTOCOL_VERSION = 1
+RECORD_SEPARATOR = "\x1e"
+EVENT_TYPES = ("progress", "log", "metric", "result", "error", "new_post")
+
+# 진행률 이벤트 최대 빈도 (초당, 환경 변수 FMK_PROGRESS_HZ로 조정, 0이면 병합하지 않음)
+DEFAULT_PROGRESS_HZ = 5.0
+
+
+class EventWriter:
+    """RS 프레이밍 이벤트 출력기 (진행률 병합 포함)"""
+
+    def __init__(self, stream: Optional[TextIO] = None, progress_hz: float = DEFAULT_PROGRESS_HZ):
+        """
+        Args:
+            stream: 출력 스트림 (기본: 쓰는 시점의 sys.stdout)
+            progress_hz: 진행률 이벤트 최대 빈도 (초당)
+        """
+        self.stream = stream
+        self.min_interval = 1.0 / progress_hz if progress_hz > 0 else 0.0
+        self._last_progress_at = float("-inf")
+        self._pending: Optional[Dict] = None
+        self.coalesced = 0
+
+    def emit(self, event_type: str, **fields) -> Dict:
+        """
+        이벤트 즉시 출력 (대기 중인 진행률이 있으면 순서 보장을 위해 먼저 출력)
+
+        Args:
+            event_type: EVENT_TYPES 중 하나
+            **fields: 이벤트 필드
+
+        Returns:
+            출력한 이벤트
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"알 수 없는 이벤트 종류: {event_type}")
+        self.flush()
+        event = _make_event(event_type, fields)
+        self._write(event)
+        return event
+
+    def progress(self, message: str, progress: float, **fields):
+        """
+        진행률 이벤트 (최소 간격 안에 들어온 값은 마지막 값만 남겨 두었다가 다음 기회에 출력)
+
+        Args:
+            message: 상태 메시지
+            progress: 진행률 (0~100)
+            **fields: 추가 필드 (current, total 등)
+        """
+        event = _make_event("progress", {"message": message, "progress": int(progress), **fields})
+        now = time.monotonic()
+        if progress >= 100 or now - self._last_progress_at >= self.min_interval:
+            self._pending = None
+            self._last_progress_at = now
+            self._write(event)
+        else:
+            if self._pending is not None:
+                self.coalesced += 1
+            self._pending = event
+
+    def flush(self):
+        """대기 중인 진행률 이벤트 출력"""
+        if self._pending is not None:
+            event, self._pending = self._pending, None
+            self._last_progress_at = time.monotonic()
+            self._write(event)
+
+    def _write(self, event: Dict):
+        stream = self.stream or sys.stdout
+        stream.write(RECORD_SEPARATOR + json.dumps(event, ensure_ascii=False) + "\n")
+        stream.flush()
+
+
+def _make_event(event_type: str, fields: Dict) -> Dict:
+    return {"v": PROTOCOL_VERSION, "type": event_type, "ts": round(time.time(), 3), **fields}
+
+
+def decode_event(line: str) -> Optional[Dict]:
+    """
+    출력 한 줄을 이벤트로 해석
+
+    Args:
+        line: stdout 한 줄 (str.splitlines()는 RS도 줄 경계로 취급하므로 '\n' 기준으로 나눈 줄)
+
+    Returns:
+        이벤트 딕셔너리 (RS로 시작하지 않는 사람용 로그면 None)
+    """
+    if not line.startswith(RECORD_SEPARATOR):
+        return None
+    return json.loads(line[1:])
+
+
+_writer = EventWriter(progress_hz=float(os.environ.get("FMK_PROGRESS_HZ", DEFAULT_PROGRESS_HZ)))
+
+
+def emit_event(event_type: str, **fields) -> Dict:
+    """기본 출력기로 이벤트 출력 (EventWriter.emit 참고)"""
+    return _writer.emit(event_type, **fields)
+
+
+def emit_progress(message: str, progress: float, **fields):
+    """기본 출력기로 진행률 이벤트 출력 (병합 대상)"""
+    _writer.progress(message, progress, **fields)
+
+
+def flush_events():
+    """기본 출력기의 대기 중인 진행률 이벤트 출력"""
+    _writer.flush()
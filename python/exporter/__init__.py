@@ -1,13 +1,17 @@
-"""데이터 내보내기 모듈"""
+"""데이터 내보내기 모듈 (형식별 내보내기 / 레코드 스트림은 처음 사용할 때 로딩)"""
 
-from .notebooklm import (
-    convert_post_to_markdown,
-    export_to_notebooklm,
-    create_analysis_guide,
-)
+from lazyimport import lazy_exports
 
-__all__ = [
-    'convert_post_to_markdown',
-    'export_to_notebooklm',
-    'create_analysis_guide',
-]
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    'convert_post_to_markdown': '.notebooklm',
+    'counter_trend': '.notebooklm',
+    'post_blocks': '.notebooklm',
+    'blocks_to_markdown': '.notebooklm',
+    'export_to_notebooklm': '.notebooklm',
+    'create_analysis_guide': '.notebooklm',
+    'EXPORTERS': '.formats',
+    'RecordWriter': '.formats',
+    'register_exporter': '.formats',
+    'export_formats': '.formats',
+    'PostRecords': '.records',
+})
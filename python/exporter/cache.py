@@ -0,0 +1,183 @@
+"""
+렌더링된 Markdown 조각 캐시
+document_srl + 내용 해시 기준으로 게시물별 Markdown을 재사용하여
+새로 추가되거나 변경된 게시물만 다시 렌더링
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from postkeys import content_hash
+
+# convert_post_to_markdown 템플릿이 바뀌면 올려서 캐시 전체를 무효화
+RENDER_VERSION = 1
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """
+    파일 내용이 달라졌을 때만 기록 (원자적 교체)
+
+    Args:
+        path: 출력 파일 경로
+        data: 기록할 바이트
+
+    Returns:
+        실제로 기록했으면 True, 내용이 같아 건너뛰었으면 False
+    """
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+class FragmentCache:
+    """
+    게시물별 Markdown 조각 캐시
+
+    - files: JSON 파일명 → (mtime_ns, size, srl, key, ts) — 변경 없는 파일은 읽지도 않음
+    - fragments: 게시물 키 → (내용 해시, Markdown, 제목, URL)
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = Path(cache_file)
+        self.files: Dict[str, Dict] = {}
+        self.fragments: Dict[str, Dict] = {}
+        self.outputs: Dict[str, Dict] = {}
+        self.rendered = 0
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+
+        # 템플릿 버전이 다르면 캐시를 버리고 전체 재렌더링
+        if data.get('version') != RENDER_VERSION:
+            self._dirty = True
+            return
+
+        self.files = data.get('files', {})
+        self.fragments = data.get('fragments', {})
+        self.outputs = data.get('outputs', {})
+
+    def save(self):
+        """변경 사항이 있을 때만 캐시 파일 저장"""
+        if not self._dirty:
+            return
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({
+            "version": RENDER_VERSION,
+            "files": self.files,
+            "fragments": self.fragments,
+            "outputs": self.outputs,
+        }, ensure_ascii=False, separators=(',', ':'))
+        write_if_changed(self.cache_file, payload.encode('utf-8'))
+        self._dirty = False
+
+    def lookup_file(self, name: str, stat: os.stat_result) -> Optional[Dict]:
+        """
+        파일 크기/수정 시각이 그대로이고 조각이 남아 있으면 캐시 항목 반환
+
+        Args:
+            name: JSON 파일명
+            stat: 파일 stat 결과
+
+        Returns:
+            {"srl", "key", "ts"} 항목 또는 None
+        """
+        entry = self.files.get(name)
+        # 작성 시각이 없는 예전 항목은 다시 읽음 (내용이 그대로면 렌더링은 생략됨)
+        if not entry or 'ts' not in entry:
+            return None
+        if entry['mtime_ns'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+            return None
+        if entry['key'] not in self.fragments:
+            return None
+        return entry
+
+    def remember_file(self, name: str, stat: os.stat_result, srl: int, key: str, ts: int = 0):
+        """JSON 파일과 게시물 키, 작성 시각(epoch 초)의 연결 기록"""
+        self.files[name] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "srl": srl,
+            "key": key,
+            "ts": ts,
+        }
+        self._dirty = True
+
+    def render(self, key: str, post: Dict, renderer) -> str:
+        """
+        캐시된 조각이 최신이면 재사용, 아니면 renderer로 렌더링 후 저장
+
+        Args:
+            key: 게시물 키 (document_srl)
+            post: 게시물 데이터 딕셔너리
+            renderer: 게시물 → Markdown 함수
+
+        Returns:
+            Markdown 조각
+        """
+        digest = content_hash(post)
+        cached = self.fragments.get(key)
+        if cached and cached['hash'] == digest:
+            return cached['markdown']
+
+        markdown = renderer(post)
+        self.store(key, digest, post.get('title', 'untitled'), post.get('url', ''), markdown)
+        return markdown
+
+    def store(self, key: str, digest: str, title: str, url: str, markdown: str):
+        """외부(병렬 워커 등)에서 렌더링한 조각 저장"""
+        self.fragments[key] = {
+            "hash": digest,
+            "markdown": markdown,
+            "title": title,
+            "url": url,
+        }
+        self.rendered += 1
+        self._dirty = True
+
+    def known_hashes(self) -> Dict[str, str]:
+        """게시물 키 → 캐시된 내용 해시"""
+        return {key: entry['hash'] for key, entry in self.fragments.items()}
+
+    def fragment(self, key: str) -> Dict:
+        """캐시된 조각 항목 (markdown, title, url) 반환"""
+        return self.fragments[key]
+
+    def prune_files(self, names):
+        """더 이상 존재하지 않는 JSON 파일 항목과, 남은 파일 어디에서도 가리키지 않는 조각 제거"""
+        alive = set(names)
+        stale = [name for name in self.files if name not in alive]
+        for name in stale:
+            del self.files[name]
+        referenced = {entry['key'] for entry in self.files.values()}
+        orphans = [key for key in self.fragments if key not in referenced]
+        for key in orphans:
+            del self.fragments[key]
+        if stale or orphans:
+            self._dirty = True
+
+    def output_state(self, name: str) -> Dict:
+        """출력 파일별 상태 (본문 해시, 생성 시각) 조회"""
+        return self.outputs.get(name, {})
+
+    def set_output_state(self, name: str, state: Dict):
+        """출력 파일별 상태 기록"""
+        if self.outputs.get(name) != state:
+            self.outputs[name] = state
+            self._dirty = True
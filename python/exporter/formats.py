@@ -0,0 +1,281 @@
+"""
+스트리밍 내보내기 형식 레지스트리
+JSONL / CSV / 단일 HTML 리포트 / NotebookLM Markdown을 한 번의 코퍼스 읽기로 동시에 생성
+"""
+
+import csv
+import html
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Type
+
+from postkeys import get_post_id, get_post_time
+
+from .notebooklm import (
+    CACHE_DIRNAME,
+    KST,
+    _combined_entry,
+    _combined_header,
+    convert_post_to_markdown,
+    counter_trend,
+    post_blocks,
+    splice_links,
+)
+from .records import PostRecords
+
+EXPORTERS: Dict[str, Type["RecordWriter"]] = {}
+
+
+def register_exporter(name: str):
+    """
+    내보내기 형식 등록 데코레이터
+
+    Args:
+        name: 형식 이름 (CLI에서 사용)
+    """
+    def decorator(cls):
+        cls.name = name
+        EXPORTERS[name] = cls
+        return cls
+    return decorator
+
+
+class RecordWriter:
+    """
+    레코드 단위 스트리밍 writer 기본 클래스
+
+    begin → write (레코드마다) → finish 순으로 호출되며,
+    임시 파일에 쓰다가 finish에서 원자적으로 교체
+    """
+
+    name = ""
+    extension = ""
+    encoding = 'utf-8'
+    newline = None
+
+    def __init__(self, output_dir: Path, basename: str = "fmkorea_posts"):
+        self.path = Path(output_dir) / f"{basename}.{self.extension}"
+        self._tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self._file = None
+        self.total = 0
+        self.count = 0
+
+    def begin(self, total: int):
+        self._file = open(self._tmp_path, 'w', encoding=self.encoding, newline=self.newline)
+        self.total = total
+
+    def write(self, post: Dict):
+        raise NotImplementedError
+
+    def finish(self) -> str:
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        return str(self.path)
+
+    def abort(self):
+        if self._file:
+            self._file.close()
+        try:
+            self._tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+@register_exporter("jsonl")
+class JsonlWriter(RecordWriter):
+    """한 줄에 게시물 하나 (원본 스키마 + document_srl)"""
+
+    extension = "jsonl"
+
+    def write(self, post: Dict):
+        record = {"document_srl": get_post_id(post), **post}
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write("\n")
+
+
+@register_exporter("csv")
+class CsvWriter(RecordWriter):
+    """평탄화된 메타데이터 + 본문 (Excel 한글 호환을 위해 BOM 포함)"""
+
+    extension = "csv"
+    encoding = 'utf-8-sig'
+    newline = ''
+    columns = ["document_srl", "url", "title", "date", "timestamp", "views", "author", "comments", "votes", "content"]
+
+    def begin(self, total: int):
+        super().begin(total)
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def write(self, post: Dict):
+        metadata = post.get('metadata', {})
+        ts = get_post_time(post)
+        self._writer.writerow([
+            get_post_id(post),
+            post.get('url', ''),
+            post.get('title', ''),
+            post.get('date', ''),
+            datetime.fromtimestamp(ts, KST).isoformat() if ts else '',
+            post.get('views', 0),
+            metadata.get('author', ''),
+            metadata.get('comments', ''),
+            metadata.get('votes', ''),
+            post.get('content', ''),
+        ])
+
+
+def _html_link(label: str, href: str) -> str:
+    href = html.escape(href)
+    return f"<a href=\"{href}\">{html.escape(label) or href}</a>"
+
+
+@register_exporter("html")
+class HtmlWriter(RecordWriter):
+    """외부 리소스 없이 열리는 단일 HTML 리포트"""
+
+    extension = "html"
+
+    STYLE = """
+body { font-family: -apple-system, 'Malgun Gothic', sans-serif; max-width: 960px; margin: 0 auto; padding: 24px; background: #111827; color: #e5e7eb; }
+header { border-bottom: 1px solid #374151; margin-bottom: 24px; }
+article { background: #1f2937; border-radius: 12px; padding: 16px 20px; margin-bottom: 16px; }
+article h2 { margin: 0 0 8px; font-size: 1.15rem; }
+a { color: #60a5fa; }
+.meta { color: #9ca3af; font-size: 0.85rem; margin-bottom: 12px; }
+.content { white-space: pre-wrap; line-height: 1.6; }
+.content p { margin: 0 0 8px; }
+.content img { max-width: 100%; }
+.content blockquote { margin: 0 0 8px; padding-left: 12px; border-left: 3px solid #4b5563; color: #d1d5db; }
+"""
+
+    def begin(self, total: int):
+        super().begin(total)
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._file.write(
+            "<!DOCTYPE html>\n<html lang=\"ko\">\n<head>\n<meta charset=\"utf-8\">\n"
+            "<title>FM Korea 게시물 모음</title>\n"
+            f"<style>{self.STYLE}</style>\n</head>\n<body>\n"
+            f"<header><h1>FM Korea 게시물 모음</h1>"
+            f"<p>수집 일시: {now} · 총 게시물 수: {total}</p></header>\n"
+        )
+
+    def write(self, post: Dict):
+        metadata = post.get('metadata', {})
+        url = html.escape(post.get('url', ''))
+        meta = [f"작성일 {html.escape(post.get('date', ''))}", f"조회수 {post.get('views', 0):,}"]
+        if metadata.get('author'):
+            meta.append(f"작성자 {html.escape(metadata['author'])}")
+        if metadata.get('comments'):
+            meta.append(f"댓글 {metadata['comments']}")
+        if metadata.get('votes'):
+            meta.append(f"추천 {metadata['votes']}")
+        trend = counter_trend(post)
+        if trend:
+            meta.append(f"추이 {html.escape(trend)}")
+
+        self._file.write(
+            f"<article id=\"post-{get_post_id(post)}\">"
+            f"<h2><a href=\"{url}\">{html.escape(post.get('title', '제목 없음'))}</a></h2>"
+            f"<div class=\"meta\">{' · '.join(meta)}</div>"
+            f"<div class=\"content\">{self.render_content(post)}</div>"
+            "</article>\n"
+        )
+
+    @staticmethod
+    def render_content(post: Dict) -> str:
+        """본문 블록을 HTML로 (본문 블록이 없는 예전 게시물은 content 텍스트 그대로)"""
+        if not post.get('blocks'):
+            return html.escape(post.get('content', ''))
+
+        parts = []
+        for kind, text, url, links in post_blocks(post):
+            text = splice_links(text, links, html.escape, _html_link)
+            url = html.escape(url)
+            if kind == "p":
+                parts.append(f"<p>{text}</p>")
+            elif kind == "quote":
+                parts.append(f"<blockquote>{text}</blockquote>")
+            elif kind == "link":
+                parts.append(f"<p><a href=\"{url}\">{text or url}</a></p>")
+            elif kind == "img":
+                parts.append(f"<p><img src=\"{url}\" alt=\"이미지\" loading=\"lazy\"></p>")
+            elif kind == "embed":
+                parts.append(f"<p>임베드 <a href=\"{url}\">{url}</a></p>")
+        return "".join(parts)
+
+    def finish(self) -> str:
+        self._file.write("</body>\n</html>\n")
+        return super().finish()
+
+
+@register_exporter("markdown")
+class MarkdownWriter(RecordWriter):
+    """NotebookLM 통합 Markdown (export_to_notebooklm combine=True와 같은 형식)"""
+
+    extension = "md"
+
+    def begin(self, total: int):
+        super().begin(total)
+        self._file.write(_combined_header(total, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+
+    def write(self, post: Dict):
+        self.count += 1
+        self._file.write(_combined_entry(self.count, self.total, convert_post_to_markdown(post)))
+
+
+def export_formats(
+    data_dir: str = "data/raw",
+    output_dir: str = "data/exports",
+    formats: List[str] = ("jsonl", "csv", "html"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> Dict[str, str]:
+    """
+    여러 형식을 코퍼스 한 번 읽기로 동시에 내보내기 (작성 시각 최신순)
+
+    Args:
+        data_dir: 원본 JSON 파일 디렉토리
+        output_dir: 출력 디렉토리
+        formats: 등록된 형식 이름 리스트 (EXPORTERS 참고)
+        since: 이 시각 이후 작성된 게시물만 (정렬 인덱스로 구간 조회)
+        until: 이 시각 이전 작성된 게시물만
+
+    Returns:
+        형식 이름 → 생성된 파일 경로
+    """
+    unknown = [name for name in formats if name not in EXPORTERS]
+    if unknown:
+        raise ValueError(f"알 수 없는 내보내기 형식: {', '.join(unknown)} (지원: {', '.join(EXPORTERS)})")
+    # 같은 형식을 두 번 주면 writer 둘이 같은 임시 파일에 쓰므로 한 번만
+    formats = list(dict.fromkeys(formats))
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    records = PostRecords(
+        data_dir, index_file=output_path / CACHE_DIRNAME / "records.json", since=since, until=until
+    )
+    if not len(records):
+        print("⚠️  내보낼 게시물이 없습니다.")
+        return {}
+
+    writers = [EXPORTERS[name](output_path) for name in formats]
+    try:
+        for writer in writers:
+            writer.begin(len(records))
+        for post in records:
+            for writer in writers:
+                writer.write(post)
+        results = {writer.name: writer.finish() for writer in writers}
+    except Exception:
+        for writer in writers:
+            writer.abort()
+        raise
+
+    for name, path in results.items():
+        print(f"✅ {name} 내보내기: {Path(path).name}")
+    print(f"📊 총 {len(records)}개 게시물, {len(formats)}개 형식 (코퍼스 1회 읽기)")
+
+    return results
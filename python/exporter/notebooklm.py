@@ -3,11 +3,27 @@ NotebookLM 호환 Markdown 변환 모듈
 수집된 게시물을 NotebookLM에 업로드 가능한 형태로 변환
 """
 
+import hashlib
 import json
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime
 
+from metrics import span
+from postkeys import KST, PERIODS, get_post_id, get_post_time, period_label
+
+from .cache import FragmentCache, write_if_changed
+
+# 증분 변환 시 캐시 디렉토리와 고정 통합 파일명
+CACHE_DIRNAME = ".cache"
+COMBINED_FILENAME = "fmkorea_posts.md"
+
+# 증분 변환에서 개별 파일 목록을 기록하는 출력 상태 이름 (이번에 쓰지 않은 예전 파일 삭제용)
+PER_POST_STATE = "per_post"
+
+# content 끝의 이미지 URL 목록 구분자 (본문 블록의 "img"가 차례로 가리킴)
+IMAGE_SECTION = "\n\n[이미지]\n"
+
 
 def convert_post_to_markdown(post: Dict) -> str:
     """
@@ -38,23 +54,196 @@ def convert_post_to_markdown(post: Dict) -> str:
         md_lines.append(f"- **댓글 수**: {metadata['comments']}")
     if metadata.get('votes'):
         md_lines.append(f"- **추천 수**: {metadata['votes']}")
+    trend = counter_trend(post)
+    if trend:
+        md_lines.append(f"- **반응 추이**: {trend}")
     
     md_lines.append("")
     
-    # 본문
+    # 본문 (본문 블록이 없는 예전 게시물은 content 그대로)
     md_lines.append("## 본문\n")
-    content = post.get('content', '')
-    md_lines.append(content)
+    if post.get('blocks'):
+        md_lines.append(blocks_to_markdown(post))
+    else:
+        md_lines.append(post.get('content', ''))
     
     md_lines.append("\n---\n")
     
     return "\n".join(md_lines)
 
 
+def post_blocks(post: Dict) -> List[Tuple[str, str, str, List]]:
+    """
+    저장된 본문 블록(blocks)을 (종류, 텍스트, URL, 인라인 링크) 목록으로 풀기 (형식은 scraper/parser.py BLOCK_TAGS 위 주석)
+    
+    Args:
+        post: 게시물 데이터 딕셔너리
+    
+    Returns:
+        [(종류, 텍스트, URL, [[href, 시작, 끝], ...])] - 종류는 "p", "quote", "link", "img", "embed",
+        blocks가 없는 예전 게시물은 content 전체를 문단 하나로
+    """
+    content = post.get('content', '')
+    blocks = post.get('blocks')
+    if not blocks:
+        return [("p", content, "", [])] if content else []
+    
+    text_end = content.find(IMAGE_SECTION)
+    images = iter(content[text_end + len(IMAGE_SECTION):].split("\n") if text_end >= 0 else ())
+    
+    result = []
+    cursor = 0
+    for block in blocks:
+        if block == "img":
+            result.append(("img", "", next(images, ""), []))
+            continue
+        shown, links = None, []
+        if isinstance(block, int):
+            kind, url, end = "p", "", block
+        elif block[0] == "embed":
+            result.append(("embed", "", block[1], []))
+            continue
+        elif block[0] in ("p", "quote"):
+            kind, url, end = block[0], "", block[1]
+            shown = block[2] if len(block) > 2 else None
+            links = block[3] if len(block) > 3 else []
+        elif block[0] == "link":
+            kind, url, end = "link", block[1], block[2]
+            shown = block[3] if len(block) > 3 else None
+        else:
+            continue  # 알 수 없는 종류는 건너뜀
+        # 텍스트 블록 사이는 줄바꿈 1자 (텍스트 없는 링크는 자리를 차지하지 않음)
+        start = cursor + 1 if cursor and end > cursor else cursor
+        result.append((kind, content[start:end] if shown is None else shown, url, links))
+        cursor = end
+    return result
+
+
+def splice_links(text: str, links: List, plain, linked) -> str:
+    """
+    문단 텍스트에 인라인 링크 끼워 넣기
+    
+    Args:
+        text: 표시 텍스트
+        links: [[href, 시작, 끝], ...]
+        plain: 링크 밖 텍스트 변환 함수
+        linked: (링크 텍스트, href) → 링크 표현 함수
+    
+    Returns:
+        변환된 문자열
+    """
+    parts = []
+    position = 0
+    for href, start, end in links:
+        parts.append(plain(text[position:start]))
+        parts.append(linked(text[start:end], href))
+        position = max(position, end)
+    parts.append(plain(text[position:]))
+    return "".join(parts)
+
+
+def _markdown_link(label: str, href: str) -> str:
+    label = (label or href).replace("[", "\\[").replace("]", "\\]")
+    return f"[{label}]({href})"
+
+
+def blocks_to_markdown(post: Dict) -> str:
+    """
+    본문 블록을 Markdown으로 렌더링 (문단 순서와 이미지 / 링크 위치 유지)
+    
+    Args:
+        post: 게시물 데이터 딕셔너리
+    
+    Returns:
+        Markdown 본문 문자열
+    """
+    parts = []
+    for kind, text, url, links in post_blocks(post):
+        if kind in ("p", "quote"):
+            text = splice_links(text, links, str, _markdown_link) if links else text
+            if kind == "quote":
+                text = "\n".join(f"> {line}" for line in text.split("\n"))
+            parts.append(text)
+        elif kind == "link":
+            parts.append(_markdown_link(text, url))
+        elif kind == "img":
+            parts.append(f"![이미지]({url})")
+        elif kind == "embed":
+            parts.append(f"[임베드] {url}")
+    return "\n\n".join(parts)
+
+
+def counter_trend(post: Dict, points: int = 5) -> str:
+    """
+    카운터 시계열(counters) 추이 요약 (재방문으로 관측이 둘 이상 쌓였을 때)
+    
+    Args:
+        post: 게시물 데이터 딕셔너리
+        points: 표시할 최대 관측 수 (처음과 마지막 포함, 고르게 선택)
+    
+    Returns:
+        "조회 120 → 340 → 410 · 댓글 3 → 9 → 9 (10.01 14:00 ~ 10.03 20:00, 5회 관측)" 또는 ""
+    """
+    series = post.get('counters') or []
+    if len(series) < 2:
+        return ""
+    count = min(points, len(series))
+    shown = [series[round(i * (len(series) - 1) / (count - 1))] for i in range(count)]
+    
+    parts = []
+    for index, label in enumerate(("조회", "댓글", "추천"), 1):
+        values = [sample[index] for sample in shown if sample[index] is not None]
+        if values:
+            parts.append(f"{label} " + " → ".join(f"{value:,}" for value in values))
+    start, end = (datetime.fromtimestamp(series[i][0], KST).strftime('%m.%d %H:%M') for i in (0, -1))
+    return f"{' · '.join(parts)} ({start} ~ {end}, {len(series)}회 관측)"
+
+
+def sort_key(post: Dict) -> Tuple[int, int]:
+    """최신순 정렬 키: (작성 시각, document_srl) - 같은 분에 쓴 글은 srl로 구분"""
+    return get_post_time(post), get_post_id(post)
+
+
+def post_key(post: Dict, srl: int) -> str:
+    """캐시 키: document_srl, 없으면 URL"""
+    return str(srl) if srl else post.get('url', '')
+
+
+def _combined_header(total: int, generated_at: str) -> str:
+    """통합 파일 헤더"""
+    return (
+        f"# FM Korea 게시물 모음\n\n"
+        f"**수집 일시**: {generated_at}\n"
+        f"**총 게시물 수**: {total}\n\n"
+        "---\n\n"
+    )
+
+
+def _combined_entry(idx: int, total: int, markdown: str) -> str:
+    """통합 파일의 게시물 한 건"""
+    return f"<!-- 게시물 {idx}/{total} -->\n\n{markdown}\n"
+
+
+def _post_filename(idx: int, title: str, url: str) -> str:
+    """개별 파일명: 순번 + 제목의 처음 30자 + 해시"""
+    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_'))[:30]
+    url_hash = url.split('/')[-1][:8]
+    return f"{idx:03d}_{safe_title}_{url_hash}.md"
+
+
+def _stable_post_filename(key: str, title: str) -> str:
+    """증분 변환의 개별 파일명: document_srl(없으면 URL 해시) + 제목의 처음 30자 (정렬 순서와 무관)"""
+    safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_'))[:30]
+    stem = key if key.isdigit() else hashlib.sha1(key.encode('utf-8')).hexdigest()[:10]
+    return f"{stem}_{safe_title}.md"
+
+
 def export_to_notebooklm(
     data_dir: str = "data/raw",
     output_dir: str = "data/notebooklm",
-    combine: bool = True
+    combine: bool = True,
+    incremental: bool = False,
+    workers: int = 1
 ) -> List[str]:
     """
     수집된 게시물을 NotebookLM 호환 Markdown으로 변환
@@ -63,6 +252,8 @@ def export_to_notebooklm(
         data_dir: 원본 JSON 파일 디렉토리
         output_dir: Markdown 출력 디렉토리
         combine: True면 하나의 파일로 통합, False면 개별 파일
+        incremental: True면 렌더링 캐시를 사용해 새로 추가/변경된 게시물만 변환
+        workers: JSON 로드/렌더링 프로세스 수 (1이면 직렬, 0이면 CPU 코어 수)
     
     Returns:
         생성된 파일 경로 리스트
@@ -85,30 +276,44 @@ def export_to_notebooklm(
     
     print(f"📂 {len(json_files)}개 게시물 발견")
     
-    posts = []
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                post = json.load(f)
-                posts.append(post)
-        except Exception as e:
-            print(f"⚠️  파일 로드 실패 ({json_file.name}): {e}")
+    if incremental:
+        saved_files = _export_incremental(json_files, output_path, combine, workers)
+        _print_usage(output_path)
+        return saved_files
     
-    # 최신순 정렬 (document_srl 기준 내림차순)
-    import re
-    def get_post_id(post):
-        url = post.get('url', '')
-        # document_srl=12345... 패턴 찾기
-        match = re.search(r'document_srl=(\d+)', url)
-        if match:
-            return int(match.group(1))
-        # /12345678 패턴 (단축 URL)
-        match = re.search(r'/(\d{7,})', url)
-        if match:
-            return int(match.group(1))
-        return 0
-
-    posts.sort(key=get_post_id, reverse=True)
+    if workers != 1:
+        # 병렬 경로: 디코딩과 렌더링을 프로세스 풀로 분산한 뒤 정렬
+        from .parallel import render_posts_parallel
+        
+        rendered = []
+        with span("export.parallel_render"):
+            for result in render_posts_parallel(json_files, workers=workers or None):
+                if result.error:
+                    print(f"⚠️  파일 로드 실패 ({Path(result.path).name}): {result.error}")
+                    continue
+                rendered.append(result)
+        
+        rendered.sort(key=lambda r: (r.ts, r.srl), reverse=True)
+        total = len(rendered)
+        entries = ((r.title, r.url, r.markdown) for r in rendered)
+    else:
+        posts = []
+        for json_file in json_files:
+            try:
+                with span("export.load"), open(json_file, 'r', encoding='utf-8') as f:
+                    post = json.load(f)
+                    posts.append(post)
+            except Exception as e:
+                print(f"⚠️  파일 로드 실패 ({json_file.name}): {e}")
+        
+        # 최신순 정렬 (작성 시각, 같으면 document_srl 기준 내림차순)
+        with span("export.sort"):
+            posts.sort(key=sort_key, reverse=True)
+        total = len(posts)
+        entries = (
+            (post.get('title', 'untitled'), post.get('url', ''), _render(post))
+            for post in posts
+        )
     print("✅ 게시물 최신순 정렬 완료")
     
     saved_files = []
@@ -120,49 +325,191 @@ def export_to_notebooklm(
         
         with open(output_file, 'w', encoding='utf-8') as f:
             # 헤더
-            f.write(f"# FM Korea 게시물 모음\n\n")
-            f.write(f"**수집 일시**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**총 게시물 수**: {len(posts)}\n\n")
-            f.write("---\n\n")
+            f.write(_combined_header(total, datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
             
             # 각 게시물
-            for idx, post in enumerate(posts, 1):
-                f.write(f"<!-- 게시물 {idx}/{len(posts)} -->\n\n")
-                f.write(convert_post_to_markdown(post))
-                f.write("\n")
+            for idx, (_, _, markdown) in enumerate(entries, 1):
+                with span("export.write"):
+                    f.write(_combined_entry(idx, total, markdown))
         
         saved_files.append(str(output_file))
         print(f"✅ 통합 파일 생성: {output_file.name}")
         print(f"🔍 [DEBUG] 파일 절대 경로: {output_file.absolute()}")
         print(f"🔍 [DEBUG] 파일 존재 확인: {output_file.exists()}")
-        print(f"📊 총 {len(posts)}개 게시물 포함")
+        print(f"📊 총 {total}개 게시물 포함")
         
     else:
         # 개별 Markdown 파일로 저장
-        for idx, post in enumerate(posts, 1):
-            # 파일명: 제목의 처음 30자 + 해시
-            title = post.get('title', 'untitled')
-            safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_'))[:30]
-            url_hash = post.get('url', '').split('/')[-1][:8]
-            filename = f"{idx:03d}_{safe_title}_{url_hash}.md"
+        for idx, (title, url, markdown) in enumerate(entries, 1):
+            output_file = output_path / _post_filename(idx, title, url)
             
-            output_file = output_path / filename
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(convert_post_to_markdown(post))
+            with span("export.write"), open(output_file, 'w', encoding='utf-8') as f:
+                f.write(markdown)
             
             saved_files.append(str(output_file))
         
         print(f"✅ {len(saved_files)}개 개별 파일 생성")
     
+    _print_usage(output_path)
+    
+    return saved_files
+
+
+def _export_incremental(
+    json_files: List[Path],
+    output_path: Path,
+    combine: bool,
+    workers: int = 1
+) -> List[str]:
+    """
+    렌더링 캐시를 이용한 증분 변환
+    
+    변경 없는 JSON 파일은 읽지 않고, 내용이 바뀐 게시물만 다시 렌더링하며,
+    결과 파일은 바이트가 달라졌을 때만 다시 기록
+    
+    Args:
+        json_files: 원본 JSON 파일 경로 리스트
+        output_path: Markdown 출력 디렉토리
+        combine: True면 하나의 파일로 통합, False면 개별 파일
+        workers: 캐시에 없는 파일의 로드/렌더링 프로세스 수
+    
+    Returns:
+        결과 파일 경로 리스트
+    """
+    cache = FragmentCache(output_path / CACHE_DIRNAME / "fragments.json")
+    
+    entries = []  # (작성 시각, srl, key)
+    misses = []
+    for json_file in json_files:
+        try:
+            with span("export.stat"):
+                stat = json_file.stat()
+        except OSError as e:
+            print(f"⚠️  파일 로드 실패 ({json_file.name}): {e}")
+            continue
+        cached = cache.lookup_file(json_file.name, stat)
+        if cached:
+            entries.append((cached['ts'], cached['srl'], cached['key']))
+        else:
+            misses.append((json_file, stat))
+    
+    if workers != 1:
+        # 템플릿 변경 등으로 캐시가 대부분 무효일 때는 프로세스 풀로 분산
+        from .parallel import render_posts_parallel
+        
+        results = render_posts_parallel(
+            [json_file for json_file, _ in misses],
+            workers=workers or None,
+            known_hashes=cache.known_hashes()
+        )
+        with span("export.parallel_render"):
+            for (json_file, stat), result in zip(misses, results):
+                if result.error:
+                    print(f"⚠️  파일 로드 실패 ({json_file.name}): {result.error}")
+                    continue
+                if result.markdown is not None:
+                    cache.store(result.key, result.digest, result.title, result.url, result.markdown)
+                cache.remember_file(json_file.name, stat, result.srl, result.key, result.ts)
+                entries.append((result.ts, result.srl, result.key))
+    else:
+        for json_file, stat in misses:
+            try:
+                with span("export.load"), open(json_file, 'r', encoding='utf-8') as f:
+                    post = json.load(f)
+                srl = get_post_id(post)
+                key = post_key(post, srl)
+                ts = get_post_time(post)
+                with span("export.render"):
+                    cache.render(key, post, convert_post_to_markdown)
+                cache.remember_file(json_file.name, stat, srl, key, ts)
+                entries.append((ts, srl, key))
+            except Exception as e:
+                print(f"⚠️  파일 로드 실패 ({json_file.name}): {e}")
+    
+    cache.prune_files(f.name for f in json_files)
+    
+    # 같은 게시물이 여러 파일에 있으면 한 번만 포함
+    seen = set()
+    ordered = []
+    for _, _, key in sorted(entries, key=lambda e: (e[0], e[1]), reverse=True):
+        if key not in seen:
+            seen.add(key)
+            ordered.append(key)
+    
+    print(f"✅ 게시물 최신순 정렬 완료 (새로 렌더링: {cache.rendered}개, 캐시 재사용: {len(ordered) - cache.rendered}개)")
+    
+    saved_files = []
+    written = 0
+    
+    if combine:
+        output_file = output_path / COMBINED_FILENAME
+        total = len(ordered)
+        body = "".join(
+            _combined_entry(idx, total, cache.fragment(key)['markdown'])
+            for idx, key in enumerate(ordered, 1)
+        )
+        
+        # 본문이 그대로면 이전 생성 시각을 유지하여 파일 바이트가 바뀌지 않도록 함
+        body_hash = hashlib.sha1(body.encode('utf-8')).hexdigest()
+        state = cache.output_state(COMBINED_FILENAME)
+        if state.get('body_hash') == body_hash:
+            generated_at = state['generated_at']
+        else:
+            generated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        cache.set_output_state(COMBINED_FILENAME, {"body_hash": body_hash, "generated_at": generated_at})
+        
+        data = (_combined_header(total, generated_at) + body).encode('utf-8')
+        with span("export.write"):
+            changed = write_if_changed(output_file, data)
+        if changed:
+            written += 1
+            print(f"✅ 통합 파일 갱신: {output_file.name}")
+        else:
+            print(f"✅ 통합 파일 변경 없음: {output_file.name}")
+        saved_files.append(str(output_file))
+        print(f"📊 총 {total}개 게시물 포함")
+    
+    else:
+        # 파일명은 순번 대신 게시물 키 기준 (앞에 게시물이 끼어들어도 뒤 파일 이름이 바뀌지 않음)
+        names = []
+        for key in ordered:
+            fragment = cache.fragment(key)
+            output_file = output_path / _stable_post_filename(key, fragment['title'])
+            with span("export.write"):
+                changed = write_if_changed(output_file, fragment['markdown'].encode('utf-8'))
+            if changed:
+                written += 1
+            names.append(output_file.name)
+            saved_files.append(str(output_file))
+        
+        # 이전 실행에서 만들었지만 이번에 쓰지 않은 파일 (삭제된 게시물 / 제목 변경) 제거
+        stale = set(cache.output_state(PER_POST_STATE).get('files', [])) - set(names)
+        for name in stale:
+            (output_path / name).unlink(missing_ok=True)
+        cache.set_output_state(PER_POST_STATE, {"files": sorted(names)})
+        
+        print(f"✅ {len(saved_files)}개 개별 파일 중 {written}개 갱신 (예전 파일 {len(stale)}개 삭제)")
+    
+    with span("export.cache_save"):
+        cache.save()
+    
+    return saved_files
+
+
+def _render(post: Dict) -> str:
+    """계측 구간을 포함한 convert_post_to_markdown"""
+    with span("export.render"):
+        return convert_post_to_markdown(post)
+
+
+def _print_usage(output_path: Path):
+    """저장 위치 및 NotebookLM 사용법 출력"""
     print(f"📁 저장 위치: {output_path.absolute()}")
     print(f"\n💡 NotebookLM 사용법:")
     print(f"   1. https://notebooklm.google.com 접속")
     print(f"   2. 'New notebook' 생성")
     print(f"   3. 'Upload' 버튼으로 생성된 Markdown 파일 업로드")
     print(f"   4. 자유롭게 질문하여 투자 패턴 분석")
-    
-    return saved_files
 
 
 def create_analysis_guide(output_dir: str = "data/notebooklm") -> str:
@@ -201,6 +548,8 @@ def create_analysis_guide(output_dir: str = "data/notebooklm") -> str:
 - "반복적으로 언급하는 종목이 있나요?"
 - "최근 관심을 보이는 새로운 섹터가 있나요?"
 
+> 💡 자주 언급하는 종목과 월별 언급 추이는 `python main.py mentions 20`으로 로컬에서 바로 확인할 수 있습니다.
+
 ### 리스크 관리
 - "리스크 관리 전략은 무엇인가요?"
 - "분산투자를 선호하나요, 집중투자를 선호하나요?"
@@ -253,13 +602,15 @@ if __name__ == "__main__":
     
     data_dir = sys.argv[1] if len(sys.argv) > 1 else "data/raw"
     combine = sys.argv[2].lower() == "true" if len(sys.argv) > 2 else True
+    incremental = sys.argv[3].lower() == "true" if len(sys.argv) > 3 else False
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else 1
     
     print("\n" + "="*50)
     print("📝 NotebookLM 형식으로 변환 중...")
     print("="*50 + "\n")
     
     # Markdown 변환
-    files = export_to_notebooklm(data_dir, combine=combine)
+    files = export_to_notebooklm(data_dir, combine=combine, incremental=incremental, workers=workers)
     
     # 분석 가이드 생성
     create_analysis_guide()
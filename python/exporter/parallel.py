@@ -0,0 +1,99 @@
+"""
+병렬 JSON 로드 및 Markdown 렌더링
+프로세스 풀에 파일을 순서 있는 청크로 나눠 JSON 디코딩과 convert_post_to_markdown을 분산
+"""
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+from postkeys import content_hash, get_post_id, get_post_time
+
+from .notebooklm import convert_post_to_markdown, post_key
+
+# 이보다 적은 파일은 프로세스 풀 기동 비용이 더 커서 직렬로 처리
+MIN_PARALLEL_FILES = 256
+DEFAULT_CHUNK_SIZE = 64
+
+
+class RenderedPost(NamedTuple):
+    """워커가 돌려주는 게시물 한 건의 렌더링 결과"""
+    path: str
+    srl: int
+    ts: int  # 작성 시각 (epoch 초, 알 수 없으면 0)
+    key: str
+    digest: str
+    title: str
+    url: str
+    markdown: Optional[str]  # 캐시 해시와 같아 렌더링을 생략했으면 None
+    error: Optional[str] = None
+
+
+# 워커 프로세스별 캐시 해시 (key → 내용 해시)
+_known_hashes: Dict[str, str] = {}
+
+
+def _init_worker(known_hashes: Dict[str, str]):
+    global _known_hashes
+    _known_hashes = known_hashes
+
+
+def _render_chunk(paths: List[str]) -> List[RenderedPost]:
+    """청크 하나를 디코딩하고 렌더링 (워커 프로세스에서 실행)"""
+    results = []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                post = json.load(f)
+        except Exception as e:
+            results.append(RenderedPost(path, 0, 0, "", "", "", "", None, str(e)))
+            continue
+
+        srl = get_post_id(post)
+        key = post_key(post, srl)
+        digest = content_hash(post)
+        markdown = None if _known_hashes.get(key) == digest else convert_post_to_markdown(post)
+        results.append(RenderedPost(
+            path, srl, get_post_time(post), key, digest,
+            post.get('title', 'untitled'), post.get('url', ''),
+            markdown,
+        ))
+    return results
+
+
+def render_posts_parallel(
+    json_files: List[Path],
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    known_hashes: Optional[Dict[str, str]] = None
+) -> Iterator[RenderedPost]:
+    """
+    JSON 파일들을 프로세스 풀에서 디코딩/렌더링하여 입력 순서대로 반환
+
+    Args:
+        json_files: 원본 JSON 파일 경로 리스트
+        workers: 워커 프로세스 수 (None이면 CPU 코어 수)
+        chunk_size: 워커에 한 번에 넘길 파일 수
+        known_hashes: 이미 렌더링된 게시물의 key → 내용 해시 (일치하면 렌더링 생략)
+
+    Yields:
+        RenderedPost (json_files와 같은 순서)
+    """
+    paths = [str(p) for p in json_files]
+    chunks = [paths[i:i + chunk_size] for i in range(0, len(paths), chunk_size)]
+
+    if len(paths) < MIN_PARALLEL_FILES or workers == 1:
+        _init_worker(known_hashes or {})
+        for chunk in chunks:
+            yield from _render_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(known_hashes or {},)
+    ) as executor:
+        # map은 제출 순서대로 결과를 돌려주므로 청크 순서가 보존됨
+        for results in executor.map(_render_chunk, chunks):
+            yield from results
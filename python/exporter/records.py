@@ -0,0 +1,172 @@
+"""
+정렬된 게시물 레코드 반복자
+모든 내보내기 형식이 공유하는 단일 패스 입력 - 각 JSON 파일은 한 번만 디코딩
+
+정렬 인덱스에 파일별 작성 시각을 저장하므로 구간 조회(since / until)와
+기간별 집계는 변경 없는 파일을 읽지 않고 인덱스만으로 처리
+"""
+
+import json
+import os
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from postkeys import PERIODS, get_post_id, get_post_time, period_label
+
+from .cache import write_if_changed
+
+# 정렬 키를 얻으며 디코딩한 게시물을 반복 시점까지 들고 있는 최대 개수
+# (첫 실행처럼 인덱스가 비어 있어도 코퍼스 전체를 메모리에 올리지 않도록, 넘으면 읽을 때 다시 디코딩)
+MAX_PENDING = 512
+
+
+class SortIndex:
+    """
+    JSON 파일명 → (mtime_ns, size, document_srl, 작성 시각) 인덱스
+
+    변경 없는 파일은 정렬 키를 얻기 위해 미리 읽지 않아도 되도록 함
+    """
+
+    def __init__(self, index_file: Optional[Path] = None):
+        self.index_file = Path(index_file) if index_file else None
+        self.entries: Dict[str, List[int]] = {}
+        self._dirty = False
+        if self.index_file:
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (FileNotFoundError, ValueError):
+                pass
+
+    def lookup(self, name: str, stat: os.stat_result) -> Optional[Tuple[int, int]]:
+        """파일이 그대로면 저장된 (작성 시각, document_srl) 반환 (작성 시각이 없는 예전 항목은 None)"""
+        entry = self.entries.get(name)
+        if entry and len(entry) > 3 and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[3], entry[2]
+        return None
+
+    def update(self, name: str, stat: os.stat_result, srl: int, ts: int):
+        self.entries[name] = [stat.st_mtime_ns, stat.st_size, srl, ts]
+        self._dirty = True
+
+    def prune(self, names):
+        alive = set(names)
+        for name in [n for n in self.entries if n not in alive]:
+            del self.entries[name]
+            self._dirty = True
+
+    def save(self):
+        if not (self.index_file and self._dirty):
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(self.entries, separators=(',', ':'))
+        write_if_changed(self.index_file, payload.encode('utf-8'))
+        self._dirty = False
+
+
+class PostRecords:
+    """
+    작성 시각 내림차순(최신순, 같으면 document_srl 순)으로 게시물을 내보내는 반복 가능한 레코드 집합
+
+    정렬 키를 인덱스에서 얻을 수 있는 파일은 반복 시점에 읽고,
+    인덱스에 없는 파일은 정렬 키를 얻으며 디코딩한 결과를 MAX_PENDING개까지만 재사용
+    since / until을 주면 정렬된 작성 시각에서 이분 탐색으로 구간만 남김 (작성 시각을 모르는 게시물은 제외)
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "data/raw",
+        index_file: Optional[Path] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None
+    ):
+        self.data_dir = Path(data_dir)
+        self.index = SortIndex(index_file)
+        self._order: List[Tuple[int, int, Path]] = []
+        self._pending: Dict[Path, Dict] = {}
+        self._scan()
+        if since or until:
+            self._select(since, until)
+
+    def _scan(self):
+        json_files = sorted(self.data_dir.glob("post_*.json"))
+        for json_file in json_files:
+            try:
+                stat = json_file.stat()
+                cached = self.index.lookup(json_file.name, stat)
+                if cached is None:
+                    post = _load(json_file)
+                    ts, srl = get_post_time(post), get_post_id(post)
+                    self.index.update(json_file.name, stat, srl, ts)
+                    if len(self._pending) < MAX_PENDING:
+                        self._pending[json_file] = post
+                else:
+                    ts, srl = cached
+            except Exception as e:
+                print(f"⚠️  파일 로드 실패 ({json_file.name}): {e}")
+                continue
+            self._order.append((ts, srl, json_file))
+
+        self.index.prune(f.name for f in json_files)
+        self.index.save()
+
+        # 같은 시각 / srl이면 파일명 순서를 유지 (안정 정렬)
+        self._order.sort(key=lambda item: (item[0], item[1]), reverse=True)
+
+    def _select(self, since: Optional[datetime], until: Optional[datetime]):
+        """[since, until] 구간의 게시물만 남김 (_order는 작성 시각 내림차순)"""
+        start = 0
+        if until:
+            start = bisect_left(self._order, -until.timestamp(), key=lambda item: -item[0])
+        # 작성 시각을 모르는 게시물(0)은 맨 뒤에 모이므로 항상 잘라냄
+        lowest = max(since.timestamp(), 1) if since else 1
+        end = bisect_right(self._order, -lowest, key=lambda item: -item[0])
+        dropped = self._order[:start] + self._order[end:]
+        self._order = self._order[start:max(start, end)]
+        for _, _, json_file in dropped:
+            self._pending.pop(json_file, None)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for _, _, json_file in self._order:
+            post = self._pending.pop(json_file, None)
+            if post is None:
+                try:
+                    post = _load(json_file)
+                except Exception as e:
+                    print(f"⚠️  파일 로드 실패 ({json_file.name}): {e}")
+                    continue
+            yield post
+
+    def time_range(self) -> Optional[Tuple[int, int]]:
+        """작성 시각을 아는 게시물의 (가장 이른, 가장 늦은) epoch 초 (없으면 None)"""
+        times = [ts for ts, _, _ in self._order if ts]
+        return (times[-1], times[0]) if times else None
+
+    def counts_by_period(self, period: str = "month") -> Dict[str, int]:
+        """
+        기간별 게시물 수 (인덱스만 사용, 파일을 읽지 않음)
+
+        Args:
+            period: "day", "week" 또는 "month"
+
+        Returns:
+            기간 라벨 → 게시물 수 (시간순, 작성 시각을 모르는 게시물은 제외)
+        """
+        if period not in PERIODS:
+            raise ValueError(f"알 수 없는 집계 단위: {period} (지원: {', '.join(PERIODS)})")
+        counts: Dict[str, int] = {}
+        for ts, _, _ in reversed(self._order):
+            if ts:
+                label = period_label(ts, period)
+                counts[label] = counts.get(label, 0) + 1
+        return counts
+
+
+def _load(json_file: Path) -> Dict:
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
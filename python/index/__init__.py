@@ -0,0 +1,12 @@
+"""로컬 인덱스 모듈 (전문 검색, 종목 언급 - 각 인덱스는 처음 사용할 때 로딩)"""
+
+from lazyimport import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    'SearchIndex': '.fulltext',
+    'bigrams': '.fulltext',
+    'build_match_query': '.fulltext',
+    'AhoCorasick': '.mentions',
+    'MentionExtractor': '.mentions',
+    'MentionIndex': '.mentions',
+})
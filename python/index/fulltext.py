@@ -0,0 +1,231 @@
+"""
+수집된 게시물 전문 검색 인덱스
+SQLite FTS5 + 문자 바이그램 토큰화 (띄어쓰기 없는 한국어 대응)
+"""
+
+import json
+import re
+import sqlite3
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from postkeys import content_hash, get_post_id
+
+_WORD_RE = re.compile(r'\w+')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    srl INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    date TEXT,
+    author TEXT,
+    hash TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    title, content, tokenize = 'unicode61 remove_diacritics 0'
+);
+"""
+
+
+def _normalize(text: str) -> str:
+    return unicodedata.normalize('NFKC', text).lower()
+
+
+def bigrams(text: str) -> str:
+    """
+    문자 바이그램 토큰 문자열 생성 (공백 구분)
+
+    "삼성전자 매수" → "삼성 성전 전자 매수"
+    한 글자 단어는 그대로 유지
+
+    Args:
+        text: 원문
+
+    Returns:
+        FTS5 unicode61 토크나이저에 넣을 공백 구분 토큰 문자열
+    """
+    tokens = []
+    for word in _WORD_RE.findall(_normalize(text)):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return " ".join(tokens)
+
+
+def build_match_query(query: str) -> str:
+    """
+    사용자 검색어를 FTS5 MATCH 식으로 변환
+
+    단어마다 바이그램 구문(phrase)으로 묶어 부분 문자열 일치를 보장하고, 단어끼리는 AND
+    한 글자 단어는 해당 글자로 시작하는 바이그램 접두어 검색
+
+    Args:
+        query: 사용자 검색어
+
+    Returns:
+        MATCH 식 (검색어가 비어 있으면 빈 문자열)
+    """
+    clauses = []
+    for word in _WORD_RE.findall(_normalize(query)):
+        if len(word) == 1:
+            clauses.append(f'"{word}"*')
+        else:
+            grams = " ".join(word[i:i + 2] for i in range(len(word) - 1))
+            clauses.append(f'"{grams}"')
+    return " AND ".join(clauses)
+
+
+def make_snippet(text: str, query: str, width: int = 40) -> str:
+    """
+    원문에서 첫 번째 검색어 주변을 잘라 강조한 스니펫 생성
+
+    Args:
+        text: 원문
+        query: 사용자 검색어
+        width: 검색어 앞뒤로 포함할 글자 수
+
+    Returns:
+        스니펫 문자열 (검색어는 **로 강조)
+    """
+    words = sorted(set(_WORD_RE.findall(query.lower())), key=len, reverse=True)
+    lowered = text.lower()
+    hits = [(lowered.find(w), w) for w in words if lowered.find(w) >= 0]
+    if not hits:
+        flat = " ".join(text.split())
+        return flat[:width * 2] + ("…" if len(flat) > width * 2 else "")
+
+    pos, word = min(hits)
+    start = max(0, pos - width)
+    end = min(len(text), pos + len(word) + width)
+    snippet = text[start:pos] + "**" + text[pos:pos + len(word)] + "**" + text[pos + len(word):end]
+    snippet = " ".join(snippet.split())
+    return ("…" if start > 0 else "") + snippet + ("…" if end < len(text) else "")
+
+
+class SearchIndex:
+    """
+    게시물 전문 검색 인덱스
+
+    document_srl을 키로 하며, 내용 해시가 같으면 재색인하지 않음
+    """
+
+    def __init__(self, db_path: str = "data/index/search.sqlite"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def add_post(self, post: Dict, filepath: Optional[str] = None) -> bool:
+        """
+        게시물 하나를 색인 (수집기의 post_callback으로 사용 가능)
+
+        Args:
+            post: 게시물 데이터 딕셔너리
+            filepath: 저장된 JSON 경로 (사용하지 않음, 콜백 시그니처 호환용)
+
+        Returns:
+            새로 색인했거나 갱신했으면 True
+        """
+        changed = self._upsert(post)
+        self.conn.commit()
+        return changed
+
+    def _upsert(self, post: Dict) -> bool:
+        srl = get_post_id(post)
+        if not srl:
+            return False
+
+        digest = content_hash(post)
+        row = self.conn.execute("SELECT hash FROM posts WHERE srl = ?", (srl,)).fetchone()
+        if row and row[0] == digest:
+            return False
+
+        title = post.get('title', '')
+        content = post.get('content', '')
+        self.conn.execute(
+            "INSERT OR REPLACE INTO posts (srl, url, title, content, date, author, hash) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (srl, post.get('url', ''), title, content, post.get('date', ''),
+             post.get('metadata', {}).get('author', ''), digest)
+        )
+        self.conn.execute("DELETE FROM posts_fts WHERE rowid = ?", (srl,))
+        self.conn.execute(
+            "INSERT INTO posts_fts (rowid, title, content) VALUES (?, ?, ?)",
+            (srl, bigrams(title), bigrams(content))
+        )
+        return True
+
+    def sync_directory(self, data_dir: str = "data/raw") -> int:
+        """
+        디렉토리의 post_*.json을 모두 색인 (이미 같은 내용이면 건너뜀)
+
+        Args:
+            data_dir: 원본 JSON 파일 디렉토리
+
+        Returns:
+            새로 색인된 게시물 수
+        """
+        changed = 0
+        for json_file in sorted(Path(data_dir).glob("post_*.json")):
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    post = json.load(f)
+            except Exception as e:
+                print(f"⚠️  파일 로드 실패 ({json_file.name}): {e}")
+                continue
+            if self._upsert(post):
+                changed += 1
+        self.conn.commit()
+        return changed
+
+    def search(self, query: str, limit: int = 20) -> List[Dict]:
+        """
+        검색어로 게시물 검색 (BM25 순위, 제목 가중치 2배)
+
+        Args:
+            query: 검색어 (공백으로 구분된 단어는 모두 포함해야 일치)
+            limit: 최대 결과 수
+
+        Returns:
+            검색 결과 딕셔너리 리스트 (srl, url, title, date, author, score, snippet)
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        rows = self.conn.execute(
+            """
+            SELECT p.srl, p.url, p.title, p.content, p.date, p.author, bm25(posts_fts, 2.0, 1.0) AS score
+            FROM posts_fts
+            JOIN posts p ON p.srl = posts_fts.rowid
+            WHERE posts_fts MATCH ?
+            ORDER BY score
+            LIMIT ?
+            """,
+            (match, limit)
+        ).fetchall()
+
+        return [
+            {
+                "srl": srl,
+                "url": url,
+                "title": title,
+                "date": date,
+                "author": author,
+                "score": round(-score, 3),
+                "snippet": make_snippet(content or title, query),
+            }
+            for srl, url, title, content, date, author, score in rows
+        ]
@@ -0,0 +1,340 @@
+"""
+종목/기업 언급 인덱스
+티커, 회사명, 커뮤니티 은어를 Aho-Corasick 오토마톤으로 컴파일해 게시물을 한 번의 선형 스캔으로 검사
+"""
+
+import json
+import re
+import sqlite3
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from postkeys import content_hash, get_post_id, get_post_time, period_label
+
+# 표준 종목명 → 별칭 (티커, 약칭, 은어). 사용자 사전(JSON)으로 확장/덮어쓰기 가능
+# 일반 단어 안에 흔히 들어가는 부분 별칭("닉스" ⊂ "피닉스" 등)은 넣지 않음
+DEFAULT_DICTIONARY: Dict[str, List[str]] = {
+    "삼성전자": ["삼성전자", "005930", "삼전", "삼성전자우"],
+    "SK하이닉스": ["SK하이닉스", "하이닉스", "000660", "하닉"],
+    "LG에너지솔루션": ["LG에너지솔루션", "373220", "엘지엔솔", "엔솔"],
+    "삼성바이오로직스": ["삼성바이오로직스", "207940"],
+    "현대차": ["현대차", "현대자동차", "005380"],
+    "기아": ["기아", "000270", "기아차"],
+    "셀트리온": ["셀트리온", "068270", "셀트"],
+    "NAVER": ["NAVER", "네이버", "035420"],
+    "카카오": ["카카오", "035720"],
+    "POSCO홀딩스": ["POSCO홀딩스", "포스코홀딩스", "005490", "포홀"],
+    "에코프로": ["에코프로", "086520"],
+    "에코프로비엠": ["에코프로비엠", "247540", "에코비엠"],
+    "한화에어로스페이스": ["한화에어로스페이스", "012450", "한화에어로", "한에어"],
+    "HD현대중공업": ["HD현대중공업", "329180", "현대중공업"],
+    "한미반도체": ["한미반도체", "042700", "한미반"],
+    "테슬라": ["테슬라", "TSLA"],
+    "엔비디아": ["엔비디아", "NVDA"],
+    "애플": ["애플", "AAPL"],
+    "마이크로소프트": ["마이크로소프트", "MSFT"],
+    "팔란티어": ["팔란티어", "PLTR", "팔란"],
+    "TQQQ": ["TQQQ"],
+    "SOXL": ["SOXL"],
+    "KODEX 200": ["KODEX 200", "KODEX200", "코덱스200"],
+}
+
+# 영문/숫자 별칭은 더 긴 영숫자 토큰의 일부일 때 무시 (예: "NVDA"가 "NVDAX" 안에서 일치하지 않도록)
+_ASCII_ALNUM = re.compile(r'[0-9A-Za-z]')
+
+# 두 글자 이하 한글 별칭은 앞에 한글이 붙거나 뒤에 조사가 아닌 한글이 오면 더 긴 단어의 일부로 보고 무시
+# (예: "애플리케이션"의 "애플", "피하닉"의 "하닉" - "애플이", "삼전을"처럼 조사가 붙은 경우는 인정)
+SHORT_HANGUL_ALIAS = 2
+_HANGUL = re.compile(r'[가-힣]')
+_PARTICLE_START = set("이가은는을를의도만에와과로랑서께한처보까부요야")
+
+
+class AhoCorasick:
+    """
+    다중 패턴 문자열 검색 오토마톤
+
+    패턴 수와 무관하게 본문 길이에 선형인 시간으로 모든 일치를 찾음
+    """
+
+    def __init__(self, patterns: Dict[str, str]):
+        """
+        Args:
+            patterns: 패턴 문자열 → 반환할 값 (표준 종목명)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, str]]] = [[]]  # (패턴 길이, 값)
+
+        for pattern, value in patterns.items():
+            key = pattern.lower()
+            if not key:
+                continue
+            node = 0
+            for ch in key:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append((len(key), value))
+
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int, str]]:
+        """
+        본문의 모든 패턴 일치 (겹치는 일치 포함)
+
+        Args:
+            text: 검사할 본문
+
+        Yields:
+            (시작 위치, 끝 위치, 값)
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for pos, ch in enumerate(text.lower()):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, value in out[node]:
+                yield pos - length + 1, pos + 1, value
+
+
+class MentionExtractor:
+    """종목 사전을 컴파일한 언급 추출기"""
+
+    def __init__(self, dictionary: Optional[Dict[str, List[str]]] = None):
+        dictionary = dictionary if dictionary is not None else DEFAULT_DICTIONARY
+        patterns = {}
+        for canonical, aliases in dictionary.items():
+            for alias in [canonical, *aliases]:
+                patterns[alias] = canonical
+        self.automaton = AhoCorasick(patterns)
+        # 사전이 바뀌면 기존 색인을 다시 만들기 위한 지문
+        self.fingerprint = content_hash(patterns)
+
+    @classmethod
+    def from_file(cls, path: Optional[str] = None) -> "MentionExtractor":
+        """
+        기본 사전에 사용자 사전(JSON: 표준명 → 별칭 리스트)을 병합하여 생성
+
+        Args:
+            path: 사용자 사전 파일 경로 (없으면 기본 사전만 사용)
+        """
+        dictionary = {name: list(aliases) for name, aliases in DEFAULT_DICTIONARY.items()}
+        if path and Path(path).exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                for name, aliases in json.load(f).items():
+                    dictionary.setdefault(name, []).extend(aliases)
+        return cls(dictionary)
+
+    def extract(self, text: str) -> Dict[str, int]:
+        """
+        본문에서 종목별 언급 횟수 집계
+
+        같은 위치에서 겹치는 별칭은 가장 긴 것만 인정 (예: "삼성전자우" 안의 "삼성전자")
+
+        Args:
+            text: 검사할 본문
+
+        Returns:
+            표준 종목명 → 언급 횟수
+        """
+        matches = sorted(self.automaton.iter_matches(text), key=lambda m: (m[0], -(m[1] - m[0])))
+        counts: Dict[str, int] = {}
+        covered_until = 0
+        for start, end, value in matches:
+            if start < covered_until:
+                continue
+            if _ASCII_ALNUM.match(text[start]) and start > 0 and _ASCII_ALNUM.match(text[start - 1]):
+                continue
+            if _ASCII_ALNUM.match(text[end - 1]) and end < len(text) and _ASCII_ALNUM.match(text[end]):
+                continue
+            if end - start <= SHORT_HANGUL_ALIAS and _HANGUL.match(text[start]) and not _standalone_hangul(text, start, end):
+                continue
+            counts[value] = counts.get(value, 0) + 1
+            covered_until = end
+        return counts
+
+
+def _standalone_hangul(text: str, start: int, end: int) -> bool:
+    """짧은 한글 별칭이 독립된 단어인지 (앞에 한글이 없고, 뒤는 한글이 아니거나 조사)"""
+    if start > 0 and _HANGUL.match(text[start - 1]):
+        return False
+    return end >= len(text) or not _HANGUL.match(text[end]) or text[end] in _PARTICLE_START
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scanned (
+    srl INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL,
+    month TEXT
+);
+CREATE TABLE IF NOT EXISTS mentions (
+    srl INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (srl, name)
+);
+CREATE INDEX IF NOT EXISTS mentions_name ON mentions (name);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+def post_month(post: Dict) -> Optional[str]:
+    """작성 시각의 'YYYY-MM' (알 수 없으면 None)"""
+    ts = get_post_time(post)
+    return period_label(ts, "month") if ts else None
+
+
+class MentionIndex:
+    """
+    게시물별 종목 언급 색인 (SQLite)
+
+    게시물 내용 해시를 기록하여 새로 추가되거나 바뀐 게시물만 다시 스캔
+    """
+
+    def __init__(self, db_path: str = "data/index/mentions.sqlite",
+                 extractor: Optional[MentionExtractor] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.extractor = extractor or MentionExtractor()
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._check_dictionary()
+
+    def _check_dictionary(self):
+        """사전이 바뀌었으면 기존 색인을 비워 전체 재스캔되도록 함"""
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'dictionary'").fetchone()
+        if row and row[0] == self.extractor.fingerprint:
+            return
+        self.conn.execute("DELETE FROM mentions")
+        self.conn.execute("DELETE FROM scanned")
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('dictionary', ?)",
+            (self.extractor.fingerprint,)
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def add_post(self, post: Dict, filepath: Optional[str] = None) -> bool:
+        """
+        게시물 하나의 언급을 색인 (수집기의 post_callback으로 사용 가능)
+
+        Args:
+            post: 게시물 데이터 딕셔너리
+            filepath: 저장된 JSON 경로 (사용하지 않음, 콜백 시그니처 호환용)
+
+        Returns:
+            새로 스캔했으면 True
+        """
+        changed = self._scan(post)
+        self.conn.commit()
+        return changed
+
+    def _scan(self, post: Dict) -> bool:
+        srl = get_post_id(post)
+        if not srl:
+            return False
+
+        digest = content_hash(post)
+        row = self.conn.execute("SELECT hash FROM scanned WHERE srl = ?", (srl,)).fetchone()
+        if row and row[0] == digest:
+            return False
+
+        text = f"{post.get('title', '')}\n{post.get('content', '')}"
+        counts = self.extractor.extract(text)
+        self.conn.execute("DELETE FROM mentions WHERE srl = ?", (srl,))
+        self.conn.executemany(
+            "INSERT INTO mentions (srl, name, count) VALUES (?, ?, ?)",
+            [(srl, name, count) for name, count in counts.items()]
+        )
+        self.conn.execute(
+            "INSERT OR REPLACE INTO scanned (srl, hash, month) VALUES (?, ?, ?)",
+            (srl, digest, post_month(post))
+        )
+        return True
+
+    def sync_directory(self, data_dir: str = "data/raw") -> int:
+        """
+        디렉토리의 post_*.json 중 새로 추가/변경된 게시물만 스캔
+
+        Args:
+            data_dir: 원본 JSON 파일 디렉토리
+
+        Returns:
+            새로 스캔한 게시물 수
+        """
+        changed = 0
+        for json_file in sorted(Path(data_dir).glob("post_*.json")):
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    post = json.load(f)
+            except Exception as e:
+                print(f"⚠️  파일 로드 실패 ({json_file.name}): {e}")
+                continue
+            if self._scan(post):
+                changed += 1
+        self.conn.commit()
+        return changed
+
+    def top_mentions(self, limit: int = 20) -> List[Dict]:
+        """
+        가장 많이 언급된 종목
+
+        Returns:
+            (name, mentions: 총 언급 횟수, posts: 언급한 게시물 수) 딕셔너리 리스트
+        """
+        rows = self.conn.execute(
+            "SELECT name, SUM(count) AS total, COUNT(*) AS posts FROM mentions "
+            "GROUP BY name ORDER BY total DESC, posts DESC LIMIT ?",
+            (limit,)
+        ).fetchall()
+        return [{"name": name, "mentions": total, "posts": posts} for name, total, posts in rows]
+
+    def monthly_counts(self, names: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+        """
+        종목별 월간 언급 횟수
+
+        Args:
+            names: 대상 종목 (None이면 전체)
+
+        Returns:
+            종목명 → {"YYYY-MM": 언급 횟수}
+        """
+        query = (
+            "SELECT m.name, s.month, SUM(m.count) FROM mentions m "
+            "JOIN scanned s ON s.srl = m.srl WHERE s.month IS NOT NULL"
+        )
+        params: Tuple = ()
+        if names:
+            query += f" AND m.name IN ({','.join('?' * len(names))})"
+            params = tuple(names)
+        query += " GROUP BY m.name, s.month ORDER BY s.month"
+
+        result: Dict[str, Dict[str, int]] = {}
+        for name, month, total in self.conn.execute(query, params):
+            result.setdefault(name, {})[month] = total
+        return result
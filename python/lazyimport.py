@@ -0,0 +1,40 @@
+"""
+패키지 공개 이름의 지연 로딩
+__init__.py에서 무거운 하위 모듈(Playwright, BeautifulSoup 등)을 바로 불러오지 않고
+이름을 처음 사용할 때 해당 하위 모듈을 불러오도록 함 (PEP 562 모듈 __getattr__)
+"""
+
+import importlib
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable, List[str]]:
+    """
+    패키지의 __getattr__, __dir__, __all__ 생성
+
+    사용 예:
+        __getattr__, __dir__, __all__ = lazy_exports(__name__, {
+            'parse_post_html': '.parser',
+        })
+
+    Args:
+        package: 패키지 이름 (__name__)
+        exports: 공개 이름 → 정의된 하위 모듈 (상대 경로)
+
+    Returns:
+        (__getattr__, __dir__, __all__)
+    """
+    def __getattr__(name: str):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(module_name, package)
+        value = getattr(module, name)
+        # 다음 접근부터는 일반 속성으로 조회되도록 캐시
+        setattr(importlib.import_module(package), name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package))) | set(exports))
+
+    return __getattr__, __dir__, list(exports)
@@ -1,87 +1,372 @@
 """
 FM Korea 투자 패턴 분석 CLI
 Tauri에서 호출되는 메인 스크립트
+
+첫 이벤트를 최대한 빨리 출력하도록 Playwright / BeautifulSoup / exporter / index는
+각 모드가 실제로 필요로 할 때 불러옴 (benchmarks/bench_startup.py로 검증)
 """
 
-import asyncio
 import json
 import sys
 from pathlib import Path
-from scraper import collect_posts_by_member, collect_posts
+from events import emit_event, emit_progress, flush_events
+from metrics import enable_metrics, enable_from_env, emit_metrics
 
 
 async def main():
     """메인 실행 함수"""
     
-    # 디버그: 스크립트 시작 확인
-    import os
-    print(json.dumps({"debug": "Python script started", "cwd": os.getcwd(), "args": sys.argv}, ensure_ascii=False))
-    sys.stdout.flush()
+    # 계측 옵션 (--metrics 또는 FMK_METRICS=1)
+    enable_from_env()
+    if pop_flag("--metrics"):
+        enable_metrics()
+    
+    # 중단된 수집 이어서 하기 (member / urls 모드)
+    resume = pop_flag("--resume")
+    
+    # 멀티 프로세스 수집 (--workers N, 1이면 단일 프로세스)
+    workers = int(pop_option("--workers", "1"))
+    
+    # 분산 수집 워커: 큐가 비어도 종료하지 않고 새 작업 대기
+    follow = pop_flag("--follow")
+    
+    # 모바일 사이트로 수집 (--mobile 또는 FMK_MOBILE=1, 페이지가 가벼워 전송량 / 파싱 시간 감소)
+    mobile = pop_flag("--mobile")
+    
+    # 감시 / 카운터 갱신 모드: 게시물을 저장하면 NotebookLM 내보내기에 추가, 감시 폴링 횟수 (0이면 무한)
+    append_export = pop_flag("--export")
+    max_polls = int(pop_option("--polls", "0"))
+    
+    # 작성일 구간 (--since 30d / 2026-01-05, --until 2026-01-31): 목록 작성일로 걸러 구간 밖 게시물은 상세 수집하지 않음
+    since_text = pop_option("--since", "")
+    until_text = pop_option("--until", "")
+    
+    # 분산 수집 작업 큐 (--queue sqlite:///공유/경로/work.sqlite 또는 redis://호스트:6379/0)
+    queue_option = pop_option("--queue", "")
     
     # 커맨드 라인 인자 파싱
     if len(sys.argv) < 3:
-        print(json.dumps({"error": "사용법: python main.py <mode> <data>"}))
+        emit_event("error", message="사용법: python main.py <mode> <data>")
         sys.exit(1)
     
-    mode = sys.argv[1]  # "member" 또는 "urls"
-    data = sys.argv[2]  # 회원번호 또는 URL 리스트 (JSON)
+    mode = sys.argv[1]  # "member", "urls", "retry", "distributed", "worker", "watch", "refresh", "export", "timeline", "search" 또는 "mentions"
+    data = sys.argv[2]  # 회원번호, URL 리스트 (JSON), 에러 종류, 회원번호 (쉼표 구분), 큐 주소, 내보내기 형식, 집계 단위, 검색어 또는 상위 개수
     
     # 출력 디렉토리 설정
     output_dir = Path(__file__).parent.parent / "data" / "raw"
     
-    # 기존 데이터 정리 (새로운 분석을 위해)
-    if output_dir.exists():
+    since = until = None
+    if since_text or until_text:
+        from scraper.dates import parse_date_bound
+        try:
+            since = parse_date_bound(since_text) if since_text else None
+            until = parse_date_bound(until_text, end_of_day=True) if until_text else None
+        except ValueError as e:
+            emit_event("error", message=str(e))
+            sys.exit(1)
+    
+    # 분산 수집 작업 큐 (기본: data/queue/work.sqlite)
+    queue_url = queue_option or str(output_dir.parent / "queue" / "work.sqlite")
+    
+    if mode == "export":
+        # 수집 없이 기존 데이터를 여러 형식으로 내보내기 (코퍼스 1회 읽기)
+        from exporter import export_formats
+        
+        try:
+            files = export_formats(
+                data_dir=str(output_dir),
+                output_dir=str(output_dir.parent / "exports"),
+                formats=[name.strip() for name in data.split(",") if name.strip()],
+                since=since,
+                until=until
+            )
+        except ValueError as e:
+            emit_event("error", message=str(e))
+            sys.exit(1)
+        
+        emit_progress("완료!", 100)
+        emit_event(
+            "result",
+            export_files=files,
+            output_dir=str((output_dir.parent / "exports").absolute())
+        )
+        return
+    
+    if mode == "timeline":
+        # 기간별 게시물 수 (data: day / week / month, 정렬 인덱스만 사용 - 변경 없는 파일은 읽지 않음)
+        from exporter import PostRecords
+        
+        records = PostRecords(
+            str(output_dir),
+            index_file=output_dir.parent / "exports" / ".cache" / "records.json",
+            since=since,
+            until=until
+        )
+        try:
+            counts = records.counts_by_period(data)
+        except ValueError as e:
+            emit_event("error", message=str(e))
+            sys.exit(1)
+        
+        for label, count in counts.items():
+            print(f"📅 {label}: {count}개")
+        emit_progress(f"집계 완료: {len(records)}개 게시물, {len(counts)}개 구간", 100)
+        emit_event("result", period=data, timeline=counts)
+        return
+    
+    if mode == "search":
+        # 로컬 전문 검색 인덱스 조회
+        from index import SearchIndex
+        
+        limit = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+        search_index = SearchIndex(str(output_dir.parent / "index" / "search.sqlite"))
+        if not len(search_index):
+            # 인덱스가 비어 있으면 기존 수집 데이터로 초기 색인
+            search_index.sync_directory(str(output_dir))
+        
+        hits = search_index.search(data, limit=limit)
+        search_index.close()
+        
+        for rank, hit in enumerate(hits, 1):
+            print(f"🔎 {rank}. [{hit['date']}] {hit['title']} ({hit['url']})")
+            print(f"     {hit['snippet']}")
+        emit_progress(f"검색 완료: {len(hits)}건", 100)
+        emit_event("result", query=data, search_results=hits)
+        return
+    
+    if mode == "mentions":
+        # 종목 언급 통계 (새로 추가된 게시물만 스캔)
+        from index import MentionExtractor, MentionIndex
+        
+        index_dir = output_dir.parent / "index"
+        limit = int(data) if data.isdigit() else 20
+        mention_index = MentionIndex(
+            str(index_dir / "mentions.sqlite"),
+            extractor=MentionExtractor.from_file(str(index_dir / "mention_dictionary.json"))
+        )
+        scanned = mention_index.sync_directory(str(output_dir))
+        top = mention_index.top_mentions(limit)
+        monthly = mention_index.monthly_counts([item["name"] for item in top])
+        mention_index.close()
+        
+        print(f"🔍 새로 스캔한 게시물: {scanned}개")
+        for rank, item in enumerate(top, 1):
+            months = ", ".join(f"{month}: {count}" for month, count in monthly.get(item["name"], {}).items())
+            print(f"📈 {rank}. {item['name']} - {item['mentions']}회 ({item['posts']}개 게시물) [{months}]")
+        emit_progress("완료!", 100)
+        emit_event("result", top_mentions=top, monthly_mentions=monthly)
+        return
+    
+    if mobile:
+        from scraper import set_mobile_mode
+        set_mobile_mode(True)
+    
+    if mode == "worker":
+        # 분산 수집 워커 (data: 큐 주소, "default"면 --queue 또는 기본 큐)
+        from workqueue import open_work_queue, run_worker
+        
+        queue = open_work_queue(queue_url if data == "default" else data)
+        try:
+            stats = await run_worker(queue, output_dir=str(output_dir), follow=follow)
+        finally:
+            queue.close()
+        emit_progress("완료!", 100)
+        emit_event("result", worker_stats=stats)
+        return
+    
+    if mode == "watch":
+        # 새 게시물 감시 (data: 회원번호, 쉼표 구분 / 기존 수집 데이터는 지우지 않고 없는 게시물만 추가)
+        await watch_new_posts(
+            member_ids=[member_id.strip() for member_id in data.split(",") if member_id.strip()],
+            output_dir=output_dir,
+            interval=float(sys.argv[3]) if len(sys.argv) > 3 else 300.0,
+            max_polls=max_polls,
+            export=append_export
+        )
+        return
+    
+    if mode == "refresh":
+        # 저장된 게시물의 조회수 / 댓글 수 / 추천 수 재방문 (data: 회원번호 쉼표 구분, "all"이면 목록 없이 상세 페이지로만)
+        from scraper import refresh_counters
+        
+        emit_progress("게시물 카운터 갱신 중...", 0)
+        stats = await refresh_counters(
+            member_ids=[] if data == "all" else [member_id.strip() for member_id in data.split(",") if member_id.strip()],
+            output_dir=str(output_dir),
+            budget=int(sys.argv[3]) if len(sys.argv) > 3 else 50
+        )
+        if append_export and stats["from_listing"] + stats["from_post"]:
+            from exporter import export_to_notebooklm
+            export_to_notebooklm(
+                data_dir=str(output_dir),
+                output_dir=str(output_dir.parent / "notebooklm"),
+                combine=True,
+                incremental=True
+            )
+        emit_progress("완료!", 100)
+        emit_event("result", refresh_stats=stats)
+        return
+    
+    # 수집 저널 (발견한 URL / 완료 / 실패 기록, --resume이면 남은 작업만 수집)
+    from scraper import CrawlJournal, DeadLetterList
+    journal_dir = output_dir.parent / "journal"
+    # retry 모드는 별도 저널에 기록 (중단된 수집의 저널을 덮어쓰지 않고 나중에 --resume 가능)
+    journal = CrawlJournal(str(journal_dir / ("retry.jsonl" if mode == "retry" else "crawl.jsonl")))
+    if resume and not (journal.load() and journal.matches(mode, data)):
+        emit_event("log", level="warning", message="이어서 수집할 저널이 없어 처음부터 수집합니다")
+        resume = False
+    
+    # 재시도 후에도 실패한 게시물 목록 (retry 모드로 다시 수집)
+    dead_letter = DeadLetterList(str(journal_dir / "dead_letter.json"))
+    
+    # 기존 데이터 정리 (새로운 분석을 위해, 이어서 수집하거나 실패 게시물만 다시 수집할 때는 유지)
+    if output_dir.exists() and not resume and mode != "retry":
         try:
             for f in output_dir.glob("*.json"):
                 f.unlink()
+            dead_letter.clear()
         except Exception as e:
-            print(json.dumps({"status": f"경고: 기존 파일 삭제 실패 - {e}", "progress": 0}, ensure_ascii=False))
+            emit_event("log", level="warning", message=f"기존 파일 삭제 실패 - {e}")
     
     # 결과 변수 초기화
     saved_files = []
     
+    # 수집 모드에서만 브라우저 관련 모듈 로딩
+    from scraper import collect_posts_by_member, collect_posts, collect_posts_parallel
+    
+    # 수집과 동시에 전문 검색 / 종목 언급 인덱스 갱신
+    from index import SearchIndex, MentionExtractor, MentionIndex
+    index_dir = output_dir.parent / "index"
+    search_index = SearchIndex(str(index_dir / "search.sqlite"))
+    mention_index = MentionIndex(
+        str(index_dir / "mentions.sqlite"),
+        extractor=MentionExtractor.from_file(str(index_dir / "mention_dictionary.json"))
+    )
+    
+    def on_post_saved(post, filepath):
+        search_index.add_post(post, filepath)
+        mention_index.add_post(post, filepath)
+        journal.record_done(post["url"], filepath)
+        dead_letter.remove(post["url"])
+    
+    def on_post_failed(url, error):
+        journal.record_failed(url, error)
+        dead_letter.add(url, error)
+    
+    async def collect_remaining(urls):
+        """저널에 URL을 기록하고 아직 완료되지 않은 게시물만 수집"""
+        if urls != journal.discovered:
+            journal.record_discovered(urls)
+        pending = journal.remaining()
+        if resume:
+            emit_event(
+                "log",
+                level="info",
+                message=f"이어서 수집: 완료 {len(journal.done)}개, 남은 {len(pending)}개",
+                done=len(journal.done),
+                remaining=len(pending)
+            )
+        if pending and workers > 1:
+            # 워커 프로세스는 파일만 저장하고 인덱스 / 저널은 이 프로세스에서 갱신
+            await collect_posts_parallel(
+                urls=pending,
+                output_dir=str(output_dir),
+                workers=workers,
+                progress_callback=lambda msg, prog: print_progress(msg, prog),
+                post_callback=on_post_saved,
+                failure_callback=on_post_failed
+            )
+        elif pending:
+            await collect_posts(
+                urls=pending,
+                output_dir=str(output_dir),
+                progress_callback=lambda msg, prog: print_progress(msg, prog),
+                post_callback=on_post_saved,
+                failure_callback=on_post_failed
+            )
+        for failure in journal.gave_up():
+            emit_event(
+                "log",
+                level="warning",
+                message=f"재시도 한도 초과: {failure['url']} ({failure['error']})",
+                attempts=failure["attempt"]
+            )
+        # 이전 실행에서 저장한 파일 포함
+        return journal.saved_files()
+    
+    journal.start(mode, data, resume=resume)
+    
     try:
         if mode == "member":
             # 회원번호로 검색
             member_id = data
             max_pages = int(sys.argv[3]) if len(sys.argv) > 3 else 10
             
-            print(json.dumps({"status": "회원번호로 게시물 검색 중...", "progress": 0}, ensure_ascii=False))
-            sys.stdout.flush()
-            
-            # 게시물 URL 수집
-            urls = await collect_posts_by_member(
-                member_id=member_id,
-                max_pages=max_pages,
-                progress_callback=lambda msg, prog: print_progress(msg, prog)
-            )
+            if journal.discovered:
+                # 이어서 수집: 저널에 기록된 URL 재사용 (검색 생략)
+                urls = journal.discovered
+            else:
+                emit_progress("회원번호로 게시물 검색 중...", 0)
+                
+                # 게시물 URL 수집
+                urls = await collect_posts_by_member(
+                    member_id=member_id,
+                    max_pages=max_pages,
+                    progress_callback=lambda msg, prog: print_progress(msg, prog),
+                    output_dir=str(output_dir),
+                    since=since,
+                    until=until
+                )
             
             if not urls:
-                print(json.dumps({"error": "게시물을 찾을 수 없습니다"}, ensure_ascii=False))
+                emit_event("error", message="게시물을 찾을 수 없습니다")
                 sys.exit(1)
             
             # 게시물 상세 수집
-            saved_files = await collect_posts(
-                urls=urls,
-                output_dir=str(output_dir),
-                progress_callback=lambda msg, prog: print_progress(msg, prog)
-            )
+            saved_files = await collect_remaining(urls)
             
         elif mode == "urls":
             # 직접 URL 입력
             urls = json.loads(data)
             
-            print(json.dumps({"status": "게시물 수집 중...", "progress": 0}, ensure_ascii=False))
-            sys.stdout.flush()
+            emit_progress("게시물 수집 중...", 0)
+            
+            saved_files = await collect_remaining(urls)
+        
+        elif mode == "distributed":
+            # 작업 큐로 여러 회원을 여러 워커(다른 머신 포함)가 나눠 수집
+            from workqueue import run_distributed
             
-            saved_files = await collect_posts(
-                urls=urls,
+            max_pages = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+            saved_files = await run_distributed(
+                queue_url=queue_url,
+                member_ids=[member_id.strip() for member_id in data.split(",") if member_id.strip()],
+                max_pages=max_pages,
                 output_dir=str(output_dir),
-                progress_callback=lambda msg, prog: print_progress(msg, prog)
+                workers=workers,
+                refresh=not resume,
+                progress_callback=lambda msg, prog: print_progress(msg, prog),
+                post_callback=on_post_saved,
+                failure_callback=on_post_failed,
+                since=since,
+                until=until
             )
         
+        elif mode == "retry":
+            # 실패 목록의 게시물만 다시 수집 (data: "all" 또는 "timeout,challenge" 등 에러 종류)
+            kinds = None if data == "all" else [kind.strip() for kind in data.split(",") if kind.strip()]
+            urls = dead_letter.urls(kinds)
+            
+            if not urls:
+                emit_event("error", message="다시 수집할 실패 게시물이 없습니다")
+                sys.exit(1)
+            
+            emit_progress(f"실패 게시물 {len(urls)}개 다시 수집 중...", 0)
+            
+            saved_files = await collect_remaining(urls)
+        
         else:
-            print(json.dumps({"error": f"알 수 없는 모드: {mode}"}, ensure_ascii=False))
+            emit_event("error", message=f"알 수 없는 모드: {mode}")
             sys.exit(1)
             
     except Exception as e:
@@ -90,55 +375,147 @@ async def main():
              # data/raw 에 최신 파일들이 있다면 그걸로 간주
              pass
         else:
-             print(json.dumps({"status": f"수집 중 에러 발생: {e}", "progress": 50}, ensure_ascii=False))
+             emit_event("log", level="error", message=f"수집 중 에러 발생: {e}")
              sys.stderr.write(f"Error during collection: {e}\n")
 
+    finally:
+        search_index.close()
+        mention_index.close()
+        # 실행 종료 시 저널을 현재 상태만 남도록 압축 (강제 종료 시에는 기록된 그대로 남음)
+        journal.compact()
+
     # 변환 단계 (에러가 발생했더라도 수집된 파일이 있으면 시도)
     try:
         # 디버그: 변환 단계 시작
-        print(json.dumps({"debug": "Starting conversion phase", "output_dir": str(output_dir)}, ensure_ascii=False))
-        sys.stdout.flush()
+        emit_event("log", level="debug", message="Starting conversion phase", output_dir=str(output_dir))
         
         # NotebookLM 형식으로 자동 변환
-        print(json.dumps({"status": "NotebookLM 형식으로 변환 중...", "progress": 95}, ensure_ascii=False))
-        sys.stdout.flush()
+        emit_progress("NotebookLM 형식으로 변환 중...", 95)
         
         from exporter import export_to_notebooklm, create_analysis_guide
         
         notebooklm_files = export_to_notebooklm(
             data_dir=str(output_dir),
             output_dir=str(output_dir.parent / "notebooklm"),
-            combine=True  # 하나의 파일로 통합
+            combine=True,  # 하나의 파일로 통합
+            incremental=True,  # 새로 추가/변경된 게시물만 렌더링
+            workers=workers  # 기본은 직렬 (--workers N이면 캐시 미스가 많을 때 N개 프로세스로 렌더링)
         )
         
         # 분석 가이드 생성
         guide_file = create_analysis_guide(str(output_dir.parent / "notebooklm"))
         
         # 최종 결과 출력
-        result = {
-            "status": "완료!",
-            "progress": 100,
-            "saved_files": saved_files if saved_files else notebooklm_files, # UI 표시용
-            "total_files": len(saved_files),
-            "output_dir": str((output_dir.parent / "notebooklm").absolute()),  # notebooklm 폴더로 변경
-            "notebooklm_files": notebooklm_files,
-            "guide_file": guide_file
-        }
-        print(json.dumps(result, ensure_ascii=False))
+        emit_progress("완료!", 100)
+        emit_event(
+            "result",
+            saved_files=saved_files if saved_files else notebooklm_files,  # UI 표시용
+            total_files=len(saved_files),
+            output_dir=str((output_dir.parent / "notebooklm").absolute()),  # notebooklm 폴더로 변경
+            notebooklm_files=notebooklm_files,
+            guide_file=guide_file
+        )
         
     except Exception as e:
-        print(json.dumps({"error": f"변환 중 에러: {e}"}, ensure_ascii=False))
+        emit_event("error", message=f"변환 중 에러: {e}")
         sys.exit(1)
 
 
+async def watch_new_posts(member_ids, output_dir: Path, interval: float, max_polls: int, export: bool):
+    """감시 모드: 새 게시물마다 new_post 이벤트 + 검색 / 종목 언급 인덱스 갱신, export면 폴링마다 내보내기에 추가"""
+    from scraper import watch_members
+    from index import SearchIndex, MentionExtractor, MentionIndex
+    
+    index_dir = output_dir.parent / "index"
+    search_index = SearchIndex(str(index_dir / "search.sqlite"))
+    mention_index = MentionIndex(
+        str(index_dir / "mentions.sqlite"),
+        extractor=MentionExtractor.from_file(str(index_dir / "mention_dictionary.json"))
+    )
+    
+    def on_new_post(member_id, post, filepath):
+        search_index.add_post(post, filepath)
+        mention_index.add_post(post, filepath)
+        emit_event(
+            "new_post",
+            member_id=member_id,
+            url=post["url"],
+            title=post.get("title", ""),
+            date=post.get("date", ""),
+            file=filepath
+        )
+    
+    def on_poll(poll, new_files):
+        emit_progress(f"폴링 {poll}회 완료: 새 게시물 {len(new_files)}개", 100 * poll / max_polls if max_polls else 0)
+        if not (export and new_files):
+            return
+        # 증분 내보내기: 새 게시물만 렌더링해 통합 파일에 추가
+        from exporter import export_to_notebooklm
+        files = export_to_notebooklm(
+            data_dir=str(output_dir),
+            output_dir=str(output_dir.parent / "notebooklm"),
+            combine=True,
+            incremental=True
+        )
+        emit_event("log", level="info", message=f"내보내기에 새 게시물 {len(new_files)}개 추가", notebooklm_files=files)
+    
+    emit_progress(f"회원 {len(member_ids)}명 새 게시물 감시 중...", 0)
+    try:
+        stats = await watch_members(
+            member_ids=member_ids,
+            output_dir=str(output_dir),
+            interval=interval,
+            max_polls=max_polls,
+            new_post_callback=on_new_post,
+            poll_callback=on_poll
+        )
+    finally:
+        search_index.close()
+        mention_index.close()
+    
+    emit_progress("완료!", 100)
+    emit_event("result", watch_stats=stats)
+
+
+def print_started():
+    """디버그: 스크립트 시작 확인 (Tauri가 받는 첫 이벤트)"""
+    import os
+    emit_event("log", level="debug", message="Python script started", cwd=os.getcwd(), args=sys.argv)
+
+
+def pop_flag(name: str) -> bool:
+    """sys.argv에서 플래그를 찾아 제거 (위치 인자 파싱에 영향이 없도록)"""
+    if name in sys.argv:
+        sys.argv.remove(name)
+        return True
+    return False
+
+
+def pop_option(name: str, default: str) -> str:
+    """sys.argv에서 값이 있는 옵션(--name 값)을 찾아 제거"""
+    if name in sys.argv:
+        idx = sys.argv.index(name)
+        if idx + 1 < len(sys.argv):
+            value = sys.argv[idx + 1]
+            del sys.argv[idx:idx + 2]
+            return value
+        sys.argv.remove(name)
+    return default
+
+
 def print_progress(message: str, progress: float):
-    """진행률 출력 (Tauri가 파싱)"""
-    print(json.dumps({
-        "status": message,
-        "progress": int(progress)
-    }, ensure_ascii=False))
-    sys.stdout.flush()
+    """진행률 출력 (Tauri가 파싱, 초당 최대 FMK_PROGRESS_HZ회로 병합)"""
+    emit_progress(message, progress)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # 첫 이벤트는 asyncio 로딩(수십 ms) 전에 출력
+    print_started()
+    import asyncio
+    
+    try:
+        asyncio.run(main())
+    finally:
+        # 병합되어 대기 중인 진행률과 단계별 계측 요약 (계측이 꺼져 있으면 출력 없음)
+        flush_events()
+        emit_metrics()
@@ -0,0 +1,25 @@
+"""실행 계측 모듈 (단계별 소요 시간 히스토그램)"""
+
+from .timing import (
+    span,
+    record,
+    snapshot,
+    emit_metrics,
+    enable_metrics,
+    disable_metrics,
+    enable_from_env,
+    metrics_enabled,
+    StageHistogram,
+)
+
+__all__ = [
+    'span',
+    'record',
+    'snapshot',
+    'emit_metrics',
+    'enable_metrics',
+    'disable_metrics',
+    'enable_from_env',
+    'metrics_enabled',
+    'StageHistogram',
+]
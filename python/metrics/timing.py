@@ -0,0 +1,180 @@
+"""
+단계별 소요 시간 계측
+span()으로 감싼 구간을 단계별 지연 시간 히스토그램(p50/p95/max, count, total)으로 집계하고
+실행 종료 시 metric 이벤트(events 프로토콜)로 출력 (장시간 실행 중에는 주기적 스냅샷도 출력)
+
+계측이 꺼져 있으면 span()은 공유 no-op 컨텍스트를 돌려주므로 비용이 거의 없음
+"""
+
+import math
+import os
+import time
+from typing import Dict, Optional
+
+# 히스토그램 버킷: 1µs부터 2^(1/8) 배씩 증가 (상대 오차 약 9%)
+_MIN_SEC = 1e-6
+_GROWTH = 2 ** (1 / 8)
+_LOG_GROWTH = math.log(_GROWTH)
+
+DEFAULT_SNAPSHOT_INTERVAL = 30.0
+
+
+class StageHistogram:
+    """한 단계의 로그 스케일 지연 시간 히스토그램"""
+
+    __slots__ = ('count', 'total', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets: Dict[int, int] = {}
+
+    def record(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+        idx = 0 if seconds <= _MIN_SEC else math.ceil(math.log(seconds / _MIN_SEC) / _LOG_GROWTH)
+        self.buckets[idx] = self.buckets.get(idx, 0) + 1
+
+    def percentile(self, q: float) -> float:
+        """q (0~1) 분위수의 근사값 (버킷 상한, 최대값으로 제한)"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if seen >= rank:
+                return min(_MIN_SEC * _GROWTH ** idx, self.max)
+        return self.max
+
+    def summary(self) -> Dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total * 1000, 3),
+            "p50_ms": round(self.percentile(0.50) * 1000, 3),
+            "p95_ms": round(self.percentile(0.95) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class _NullSpan:
+    """계측이 꺼져 있을 때 사용하는 no-op 컨텍스트"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Span:
+    __slots__ = ('name', 'start')
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+_enabled = False
+_stages: Dict[str, StageHistogram] = {}
+_started_at = time.perf_counter()
+_snapshot_interval = DEFAULT_SNAPSHOT_INTERVAL
+_last_snapshot = _started_at
+
+
+def enable_metrics(snapshot_interval: Optional[float] = None):
+    """
+    계측 활성화 (기존 집계는 초기화)
+
+    Args:
+        snapshot_interval: 주기적 스냅샷 간격 (초, 0이면 스냅샷 없음)
+    """
+    global _enabled, _started_at, _last_snapshot, _snapshot_interval
+    _enabled = True
+    _stages.clear()
+    _started_at = _last_snapshot = time.perf_counter()
+    if snapshot_interval is not None:
+        _snapshot_interval = snapshot_interval
+
+
+def disable_metrics():
+    """계측 비활성화 (집계는 유지)"""
+    global _enabled
+    _enabled = False
+
+
+def metrics_enabled() -> bool:
+    return _enabled
+
+
+def span(name: str):
+    """
+    계측 구간 컨텍스트 매니저
+
+    사용 예:
+        with span("post.goto"):
+            await page.goto(url)
+
+    Args:
+        name: 단계 이름 (예: "post.goto", "parse.content")
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def record(name: str, seconds: float):
+    """단계 소요 시간 직접 기록"""
+    if not _enabled:
+        return
+    hist = _stages.get(name)
+    if hist is None:
+        hist = _stages[name] = StageHistogram()
+    hist.record(seconds)
+    _maybe_snapshot()
+
+
+def snapshot() -> Dict:
+    """현재까지의 단계별 요약"""
+    return {
+        "elapsed_s": round(time.perf_counter() - _started_at, 3),
+        "stages": {name: hist.summary() for name, hist in sorted(_stages.items())},
+    }
+
+
+def emit_metrics(final: bool = True):
+    """metric 이벤트 출력 (계측이 꺼져 있으면 아무것도 하지 않음)"""
+    if not _enabled:
+        return
+    from events import emit_event
+    emit_event("metric", metrics=snapshot(), final=final)
+
+
+def _maybe_snapshot():
+    global _last_snapshot
+    if not _snapshot_interval:
+        return
+    now = time.perf_counter()
+    if now - _last_snapshot >= _snapshot_interval:
+        _last_snapshot = now
+        emit_metrics(final=False)
+
+
+def enable_from_env():
+    """FMK_METRICS=1이면 계측 활성화 (FMK_METRICS_INTERVAL로 스냅샷 간격 지정)"""
+    if os.environ.get("FMK_METRICS") == "1":
+        interval = os.environ.get("FMK_METRICS_INTERVAL")
+        enable_metrics(float(interval) if interval else None)
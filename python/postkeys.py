@@ -0,0 +1,97 @@
+"""
+게시물 식별 / 정렬 / 기간 키
+수집(scraper, workqueue)과 내보내기 / 인덱스(exporter, index)가 함께 쓰는 표준 라이브러리 전용 모듈
+(패키지끼리 서로 불러오지 않도록 공통 키 계산만 여기에 둠)
+"""
+
+import hashlib
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict
+
+# 기간 라벨 시각대 (한국 시간)
+KST = timezone(timedelta(hours=9))
+
+# 기간별 집계 단위
+PERIODS = ("day", "week", "month")
+
+
+def get_post_id(post: Dict) -> int:
+    """
+    게시물 URL에서 document_srl 추출 (정렬 키)
+
+    Args:
+        post: 게시물 데이터 딕셔너리
+
+    Returns:
+        document_srl 정수 (찾지 못하면 0)
+    """
+    url = post.get('url', '')
+    # document_srl=12345... 패턴 찾기
+    match = re.search(r'document_srl=(\d+)', url)
+    if match:
+        return int(match.group(1))
+    # /12345678 패턴 (단축 URL)
+    match = re.search(r'/(\d{7,})', url)
+    if match:
+        return int(match.group(1))
+    return 0
+
+
+def get_post_time(post: Dict) -> int:
+    """
+    게시물 작성 시각 (epoch 초, 정렬 / 구간 조회 키)
+
+    파서가 기록한 timestamp(ISO 8601)를 쓰고, timestamp가 없는 예전 파일은 원본 작성일 표기를 해석
+
+    Args:
+        post: 게시물 데이터 딕셔너리
+
+    Returns:
+        epoch 초 (알 수 없으면 0)
+    """
+    timestamp = post.get('timestamp')
+    if timestamp:
+        try:
+            return int(datetime.fromisoformat(timestamp).timestamp())
+        except (TypeError, ValueError):
+            pass
+    # 예전 파일에서만 필요 (scraper.dates는 표준 라이브러리만 사용하고 다른 패키지를 불러오지 않음)
+    from scraper.dates import parse_post_date
+    posted = parse_post_date(post.get('date') or '')
+    return int(posted.timestamp()) if posted else 0
+
+
+def content_hash(post: Dict) -> str:
+    """
+    게시물 데이터의 내용 해시 계산 (키 순서와 무관)
+
+    Args:
+        post: 게시물 데이터 딕셔너리
+
+    Returns:
+        SHA-1 16진수 문자열
+    """
+    canonical = json.dumps(post, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def period_label(ts: int, period: str = "month") -> str:
+    """
+    작성 시각의 기간 라벨
+
+    Args:
+        ts: epoch 초
+        period: "day" (2026-01-05), "week" (2026-W02, ISO 주), 그 외 "month" (2026-01)
+
+    Returns:
+        라벨 문자열 (사전순 = 시간순)
+    """
+    moment = datetime.fromtimestamp(ts, KST)
+    if period == "day":
+        return moment.strftime("%Y-%m-%d")
+    if period == "week":
+        year, week, _ = moment.isocalendar()
+        return f"{year}-W{week:02d}"
+    return moment.strftime("%Y-%m")
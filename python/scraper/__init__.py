@@ -1,17 +1,38 @@
-"""FM Korea 스크래퍼 패키지"""
+"""FM Korea 스크래퍼 패키지 (Playwright / BeautifulSoup은 해당 기능을 처음 사용할 때 로딩)"""
 
-from .browser import create_stealth_browser, create_context, handle_cloudflare_challenge, random_delay
-from .collector import collect_posts_by_member, collect_posts, extract_post_data
-from .parser import parse_post_html, extract_metadata
+from lazyimport import lazy_exports
 
-__all__ = [
-    'create_stealth_browser',
-    'create_context',
-    'handle_cloudflare_challenge',
-    'random_delay',
-    'collect_posts_by_member',
-    'collect_posts',
-    'extract_post_data',
-    'parse_post_html',
-    'extract_metadata',
-]
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    'create_stealth_browser': '.browser',
+    'create_context': '.browser',
+    'handle_cloudflare_challenge': '.browser',
+    'random_delay': '.browser',
+    'set_delay_scale': '.browser',
+    'get_delay_scale': '.browser',
+    'set_mobile_mode': '.browser',
+    'is_mobile_mode': '.browser',
+    'collect_posts_by_member': '.collector',
+    'collect_posts': '.collector',
+    'extract_post_data': '.collector',
+    'parse_post_html': '.parser',
+    'extract_metadata': '.parser',
+    'extract_content': '.parser',
+    'detect_layout': '.parser',
+    'parse_listing_html': '.parser',
+    'parse_listing_date': '.dates',
+    'parse_post_date': '.dates',
+    'parse_date_bound': '.dates',
+    'CrawlJournal': '.journal',
+    'DeadLetterList': '.journal',
+    'RetryPolicy': '.retry',
+    'CircuitBreaker': '.retry',
+    'CrawlError': '.retry',
+    'PageWatchdog': '.watchdog',
+    'AssetCache': '.assetcache',
+    'collect_posts_parallel': '.pool',
+    'SharedRateLimiter': '.pool',
+    'watch_members': '.watch',
+    'refresh_counters': '.freshness',
+    'record_counters': '.freshness',
+    'revisit_priority': '.freshness',
+})
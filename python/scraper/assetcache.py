@@ -0,0 +1,262 @@
+"""
+정적 에셋 디스크 캐시
+브라우저는 실행마다 새 프로필로 시작하므로 CSS / JS / 폰트를 매번 다시 내려받음
+컨텍스트의 요청을 가로채(route) 정적 에셋은 로컬 디스크 캐시에서 응답하고,
+만료된 항목은 ETag / Last-Modified로 재검증하며, 크기 한도를 넘으면 오래 쓰지 않은 항목부터 삭제 (LRU)
+문서(HTML)와 그 외 요청은 항상 네트워크로 전달
+
+항목마다 본문(<키>.bin)과 메타데이터(<키>.json)를 따로 저장하므로 여러 워커 프로세스가 같은 디렉토리를 공유 가능
+(마지막 사용 시각은 메타데이터 파일의 수정 시각)
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from playwright.async_api import BrowserContext, Request, Route
+
+from metrics import span
+
+# 캐시 크기 한도 (MB)
+MAX_CACHE_MB = 200
+
+# 에셋 캐시 사용 여부 (환경 변수 FMK_ASSET_CACHE=0이면 끔)
+ASSET_CACHE = os.environ.get("FMK_ASSET_CACHE", "1") != "0"
+
+# 가로채는 요청 URL (나머지 요청은 핸들러를 거치지 않아 추가 지연 없음)
+CACHEABLE_URL = re.compile(r"\.(css|js|mjs|woff2?|ttf|otf|eot)(\?|$)", re.IGNORECASE)
+
+# 캐시하는 요청 종류와 응답 Content-Type
+CACHEABLE_RESOURCE_TYPES = ("stylesheet", "script", "font")
+CACHEABLE_CONTENT_TYPES = ("text/css", "javascript", "font/", "application/font", "application/x-font")
+
+# Cache-Control max-age가 없을 때 재검증 없이 쓰는 기간 (초)
+DEFAULT_MAX_AGE = 3600
+
+# 본문과 함께 돌려주는 응답 헤더
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+# 크기 합계를 디렉토리에서 다시 계산하는 주기 (저장 횟수, 다른 프로세스가 쓴 항목 반영)
+RESCAN_EVERY = 50
+
+
+def _max_age(cache_control: str) -> Optional[int]:
+    """Cache-Control의 max-age (no-store / no-cache면 0, 없으면 None)"""
+    directives = cache_control.lower()
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+    match = re.search(r"max-age=(\d+)", directives)
+    return int(match.group(1)) if match else None
+
+
+def open_asset_cache(cache_dir: str) -> Optional["AssetCache"]:
+    """
+    에셋 캐시 열기 (FMK_ASSET_CACHE=0이거나 디렉토리를 만들 수 없으면 None)
+
+    Args:
+        cache_dir: 캐시 디렉토리
+
+    Returns:
+        AssetCache 인스턴스 또는 None
+    """
+    if not ASSET_CACHE:
+        return None
+    try:
+        return AssetCache(cache_dir)
+    except OSError as e:
+        print(f"⚠️  에셋 캐시를 사용할 수 없습니다 (캐시 없이 수집): {e}")
+        return None
+
+
+class AssetCache:
+    """디스크 기반 정적 에셋 캐시 (BrowserContext.route 핸들러)"""
+
+    def __init__(self, cache_dir: str = "data/cache/assets", max_mb: float = MAX_CACHE_MB):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_mb: 캐시 크기 한도 (MB)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._stores = 0
+        self._total_bytes = self._scan()
+        self.stats = {
+            "hits": 0, "revalidated": 0, "misses": 0, "stored": 0, "evicted": 0,
+            "bytes_from_cache": 0, "bytes_from_network": 0,
+        }
+
+    async def attach(self, context: BrowserContext):
+        """
+        컨텍스트의 정적 에셋 요청(CACHEABLE_URL)에 캐시 핸들러 등록
+
+        Args:
+            context: BrowserContext 인스턴스
+        """
+        await context.route(CACHEABLE_URL, self.handle)
+
+    def _paths(self, url: str):
+        key = hashlib.sha1(url.encode()).hexdigest()
+        return self.cache_dir / f"{key}.bin", self.cache_dir / f"{key}.json"
+
+    def _load(self, url: str) -> Optional[Dict]:
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            if meta.get("url") != url or not body_path.exists():
+                return None
+            return meta
+        except (OSError, ValueError):
+            return None
+
+    async def handle(self, route: Route, request: Request):
+        """route 핸들러: 정적 에셋은 캐시에서, 나머지는 네트워크로"""
+        if request.method != "GET" or request.resource_type not in CACHEABLE_RESOURCE_TYPES:
+            await route.fallback()
+            return
+
+        try:
+            with span("asset.cache"):
+                await self._serve(route, request)
+        except Exception:
+            # 캐시 오류나 취소된 요청은 브라우저가 직접 처리하도록 넘김 (이미 응답했으면 무시)
+            try:
+                await route.fallback()
+            except Exception:
+                pass
+
+    async def _serve(self, route: Route, request: Request):
+        url = request.url
+        body_path, meta_path = self._paths(url)
+        meta = self._load(url)
+
+        if meta and time.time() < meta["expires"]:
+            await self._fulfill_cached(route, meta, body_path, meta_path)
+            self.stats["hits"] += 1
+            return
+
+        headers = dict(request.headers)
+        if meta:
+            # 만료된 항목은 조건부 요청으로 재검증
+            if meta["headers"].get("etag"):
+                headers["if-none-match"] = meta["headers"]["etag"]
+            if meta["headers"].get("last-modified"):
+                headers["if-modified-since"] = meta["headers"]["last-modified"]
+
+        response = await route.fetch(headers=headers)
+        if response.status == 304 and meta:
+            meta["expires"] = time.time() + self._lifetime(response.headers.get("cache-control", ""))
+            self._write(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+            await self._fulfill_cached(route, meta, body_path, meta_path)
+            self.stats["revalidated"] += 1
+            return
+
+        body = await response.body()
+        self.stats["misses"] += 1
+        self.stats["bytes_from_network"] += len(body)
+        if self._cacheable(response.status, response.headers):
+            self._store(url, response.headers, body, body_path, meta_path)
+        await route.fulfill(response=response, body=body)
+
+    async def _fulfill_cached(self, route: Route, meta: Dict, body_path: Path, meta_path: Path):
+        body = body_path.read_bytes()
+        await route.fulfill(status=200, headers=meta["headers"], body=body)
+        self.stats["bytes_from_cache"] += len(body)
+        try:
+            # 메타데이터 수정 시각 = 마지막 사용 시각 (LRU)
+            os.utime(meta_path)
+        except OSError:
+            pass
+
+    def _lifetime(self, cache_control: str) -> int:
+        max_age = _max_age(cache_control)
+        return DEFAULT_MAX_AGE if max_age is None else max_age
+
+    def _cacheable(self, status: int, headers: Dict[str, str]) -> bool:
+        content_type = headers.get("content-type", "").lower()
+        if status != 200 or not any(kind in content_type for kind in CACHEABLE_CONTENT_TYPES):
+            return False
+        # no-store만 제외 (no-cache / max-age=0은 저장하되 매번 재검증)
+        return "no-store" not in headers.get("cache-control", "").lower()
+
+    def _store(self, url: str, headers: Dict[str, str], body: bytes, body_path: Path, meta_path: Path):
+        if len(body) > self.max_bytes:
+            return
+        meta = {
+            "url": url,
+            "size": len(body),
+            "expires": time.time() + self._lifetime(headers.get("cache-control", "")),
+            "headers": {name: headers[name] for name in STORED_HEADERS if name in headers},
+        }
+        try:
+            self._write(body_path, body)
+            self._write(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+        except OSError:
+            return
+        self.stats["stored"] += 1
+        self._total_bytes += len(body)
+        self._stores += 1
+        if self._stores % RESCAN_EVERY == 0:
+            self._total_bytes = self._scan()
+        if self._total_bytes > self.max_bytes:
+            self.evict()
+
+    def _write(self, path: Path, data: bytes):
+        """프로세스별 임시 파일에 쓰고 교체 (다른 워커가 같은 항목을 동시에 써도 안전)"""
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _entries(self) -> list:
+        """(마지막 사용 시각, 크기, 메타데이터 경로) 목록"""
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                used = meta_path.stat().st_mtime
+                size = meta_path.with_suffix(".bin").stat().st_size
+            except OSError:
+                continue
+            entries.append((used, size, meta_path))
+        return entries
+
+    def _scan(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self, target_ratio: float = 0.9):
+        """
+        크기 한도의 target_ratio 이하가 될 때까지 오래 쓰지 않은 항목부터 삭제
+
+        Args:
+            target_ratio: 삭제 후 목표 크기 비율
+        """
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * target_ratio
+        for _, size, meta_path in entries:
+            if total <= target:
+                break
+            for path in (meta_path, meta_path.with_suffix(".bin")):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+            total -= size
+            self.stats["evicted"] += 1
+        self._total_bytes = total
+
+    def summary(self) -> str:
+        """실행 요약 한 줄"""
+        stats = self.stats
+        served = stats["hits"] + stats["revalidated"]
+        requests = served + stats["misses"]
+        hit_rate = served / requests if requests else 0.0
+        return (f"🗃️  에셋 캐시: 적중 {served}/{requests}회 ({hit_rate:.0%}, 재검증 {stats['revalidated']}회), "
+                f"캐시에서 {stats['bytes_from_cache'] / 1024 / 1024:.1f}MB / "
+                f"네트워크 {stats['bytes_from_network'] / 1024 / 1024:.1f}MB, "
+                f"저장 {stats['stored']}개, 삭제 {stats['evicted']}개")
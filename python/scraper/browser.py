@@ -4,9 +4,20 @@ Cloudflare 우회를 위한 스텔스 모드 적용
 """
 
 import asyncio
+import os
 import random
+from typing import Optional
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
+# 랜덤 지연 배율 (벤치마크에서 0으로 두면 지연 없이 측정)
+_delay_scale = float(os.environ.get("FMK_DELAY_SCALE", "1"))
+
+# 모바일 사이트 모드 (m.fmkorea.com - 광고/사이드바가 적어 페이지가 가볍고 파싱이 빠름)
+_mobile_mode = os.environ.get("FMK_MOBILE", "") == "1"
+
+DESKTOP_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+MOBILE_USER_AGENT = "Mozilla/5.0 (Linux; Android 14; SM-S918N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36"
+
 
 async def create_stealth_browser(headless: bool = False) -> Browser:
     """
@@ -32,21 +43,35 @@ async def create_stealth_browser(headless: bool = False) -> Browser:
     return browser
 
 
-async def create_context(browser: Browser) -> BrowserContext:
+async def create_context(browser: Browser, mobile: Optional[bool] = None, javascript: bool = True) -> BrowserContext:
     """
     실제 사용자처럼 보이는 브라우저 컨텍스트 생성
     
     Args:
         browser: Browser 인스턴스
+        mobile: 모바일 기기로 접속 (기본: 모바일 사이트 모드 설정을 따름)
+        javascript: False면 JavaScript 실행을 끈 컨텍스트 (서버 렌더링된 게시물 페이지용)
     
     Returns:
         BrowserContext 인스턴스
     """
-    user_agent_string = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    if mobile is None:
+        mobile = _mobile_mode
+    
+    if mobile:
+        device = {
+            'user_agent': MOBILE_USER_AGENT,
+            'viewport': {'width': 412, 'height': 915},
+            'device_scale_factor': 2.625,
+            'is_mobile': True,
+            'has_touch': True,
+        }
+    else:
+        device = {'user_agent': DESKTOP_USER_AGENT, 'viewport': {'width': 1920, 'height': 1080}}
     
     context = await browser.new_context(
-        user_agent=user_agent_string,
-        viewport={'width': 1920, 'height': 1080},
+        **device,
+        java_script_enabled=javascript,
         locale='ko-KR',
         timezone_id='Asia/Seoul',
     )
@@ -85,6 +110,38 @@ async def handle_cloudflare_challenge(page: Page, timeout: int = 10) -> bool:
         return False
 
 
+def set_delay_scale(scale: float):
+    """
+    random_delay 지연 배율 설정 (환경 변수 FMK_DELAY_SCALE로도 지정 가능)
+    
+    Args:
+        scale: 배율 (1.0 = 기본값, 0 = 지연 없음)
+    """
+    global _delay_scale
+    _delay_scale = scale
+
+
+def get_delay_scale() -> float:
+    """현재 random_delay 지연 배율 (워커 프로세스에 전달용)"""
+    return _delay_scale
+
+
+def set_mobile_mode(enabled: bool):
+    """
+    모바일 사이트 모드 설정 (환경 변수 FMK_MOBILE=1로도 지정 가능)
+    
+    Args:
+        enabled: True면 모바일 기기 컨텍스트로 m.fmkorea.com 페이지를 수집
+    """
+    global _mobile_mode
+    _mobile_mode = enabled
+
+
+def is_mobile_mode() -> bool:
+    """현재 모바일 사이트 모드 여부 (워커 프로세스에 전달용)"""
+    return _mobile_mode
+
+
 async def random_delay(min_sec: float = 2.0, max_sec: float = 5.0):
     """
     랜덤 지연 시간 추가 (봇 탐지 우회)
@@ -93,5 +150,5 @@ async def random_delay(min_sec: float = 2.0, max_sec: float = 5.0):
         min_sec: 최소 대기 시간 (초)
         max_sec: 최대 대기 시간 (초)
     """
-    delay = random.uniform(min_sec, max_sec)
+    delay = random.uniform(min_sec, max_sec) * _delay_scale
     await asyncio.sleep(delay)
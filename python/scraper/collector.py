@@ -4,70 +4,153 @@ FM Korea 게시물 수집 모듈
 """
 
 import asyncio
+import hashlib
 import json
 import sys
+from pathlib import Path
+from datetime import datetime
 from typing import List, Dict, Callable, Optional
 from playwright.async_api import Page
-from .browser import create_stealth_browser, create_context, handle_cloudflare_challenge, random_delay
-from .parser import parse_post_html
+from .browser import create_stealth_browser, create_context, handle_cloudflare_challenge, is_mobile_mode, random_delay
+from .dates import overlaps, parse_listing_date
+from .parser import parse_listing_html, parse_post_html
+from .retry import CircuitBreaker, CircuitOpenError, CrawlError, RetryPolicy, classify_error, http_error, is_challenge_html
+from .watchdog import PageWatchdog
+from .assetcache import open_asset_cache
+from metrics import span
+
+# 기본 사이트 주소 (벤치마크에서는 로컬 대역 서버 주소로 교체)
+BASE_URL = "https://www.fmkorea.com"
+
+# JavaScript 없는 탭에서 이 에러가 나면 JS 탭으로 다시 로딩 (챌린지 풀이 / 스크립트가 그리는 페이지 / 멈추거나 끊긴 탭)
+NEEDS_JAVASCRIPT = ("challenge", "parse", "timeout", "network")
+
+# 모바일 사이트 주소 (모바일 모드에서 BASE_URL 대신 접속, 저장하는 URL은 데스크톱 주소 유지)
+MOBILE_BASE_URL = "https://m.fmkorea.com"
+
+
+def page_url(url: str) -> str:
+    """
+    수집 모드에 맞는 접속 주소 (모바일 모드면 www.fmkorea.com → m.fmkorea.com)
+    
+    Args:
+        url: 데스크톱 주소
+    
+    Returns:
+        실제로 접속할 주소
+    """
+    if is_mobile_mode() and url.startswith(BASE_URL):
+        return MOBILE_BASE_URL + url[len(BASE_URL):]
+    return url
+
+
+def canonical_url(url: str) -> str:
+    """모바일 주소를 데스크톱 주소로 (파일명 / 저널 / 내보내기가 모드와 무관하게 같도록)"""
+    if url.startswith(MOBILE_BASE_URL):
+        return BASE_URL + url[len(MOBILE_BASE_URL):]
+    return url
+
+
+def asset_cache_dir(output_dir: str) -> str:
+    """정적 에셋 디스크 캐시 위치 (수집 결과 디렉토리 옆의 cache/assets, 작업 디렉토리와 무관)"""
+    return str(Path(output_dir).parent / "cache" / "assets")
+
+
+def member_search_url(member_id: str, page_num: int = 1, base_url: str = BASE_URL) -> str:
+    """회원 검색 결과 페이지 주소 (데스크톱 주소, 접속할 때 page_url로 변환)"""
+    return f"{base_url}/search.php?mid=stock&search_target=member_srl&search_keyword={member_id}&page={page_num}"
 
 
 async def collect_posts_by_member(
     member_id: str,
     max_pages: int = 10,
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    base_url: str = BASE_URL,
+    headless: bool = False,
+    output_dir: str = "data/raw",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
 ) -> List[str]:
     """
     회원번호로 게시물 URL 목록 수집
     
+    since / until이 있으면 목록의 작성일로 구간 밖 게시물을 상세 수집 전에 제외하고,
+    since보다 오래된 행이 나오면 (목록은 최신순) 다음 페이지를 열지 않음
+    
     Args:
         member_id: FM Korea 회원번호
         max_pages: 최대 페이지 수
         progress_callback: 진행률 콜백 함수
+        base_url: 사이트 주소
+        headless: 헤드리스 모드 여부
+        output_dir: 수집 결과 디렉토리 (정적 에셋 디스크 캐시는 그 옆의 cache/assets)
+        since: 이 시각 이후 작성된 게시물만 (시간대 포함 datetime)
+        until: 이 시각 이전 작성된 게시물만 (시간대 포함 datetime)
     
     Returns:
         게시물 URL 리스트
     """
-    browser = await create_stealth_browser(headless=False)
+    browser = await create_stealth_browser(headless=headless)
     context = await create_context(browser)
+    asset_cache = open_asset_cache(asset_cache_dir(output_dir))
+    if asset_cache:
+        await asset_cache.attach(context)
     page = await context.new_page()
     
     post_urls = []
     
     try:
         for page_num in range(1, max_pages + 1):
-            search_url = f"https://www.fmkorea.com/search.php?mid=stock&search_target=member_srl&search_keyword={member_id}&page={page_num}"
+            search_url = page_url(member_search_url(member_id, page_num, base_url))
             
             if progress_callback:
                 progress_callback(f"페이지 {page_num}/{max_pages} 로딩 중...", page_num / max_pages * 50)
             
             print(f"📄 페이지 {page_num} 접근 중: {search_url}")
             
-            await page.goto(search_url, wait_until="domcontentloaded")
-            await random_delay(3, 5)
+            with span("search.goto"):
+                await page.goto(search_url, wait_until="domcontentloaded")
+            with span("search.delay"):
+                await random_delay(3, 5)
             
             # Cloudflare 챌린지 처리
-            await handle_cloudflare_challenge(page)
+            with span("search.cloudflare"):
+                await handle_cloudflare_challenge(page)
             
-            # 게시물 링크 추출
-            links = await page.locator('a.hx').all()
+            # 게시물 행 추출 (링크 + 목록 작성일)
+            with span("search.content"):
+                html = await page.content()
+            rows = parse_listing_html(html, base_url)
             
-            if not links:
+            if not rows:
                 print(f"⚠️  페이지 {page_num}에서 게시물을 찾을 수 없습니다. 검색 종료.")
                 break
             
-            for link in links:
-                href = await link.get_attribute('href')
-                if href and '/board/' not in href:  # 댓글 링크 제외
-                    full_url = f"https://www.fmkorea.com{href}" if href.startswith('/') else href
-                    if full_url not in post_urls:
-                        post_urls.append(full_url)
+            older = 0
+            outside = 0
+            for row in rows:
+                bounds = parse_listing_date(row["date"])
+                if since and bounds and bounds[1] < since:
+                    older += 1
+                if not overlaps(bounds, since, until):
+                    outside += 1
+                    continue
+                full_url = canonical_url(row["url"])
+                if full_url not in post_urls:
+                    post_urls.append(full_url)
             
-            print(f"✅ 페이지 {page_num}: {len(links)}개 게시물 발견")
+            print(f"✅ 페이지 {page_num}: {len(rows)}개 게시물 발견" + (f" (기간 밖 {outside}개 제외)" if outside else ""))
+            
+            if older:
+                print(f"⏹️  {since:%Y-%m-%d %H:%M} 이전 게시물에 도달 - 검색 종료")
+                break
             
-            await random_delay(2, 4)
+            with span("search.delay"):
+                await random_delay(2, 4)
         
         print(f"\n🎯 총 {len(post_urls)}개 게시물 URL 수집 완료")
+        if asset_cache:
+            print(asset_cache.summary())
         
     except Exception as e:
         print(f"❌ 에러 발생: {e}")
@@ -83,7 +166,14 @@ async def collect_posts_by_member(
 async def collect_posts(
     urls: List[str],
     output_dir: str = "data/raw",
-    progress_callback: Optional[Callable] = None
+    progress_callback: Optional[Callable] = None,
+    post_callback: Optional[Callable] = None,
+    failure_callback: Optional[Callable] = None,
+    headless: bool = False,
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    watchdog_options: Optional[Dict] = None,
+    rate_limiter=None
 ) -> List[str]:
     """
     게시물 URL 리스트에서 상세 내용 수집 (개별 파일로 즉시 저장)
@@ -92,23 +182,31 @@ async def collect_posts(
         urls: 게시물 URL 리스트
         output_dir: 저장 디렉토리
         progress_callback: 진행률 콜백 함수
+        post_callback: 게시물 저장 직후 호출되는 콜백 함수 (post_data, filepath)
+        failure_callback: 재시도 후에도 실패한 게시물마다 호출되는 콜백 함수 (url, CrawlError)
+        headless: 헤드리스 모드 여부
+        retry_policy: 재시도 정책 (기본: RetryPolicy())
+        circuit_breaker: 서킷 브레이커 (기본: CircuitBreaker())
+        watchdog_options: PageWatchdog 옵션 (제한 시간, 탭/컨텍스트 교체 주기, 메모리 기준)
+        rate_limiter: 요청 전마다 대기하는 공유 요청 제한 (SharedRateLimiter, 워커 풀에서 사용)
     
     Returns:
         저장된 파일 경로 리스트
     """
-    from pathlib import Path
-    import hashlib
-    
     # 출력 디렉토리 생성
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    browser = await create_stealth_browser(headless=False)
-    context = await create_context(browser)
-    page = await context.new_page()
+    browser = await create_stealth_browser(headless=headless)
+    # CSS / JS는 실행 간에도 디스크 캐시에서 응답 (새 컨텍스트마다 다시 내려받지 않음)
+    asset_cache = open_asset_cache(asset_cache_dir(output_dir))
+    # 탭 하나를 재사용하되 멈추거나 오래 쓰면 교체
+    watchdog = PageWatchdog(browser, asset_cache=asset_cache, **(watchdog_options or {}))
     
     saved_files = []
     total = len(urls)
+    retry_policy = retry_policy or RetryPolicy()
+    circuit_breaker = circuit_breaker or CircuitBreaker()
     
     try:
         for idx, url in enumerate(urls, 1):
@@ -117,38 +215,36 @@ async def collect_posts(
             
             print(f"\n📝 [{idx}/{total}] {url}")
             
+            post_data = await fetch_with_retry(
+                watchdog, url, retry_policy, circuit_breaker,
+                failure_callback=failure_callback, rate_limiter=rate_limiter
+            )
+            if not post_data:
+                continue
+            
             try:
-                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                await random_delay(2, 4)
-                
-                # HTML 가져오기
-                html = await page.content()
-                
-                # 파싱
-                post_data = parse_post_html(html, url)
-                
-                if post_data:
-                    # URL 해시로 파일명 생성 (중복 방지)
-                    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
-                    filename = f"post_{url_hash}.json"
-                    filepath = output_path / filename
-                    
-                    # 즉시 파일로 저장 (메모리 절약)
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(post_data, f, ensure_ascii=False, indent=2)
-                    
-                    saved_files.append(str(filepath))
-                    print(f"✅ 저장: {filename} - {post_data.get('title', 'N/A')[:50]}...")
-                else:
-                    print(f"⚠️  파싱 실패")
+                filepath = save_post(post_data, output_path, url)
+                saved_files.append(filepath)
+                print(f"✅ 저장: {Path(filepath).name} - {post_data.get('title', 'N/A')[:50]}...")
                 
+                if post_callback:
+                    with span("post.callback"):
+                        post_callback(post_data, filepath)
             except Exception as e:
                 print(f"❌ 에러: {e}")
-                continue
         
         print(f"\n🎉 총 {len(saved_files)}개 게시물 파일 저장 완료")
         print(f"📁 저장 위치: {output_path.absolute()}")
+        stats = watchdog.stats
+        print(f"🐕 탐색 {stats['navigations']}회 (JS 없이 {stats['static_navigations']}회, JS로 다시 로딩 {stats['js_fallbacks']}회), "
+              f"제한 시간 초과 {stats['hung']}회, "
+              f"탭 교체 {stats['page_recycles']}회, 컨텍스트 교체 {stats['context_recycles']}회")
+        if asset_cache:
+            print(asset_cache.summary())
         
+    except CircuitOpenError as e:
+        # 시도하지 않은 게시물은 저널에 남으므로 --resume으로 이어서 수집
+        print(f"⛔ {e} (저장 {len(saved_files)}개, --resume으로 이어서 수집 가능)")
     except Exception as e:
         print(f"❌ 전체 에러: {e}")
     finally:
@@ -160,6 +256,180 @@ async def collect_posts(
     return saved_files
 
 
+async def fetch_with_retry(
+    watchdog: PageWatchdog,
+    url: str,
+    retry_policy: RetryPolicy,
+    circuit_breaker: CircuitBreaker,
+    failure_callback: Optional[Callable] = None,
+    rate_limiter=None
+) -> Optional[Dict]:
+    """
+    게시물 한 건을 재시도 정책에 따라 수집 (서킷 브레이커가 열리면 CircuitOpenError 전달)
+    
+    Args:
+        watchdog: PageWatchdog 인스턴스
+        url: 게시물 URL
+        retry_policy: 재시도 정책
+        circuit_breaker: 서킷 브레이커
+        failure_callback: 재시도 후에도 실패하면 호출되는 콜백 함수 (url, CrawlError)
+        rate_limiter: 요청 전마다 대기하는 공유 요청 제한
+    
+    Returns:
+        게시물 데이터 딕셔너리 (최종 실패면 None)
+    """
+    attempt = 0
+    while True:
+        # 실패 비율이 치솟으면 전체 수집 일시 정지
+        tripped = circuit_breaker.tripped()
+        if tripped:
+            pause = circuit_breaker.open()
+            print(f"⏸️  {tripped} 에러 급증 - {pause:.0f}초 동안 수집 일시 정지")
+            await asyncio.sleep(pause)
+        
+        if rate_limiter:
+            await rate_limiter.wait()
+        
+        attempt += 1
+        try:
+            post_data = await fetch_post_static_first(watchdog, url)
+            circuit_breaker.record_success()
+            return post_data
+        except Exception as e:
+            error = classify_error(e)
+            circuit_breaker.record_failure(error.kind)
+            if retry_policy.should_retry(error, attempt):
+                delay = retry_policy.backoff(error, attempt)
+                print(f"🔁 {error.kind} 에러: {error} - {delay:.1f}초 후 재시도 ({attempt}/{retry_policy.attempts_for(error)})")
+                await asyncio.sleep(delay)
+                continue
+            print(f"❌ 에러 ({error.kind}): {error}")
+            if failure_callback:
+                failure_callback(url, error)
+            return None
+
+
+def save_post(post_data: Dict, output_path: Path, url: str) -> str:
+    """
+    게시물을 개별 JSON 파일로 저장 (파일명은 URL 해시 - 같은 게시물은 같은 파일을 덮어씀)
+    
+    Args:
+        post_data: 게시물 데이터 딕셔너리
+        output_path: 저장 디렉토리
+        url: 게시물 URL
+    
+    Returns:
+        저장한 파일 경로
+    """
+    url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+    filepath = output_path / f"post_{url_hash}.json"
+    
+    # 즉시 파일로 저장 (메모리 절약)
+    with span("post.write"), open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(post_data, f, ensure_ascii=False, indent=2)
+    return str(filepath)
+
+
+async def fetch_post_static_first(watchdog: PageWatchdog, url: str) -> Dict:
+    """
+    쿠키를 얻은 뒤에는 JavaScript 없는 탭으로 게시물을 로딩하고,
+    챌린지 / 파싱 실패 / 제한 시간 초과 / 네트워크 에러면 재시도 횟수를 쓰지 않고 JS 탭으로 다시 로딩
+    
+    Args:
+        watchdog: PageWatchdog 인스턴스
+        url: 게시물 URL
+    
+    Returns:
+        게시물 데이터 딕셔너리
+    """
+    if watchdog.static_ready:
+        try:
+            return await watchdog.run(lambda page: fetch_post(page, url, javascript=False), javascript=False)
+        except Exception as e:
+            error = classify_error(e)
+            if error.kind not in NEEDS_JAVASCRIPT:
+                raise
+            watchdog.stats["js_fallbacks"] += 1
+            print(f"🔄 JavaScript 없는 탭 실패 ({error.kind}) - JS 탭으로 다시 로딩")
+    return await watchdog.run(lambda page: fetch_post(page, url))
+
+
+async def fetch_post(page: Page, url: str, javascript: bool = True) -> Dict:
+    """
+    게시물 한 건 로딩 + 파싱 (실패는 CrawlError 또는 Playwright 예외로 전달)
+    
+    Args:
+        page: Playwright Page 인스턴스
+        url: 게시물 URL
+        javascript: 페이지에서 JavaScript가 실행되는지 (False면 챌린지를 풀지 않고 바로 에러)
+    
+    Returns:
+        게시물 데이터 딕셔너리
+    """
+    with span("post.goto"):
+        response = await page.goto(page_url(url), wait_until="domcontentloaded", timeout=30000)
+    if response is not None and response.status >= 400 and response.status not in (403, 503):
+        # 403/503은 Cloudflare 챌린지일 수 있으므로 본문으로 판별
+        raise http_error(response.status, response.headers)
+    with span("post.delay"):
+        await random_delay(2, 4)
+    
+    # HTML 가져오기
+    with span("post.content"):
+        html = await page.content()
+    
+    if is_challenge_html(html):
+        if not javascript:
+            raise CrawlError("challenge", "JavaScript 없는 탭에서 Cloudflare 챌린지 감지")
+        with span("post.cloudflare"):
+            await handle_cloudflare_challenge(page)
+            html = await page.content()
+        if is_challenge_html(html):
+            raise CrawlError("challenge", "Cloudflare 챌린지를 통과하지 못했습니다")
+    if response is not None and response.status >= 400:
+        raise http_error(response.status, response.headers)
+    
+    # 파싱 (데스크톱 / 모바일 레이아웃 자동 판별, URL은 요청한 주소 그대로 기록)
+    with span("post.parse"):
+        post_data = parse_post_html(html, url)
+    if not post_data:
+        raise CrawlError("parse", "파싱 실패")
+    if not javascript and post_data["title"] == "제목 없음" and not post_data["content"]:
+        # 스크립트가 본문을 그리는 페이지 (서버 렌더링 마크업 없음)
+        raise CrawlError("parse", "JavaScript 없이 본문을 찾지 못했습니다")
+    return post_data
+
+
+async def fetch_listing(page: Page, url: str) -> str:
+    """
+    검색 결과 페이지 HTML을 가볍게 가져오기
+    컨텍스트의 HTTP 요청(쿠키 공유)으로 문서만 받고 렌더링하지 않으며,
+    쿠키가 만료되어 챌린지가 오면 탭에서 한 번 로딩해 통과한 뒤 그 HTML을 사용
+    
+    Args:
+        page: Playwright Page 인스턴스 (JavaScript 탭)
+        url: 검색 결과 URL (데스크톱 주소)
+    
+    Returns:
+        검색 결과 HTML
+    """
+    with span("listing.fetch"):
+        response = await page.context.request.get(page_url(url), timeout=30000)
+        html = await response.text()
+    if not is_challenge_html(html):
+        if response.status >= 400:
+            raise http_error(response.status, response.headers)
+        return html
+    
+    with span("listing.cloudflare"):
+        await page.goto(page_url(url), wait_until="domcontentloaded", timeout=30000)
+        await handle_cloudflare_challenge(page)
+        html = await page.content()
+    if is_challenge_html(html):
+        raise CrawlError("challenge", "Cloudflare 챌린지를 통과하지 못했습니다")
+    return html
+
+
 async def extract_post_data(page: Page) -> Dict:
     """
     현재 페이지에서 게시물 데이터 추출
@@ -171,5 +441,5 @@ async def extract_post_data(page: Page) -> Dict:
         게시물 데이터 딕셔너리
     """
     html = await page.content()
-    url = page.url
+    url = canonical_url(page.url)
     return parse_post_html(html, url)
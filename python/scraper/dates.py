@@ -0,0 +1,159 @@
+"""
+작성일 표기 파싱 (한국 시간 기준, 시간대 포함 datetime)
+
+검색 결과 목록은 하루 이내 글을 상대 시간("3분 전", "3시간 전")으로, 이후 글은 날짜만("2026.01.05") 표시하므로
+목록의 작성일은 시각 하나가 아니라 가능한 범위(가장 이른 시각, 가장 늦은 시각)로 다룸
+게시물 상세 페이지는 "2026.01.05 14:23"처럼 분 단위까지 표시
+"""
+
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+KST = timezone(timedelta(hours=9))
+
+# 상대 시간 표기 단위
+RELATIVE_UNITS = {"초": timedelta(seconds=1), "분": timedelta(minutes=1), "시간": timedelta(hours=1), "일": timedelta(days=1)}
+
+# 기간 옵션 단위 (--since 30d)
+DURATION_UNITS = {"m": timedelta(minutes=1), "h": timedelta(hours=1), "d": timedelta(days=1), "w": timedelta(weeks=1)}
+
+_RELATIVE = re.compile(r"^(\d+)\s*(초|분|시간|일)\s*전$")
+_FULL_DATE = re.compile(r"^(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})\.?(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?$")
+_SHORT_DATE = re.compile(r"^(\d{1,2})[.\-/](\d{1,2})\.?(?:\s+(\d{1,2}):(\d{2}))?$")
+_TIME_ONLY = re.compile(r"^(어제\s*)?(\d{1,2}):(\d{2})$")
+
+
+def now_kst() -> datetime:
+    """현재 한국 시간"""
+    return datetime.now(KST)
+
+
+def _day_range(start: datetime) -> Tuple[datetime, datetime]:
+    return start, start + timedelta(days=1) - timedelta(microseconds=1)
+
+
+def parse_listing_date(text: str, now: Optional[datetime] = None) -> Optional[Tuple[datetime, datetime]]:
+    """
+    목록 작성일 표기를 가능한 작성 시각 범위로 변환
+
+    Args:
+        text: "방금", "3분 전", "3시간 전", "2일 전", "어제 14:23", "14:23", "01.05 14:23", "2026.01.05", "2026.01.05 14:23"
+        now: 기준 시각 (기본: 현재 한국 시간, 시간대 없으면 한국 시간으로 간주)
+
+    Returns:
+        (가장 이른 시각, 가장 늦은 시각) - 한국 시간, 알 수 없는 표기면 None
+    """
+    if not text:
+        return None
+    text = text.strip()
+    now = now or now_kst()
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=KST)
+    now = now.astimezone(KST)
+
+    if text in ("방금", "방금 전"):
+        return now - timedelta(minutes=1), now
+
+    match = _RELATIVE.match(text)
+    if match:
+        # "3시간 전" = 3시간 이상 4시간 미만 전 (표기는 내림)
+        unit = RELATIVE_UNITS[match.group(2)]
+        amount = int(match.group(1))
+        return now - unit * (amount + 1), now - unit * amount
+
+    try:
+        match = _FULL_DATE.match(text)
+        if match:
+            year, month, day, hour, minute, second = match.groups()
+            if hour is None:
+                return _day_range(datetime(int(year), int(month), int(day), tzinfo=KST))
+            moment = datetime(int(year), int(month), int(day), int(hour), int(minute), int(second or 0), tzinfo=KST)
+            return moment, moment if second else moment + timedelta(seconds=59)
+
+        match = _SHORT_DATE.match(text)
+        if match:
+            # 연도 없는 표기는 기준 시각 이후가 되지 않는 가장 가까운 해
+            month, day, hour, minute = match.groups()
+            start = datetime(now.year, int(month), int(day), int(hour or 0), int(minute or 0), tzinfo=KST)
+            if start > now:
+                start = start.replace(year=now.year - 1)
+            if hour is None:
+                return _day_range(start)
+            return start, start + timedelta(seconds=59)
+
+        match = _TIME_ONLY.match(text)
+        if match:
+            yesterday, hour, minute = match.groups()
+            start = now.replace(hour=int(hour), minute=int(minute), second=0, microsecond=0)
+            if yesterday or start > now:
+                start -= timedelta(days=1)
+            return start, start + timedelta(seconds=59)
+    except ValueError:
+        # 존재하지 않는 날짜 (예: 02.30)
+        return None
+    return None
+
+
+def parse_post_date(text: str) -> Optional[datetime]:
+    """
+    게시물 작성일 표기를 시각으로 변환 (범위면 가장 이른 시각)
+
+    Args:
+        text: 상세 페이지 작성일 ("2026.01.05 14:23") 또는 목록 표기
+
+    Returns:
+        한국 시간 datetime 또는 None
+    """
+    bounds = parse_listing_date(text)
+    return bounds[0] if bounds else None
+
+
+def parse_date_bound(text: str, now: Optional[datetime] = None, end_of_day: bool = False) -> datetime:
+    """
+    --since / --until 옵션 값 변환
+
+    Args:
+        text: 기간("30d", "12h", "2w" - 기준 시각에서 그만큼 전) 또는 날짜("2026-01-05", "2026.01.05", "2026-01-05T09:00")
+        now: 기준 시각 (기본: 현재 한국 시간)
+        end_of_day: 시각 없는 날짜를 그날의 끝으로 (--until 2026-01-31이면 31일 포함)
+
+    Returns:
+        시간대 포함 datetime (시간대 없는 날짜는 한국 시간)
+
+    Raises:
+        ValueError: 알 수 없는 형식
+    """
+    text = text.strip()
+    match = re.fullmatch(r"(\d+)\s*([mhdw])", text)
+    if match:
+        return (now or now_kst()) - DURATION_UNITS[match.group(2)] * int(match.group(1))
+
+    bounds = parse_listing_date(text.replace("T", " "), now)
+    if bounds and _FULL_DATE.match(text.replace("T", " ")):
+        return bounds[1] if end_of_day and ":" not in text else bounds[0]
+
+    try:
+        moment = datetime.fromisoformat(text)
+    except ValueError:
+        raise ValueError(f"알 수 없는 날짜 형식: {text} (예: 30d, 12h, 2026-01-05)")
+    return moment if moment.tzinfo else moment.replace(tzinfo=KST)
+
+
+def overlaps(bounds: Optional[Tuple[datetime, datetime]], since: Optional[datetime], until: Optional[datetime]) -> bool:
+    """
+    작성 시각 범위가 [since, until] 구간과 겹치는지 (범위를 모르면 True - 수집해서 확인)
+
+    Args:
+        bounds: parse_listing_date 결과
+        since: 구간 시작 (None이면 제한 없음)
+        until: 구간 끝 (None이면 제한 없음)
+    """
+    if bounds is None:
+        return True
+    earliest, latest = bounds
+    if since and latest < since:
+        return False
+    if until and earliest > until:
+        return False
+    return True
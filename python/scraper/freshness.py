@@ -0,0 +1,310 @@
+"""
+게시물 카운터 재방문 스케줄러
+저장된 게시물의 조회수 / 댓글 수 / 추천 수는 수집 후에도 며칠 동안 계속 늘어나므로,
+게시물마다 카운터 시계열(counters)을 남기고 예상 증가율이 큰 게시물부터 실행당 요청 예산 안에서 다시 확인
+
+시계열 형식 (게시물 JSON의 "counters", 관측 시각은 epoch 초):
+    [[1767625200, 120, 3, 5], [1767646800, 340, 9, 11], ...]   [관측 시각, 조회수, 댓글 수, 추천 수]
+
+- 예상 증가율 = 최근 두 관측의 증가 속도 × 마지막 확인 후 경과 시간 (관측이 하나면 평균 성장 가정: 경과 시간 / 게시물 나이)
+  → 새 글은 자주, 증가가 멈춘 오래된 글은 드물게 확인
+- 검색 결과 목록에 조회수 / 댓글 수가 표시되므로 목록 한 페이지(요청 한 번)로 게시물 20개를 갱신하고,
+  예산이 남으면 목록에서 갱신하지 못한 게시물만 상세 페이지로 확인 (추천 수는 상세 페이지에서만 갱신)
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from postkeys import get_post_time
+
+from .assetcache import open_asset_cache
+from .browser import create_stealth_browser, random_delay
+from .collector import (
+    BASE_URL, asset_cache_dir, canonical_url, fetch_listing, fetch_with_retry, member_search_url, save_post,
+)
+from .journal import url_key
+from .parser import parse_listing_html
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy, classify_error
+from .watchdog import PageWatchdog
+
+# 실행당 요청 예산 (검색 결과 페이지 + 상세 페이지)
+REFRESH_BUDGET = 50
+
+# 회원마다 확인하는 최대 검색 결과 페이지 수
+LISTING_PAGES = 10
+
+# 예상 증가율이 이 값(5%) 이상인 게시물만 재방문
+MIN_PRIORITY = 0.05
+
+# 관측된 증가가 멈춘 게시물에도 남기는 평균 성장 가정의 비중
+STALE_WEIGHT = 0.1
+
+# 게시물 나이 / 관측 간격 하한 (초) - 방금 올라온 글의 증가율이 무한대가 되지 않도록
+MIN_AGE = 3600
+MIN_INTERVAL = 60
+
+# 게시물당 최대 관측 수 (넘으면 간격이 가장 좁은 관측부터 제거, 처음과 마지막은 유지)
+MAX_SAMPLES = 48
+
+
+def counter_values(post: Dict) -> List[Optional[int]]:
+    """게시물의 현재 카운터 [조회수, 댓글 수, 추천 수]"""
+    metadata = post.get('metadata', {})
+    return [post.get('views'), metadata.get('comments'), metadata.get('votes')]
+
+
+def counter_series(post: Dict, crawled_at: Optional[float] = None) -> List[List]:
+    """
+    게시물의 카운터 시계열 (기록이 없으면 수집 시점의 값 하나)
+
+    Args:
+        post: 게시물 데이터 딕셔너리
+        crawled_at: 수집 시각 (epoch 초, 기본: 현재 시각 - 보통 JSON 파일 수정 시각)
+
+    Returns:
+        [[관측 시각, 조회수, 댓글 수, 추천 수], ...]
+    """
+    series = post.get('counters')
+    if series:
+        return [list(sample) for sample in series]
+    return [[int(crawled_at or time.time()), *counter_values(post)]]
+
+
+def compact_series(series: List[List], max_samples: int = MAX_SAMPLES) -> List[List]:
+    """관측 수가 max_samples를 넘으면 앞 관측과의 간격이 가장 좁은 중간 관측부터 제거"""
+    while len(series) > max(max_samples, 2):
+        index = min(range(1, len(series) - 1), key=lambda i: series[i][0] - series[i - 1][0])
+        del series[index]
+    return series
+
+
+def record_counters(
+    post: Dict,
+    views: Optional[int] = None,
+    comments: Optional[int] = None,
+    votes: Optional[int] = None,
+    observed_at: Optional[float] = None,
+    crawled_at: Optional[float] = None
+) -> bool:
+    """
+    게시물에 카운터 관측 추가 (None인 값은 직전 관측 유지) 후 views / metadata도 최신 값으로 갱신
+
+    Args:
+        post: 게시물 데이터 딕셔너리 (직접 수정)
+        views: 조회수
+        comments: 댓글 수
+        votes: 추천 수
+        observed_at: 관측 시각 (epoch 초, 기본: 현재 시각)
+        crawled_at: 시계열이 없을 때 기존 값의 관측 시각 (counter_series 참고)
+
+    Returns:
+        직전 관측과 값이 달라졌는지
+    """
+    series = counter_series(post, crawled_at)
+    previous = series[-1][1:]
+    values = [value if value is not None else previous[i] for i, value in enumerate((views, comments, votes))]
+    sample = [int(observed_at or time.time()), *values]
+
+    if len(series) >= 2 and series[-2][1:] == previous == values:
+        # 값이 그대로인 구간은 처음과 마지막 관측만 유지
+        series[-1] = sample
+    else:
+        series.append(sample)
+    post['counters'] = compact_series(series)
+
+    if values[0] is not None:
+        post['views'] = values[0]
+    metadata = post.setdefault('metadata', {})
+    for name, value in zip(("comments", "votes"), values[1:]):
+        if value is not None:
+            metadata[name] = value
+    return values != previous
+
+
+def posted_at(post: Dict) -> Optional[float]:
+    """게시물 작성 시각 (epoch 초, 알 수 없으면 None) - 파서가 기록한 timestamp, 없는 예전 파일은 작성일 표기"""
+    return get_post_time(post) or None
+
+
+def revisit_priority(post: Dict, now: Optional[float] = None, crawled_at: Optional[float] = None) -> float:
+    """
+    마지막 확인 이후 예상되는 카운터 증가율 (0.1 = 10%)
+
+    Args:
+        post: 게시물 데이터 딕셔너리
+        now: 기준 시각 (epoch 초, 기본: 현재 시각)
+        crawled_at: 시계열이 없을 때 수집 시각 (counter_series 참고)
+
+    Returns:
+        예상 증가율
+    """
+    now = now or time.time()
+    series = counter_series(post, crawled_at)
+    last = series[-1]
+    elapsed = max(0.0, now - last[0])
+
+    # 평균 성장 가정: 나이 T에 값 V였다면 경과 시간 t 동안 약 V * t / T 증가
+    written = posted_at(post) or series[0][0]
+    prior = elapsed / max(last[0] - written, MIN_AGE)
+    if len(series) < 2:
+        return prior
+
+    previous = series[-2]
+    interval = max(last[0] - previous[0], MIN_INTERVAL)
+    observed = max(
+        (max(b - a, 0) / max(a, 1) for a, b in zip(previous[1:], last[1:]) if a is not None and b is not None),
+        default=0.0
+    ) * elapsed / interval
+    return max(observed, prior * STALE_WEIGHT)
+
+
+def _load_posts(output_path: Path) -> Dict[str, Dict]:
+    """게시물 키 → {"path", "post", "crawled_at"}"""
+    posts = {}
+    for path in output_path.glob("post_*.json"):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                post = json.load(f)
+            posts[url_key(post["url"])] = {"path": path, "post": post, "crawled_at": path.stat().st_mtime}
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+    return posts
+
+
+async def refresh_counters(
+    member_ids: List[str],
+    output_dir: str = "data/raw",
+    budget: int = REFRESH_BUDGET,
+    max_pages: int = LISTING_PAGES,
+    post_callback: Optional[Callable] = None,
+    base_url: str = BASE_URL,
+    headless: bool = False,
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None
+) -> Dict:
+    """
+    저장된 게시물 중 재방문 대상(예상 증가율 MIN_PRIORITY 이상)의 카운터를 요청 예산 안에서 갱신
+
+    Args:
+        member_ids: 검색 결과 목록으로 갱신할 회원번호 리스트 (비어 있으면 상세 페이지로만 갱신)
+        output_dir: 게시물 JSON 디렉토리
+        budget: 실행당 최대 요청 수 (검색 결과 페이지 + 상세 페이지)
+        max_pages: 회원마다 확인하는 최대 검색 결과 페이지 수
+        post_callback: 게시물 파일을 갱신할 때마다 호출되는 콜백 함수 (post_data, filepath)
+        base_url: 사이트 주소
+        headless: 헤드리스 모드 여부
+        retry_policy: 재시도 정책 (기본: RetryPolicy())
+        circuit_breaker: 서킷 브레이커 (기본: CircuitBreaker())
+
+    Returns:
+        {"stored", "due", "listing_requests", "post_requests", "from_listing", "from_post", "changed", "skipped"}
+    """
+    output_path = Path(output_dir)
+    retry_policy = retry_policy or RetryPolicy()
+    circuit_breaker = circuit_breaker or CircuitBreaker()
+
+    now = time.time()
+    posts = _load_posts(output_path)
+    priorities = {
+        key: revisit_priority(entry["post"], now, entry["crawled_at"]) for key, entry in posts.items()
+    }
+    due = {key for key, priority in priorities.items() if priority >= MIN_PRIORITY}
+    refreshed = set()
+    stats = {
+        "stored": len(posts), "due": len(due), "listing_requests": 0, "post_requests": 0,
+        "from_listing": 0, "from_post": 0, "changed": 0, "skipped": 0,
+    }
+    print(f"📈 저장된 게시물 {len(posts)}개 중 재방문 대상 {len(due)}개 (요청 예산 {budget}회)")
+    if not due:
+        return stats
+
+    def spent() -> int:
+        return stats["listing_requests"] + stats["post_requests"]
+
+    def store(key: str, post: Dict, changed: bool):
+        filepath = save_post(post, output_path, post["url"])
+        refreshed.add(key)
+        if changed:
+            stats["changed"] += 1
+        if post_callback:
+            post_callback(post, filepath)
+
+    browser = await create_stealth_browser(headless=headless)
+    asset_cache = open_asset_cache(asset_cache_dir(output_dir))
+    watchdog = PageWatchdog(browser, asset_cache=asset_cache)
+
+    try:
+        # 1) 검색 결과 목록: 요청 한 번으로 게시물 여러 개의 조회수 / 댓글 수 갱신
+        for member_id in member_ids:
+            for page_num in range(1, max_pages + 1):
+                if spent() >= budget or not due - refreshed:
+                    break
+                url = member_search_url(member_id, page_num, base_url)
+                stats["listing_requests"] += 1
+                try:
+                    html = await watchdog.run(lambda page: fetch_listing(page, url))
+                except Exception as e:
+                    error = classify_error(e)
+                    circuit_breaker.record_failure(error.kind)
+                    print(f"⚠️  회원 {member_id} 검색 결과 {page_num}페이지 확인 실패 ({error.kind}): {error}")
+                    break
+                circuit_breaker.record_success()
+
+                rows = parse_listing_html(html, base_url)
+                observed_due = False
+                for row in rows:
+                    key = url_key(canonical_url(row["url"]))
+                    if key not in posts or key in refreshed:
+                        continue
+                    observed_due = observed_due or key in due
+                    entry = posts[key]
+                    changed = record_counters(
+                        entry["post"], views=row["views"], comments=row["comments"],
+                        observed_at=now, crawled_at=entry["crawled_at"]
+                    )
+                    if changed or key in due:
+                        # 재방문 대상은 값이 그대로여도 "이 시각에 확인, 변화 없음" 관측을 저장
+                        # (저장하지 않으면 예상 증가율이 계속 올라 매 실행마다 다시 대상이 됨)
+                        store(key, entry["post"], changed)
+                    else:
+                        # 대상이 아니고 값도 그대로면 파일은 다시 쓰지 않음
+                        refreshed.add(key)
+                    stats["from_listing"] += 1
+
+                if not rows or not observed_due:
+                    # 목록은 최신순 - 이 페이지에 재방문 대상이 없으면 더 오래된 페이지에도 거의 없음
+                    break
+                await random_delay(2, 4)
+
+        # 2) 남은 예산으로 목록에서 갱신하지 못한 게시물을 예상 증가율 순으로 상세 확인
+        for key in sorted(due - refreshed, key=lambda k: priorities[k], reverse=True):
+            if spent() >= budget:
+                stats["skipped"] += 1
+                continue
+            entry = posts[key]
+            url = entry["post"]["url"]
+            print(f"🔁 [{priorities[key]:.0%}] {url}")
+            stats["post_requests"] += 1
+            post_data = await fetch_with_retry(watchdog, url, retry_policy, circuit_breaker)
+            if not post_data:
+                continue
+            post_data['counters'] = counter_series(entry["post"], entry["crawled_at"])
+            changed = record_counters(post_data, *counter_values(post_data), observed_at=time.time())
+            store(key, post_data, changed)
+            stats["from_post"] += 1
+
+    except CircuitOpenError as e:
+        print(f"⛔ {e}")
+    finally:
+        if asset_cache:
+            print(asset_cache.summary())
+        try:
+            await browser.close()
+        except:
+            pass
+
+    print(f"📊 요청 {spent()}회 (목록 {stats['listing_requests']}회, 상세 {stats['post_requests']}회)로 "
+          f"게시물 {len(refreshed)}개 갱신 (변화 {stats['changed']}개, 예산 초과로 다음 실행에 {stats['skipped']}개)")
+    return stats
@@ -0,0 +1,291 @@
+"""
+수집 저널 (중단 후 재개용)
+발견한 URL, 완료한 document_srl, 실패 기록을 추가 전용 JSONL 파일에 남기고
+여러 건을 모아 fsync하여 프로세스가 죽거나 앱이 닫혀도 다음 실행에서 남은 작업만 이어서 수집
+
+레코드 (한 줄에 하나):
+    {"op": "run", "mode": "member", "data": "3902132645", "ts": ...}   실행 시작
+    {"op": "discovered", "urls": [...]}                                 발견한 게시물 URL
+    {"op": "done", "key": "8000000000", "url": ..., "file": ...}        저장 완료
+    {"op": "failed", "key": ..., "url": ..., "kind": "timeout", "error": ..., "attempt": n} 실패
+    {"op": "finished", "ts": ...}                                        실행 종료 (압축 후)
+
+재시도 후에도 실패한 게시물은 실행이 바뀌어도 유지되는 DeadLetterList(data/journal/dead_letter.json)에도 남겨
+`main.py retry <종류>`로 해당 게시물만 다시 수집
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from postkeys import get_post_id
+
+# 배치 fsync 기준 (레코드 수 또는 경과 시간 중 먼저 도달하는 쪽)
+FSYNC_EVERY_RECORDS = 20
+FSYNC_EVERY_SECONDS = 2.0
+
+# 재개 시 실패한 게시물을 다시 시도하는 최대 횟수 (누적)
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+def url_key(url: str) -> str:
+    """저널 키: document_srl, 없으면 URL"""
+    srl = get_post_id({"url": url})
+    return str(srl) if srl else url
+
+
+class CrawlJournal:
+    """추가 전용 수집 저널"""
+
+    def __init__(self, journal_file: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Args:
+            journal_file: 저널 파일 경로 (예: data/journal/crawl.jsonl)
+            max_attempts: 재개 시 실패 게시물의 최대 누적 시도 횟수
+        """
+        self.path = Path(journal_file)
+        self.max_attempts = max_attempts
+        self.run: Optional[Dict] = None
+        self.discovered: List[str] = []
+        self.done: Dict[str, Dict] = {}
+        self.failures: Dict[str, Dict] = {}
+        self.finished = False
+        self._file = None
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    # 읽기
+
+    def load(self) -> bool:
+        """
+        기존 저널 재생 (마지막 줄이 잘린 경우 무시)
+
+        Returns:
+            저널이 있었는지 여부
+        """
+        if not self.path.exists():
+            return False
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 종료되어 잘린 줄
+                    continue
+                self._apply(record)
+        return True
+
+    def _apply(self, record: Dict):
+        op = record.get("op")
+        if op == "run":
+            self.run = record
+            self.finished = False
+        elif op == "discovered":
+            known = set(self.discovered)
+            self.discovered.extend(url for url in record["urls"] if url not in known)
+        elif op == "done":
+            self.done[record["key"]] = record
+            self.failures.pop(record["key"], None)
+        elif op == "failed":
+            previous = self.failures.get(record["key"], {})
+            self.failures[record["key"]] = {**record, "attempt": max(record.get("attempt", 1), previous.get("attempt", 0))}
+        elif op == "finished":
+            self.finished = True
+
+    def remaining(self) -> List[str]:
+        """
+        남은 작업: 완료되지 않았고 최대 시도 횟수에 도달하지 않은 URL (발견 순서 유지)
+
+        Returns:
+            URL 리스트
+        """
+        urls = []
+        for url in self.discovered:
+            key = url_key(url)
+            if key in self.done:
+                continue
+            failure = self.failures.get(key)
+            if failure and failure.get("attempt", 1) >= self.max_attempts:
+                continue
+            urls.append(url)
+        return urls
+
+    def gave_up(self) -> List[Dict]:
+        """최대 시도 횟수를 넘겨 재시도하지 않는 실패 기록"""
+        return [f for f in self.failures.values() if f.get("attempt", 1) >= self.max_attempts]
+
+    def saved_files(self) -> List[str]:
+        """완료 기록의 저장 파일 경로 (발견 순서)"""
+        files = []
+        for url in self.discovered:
+            record = self.done.get(url_key(url))
+            if record and record.get("file"):
+                files.append(record["file"])
+        return files
+
+    def matches(self, mode: str, data: str) -> bool:
+        """저널이 같은 모드/입력의 실행인지 여부"""
+        return bool(self.run) and self.run.get("mode") == mode and self.run.get("data") == data
+
+    # 쓰기
+
+    def start(self, mode: str, data: str, resume: bool = False):
+        """
+        실행 시작 기록 (resume=False면 기존 저널을 비우고 새로 시작)
+
+        Args:
+            mode: 실행 모드 (member, urls)
+            data: 모드 입력값
+            resume: 기존 저널에 이어서 기록할지 여부
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if not resume:
+            self.run = None
+            self.discovered = []
+            self.done = {}
+            self.failures = {}
+        self._file = open(self.path, 'a' if resume else 'w', encoding='utf-8')
+        if resume and self._file.tell() and not self.path.read_bytes().endswith(b"\n"):
+            # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄 끝내기
+            self._file.write("\n")
+        self._append({"op": "run", "mode": mode, "data": data, "ts": time.time()}, sync=True)
+
+    def record_discovered(self, urls: List[str]):
+        """발견한 게시물 URL 기록 (즉시 fsync)"""
+        self._append({"op": "discovered", "urls": list(urls)}, sync=True)
+
+    def record_done(self, url: str, filepath: str):
+        """게시물 저장 완료 기록"""
+        self._append({"op": "done", "key": url_key(url), "url": url, "file": filepath})
+
+    def record_failed(self, url: str, error: Exception):
+        """게시물 실패 기록 (누적 시도 횟수 증가, 에러 종류는 CrawlError.kind)"""
+        key = url_key(url)
+        attempt = self.failures.get(key, {}).get("attempt", 0) + 1
+        self._append({
+            "op": "failed",
+            "key": key,
+            "url": url,
+            "kind": getattr(error, "kind", "other"),
+            "error": str(error),
+            "attempt": attempt,
+        })
+
+    def _append(self, record: Dict, sync: bool = False):
+        self._apply(record)
+        if self._file is None:
+            raise RuntimeError("start()를 먼저 호출해야 합니다")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._unsynced += 1
+        if sync or self._unsynced >= FSYNC_EVERY_RECORDS or time.monotonic() - self._last_sync >= FSYNC_EVERY_SECONDS:
+            self.sync()
+
+    def sync(self):
+        """기록한 내용을 디스크에 확정"""
+        if self._file is None or not self._unsynced:
+            return
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def compact(self):
+        """
+        현재 상태만 남기도록 저널 재작성 (실행 종료 시)
+        run / discovered / done / 남은 failed / finished 레코드로 줄이고 원자적으로 교체
+        """
+        self.close()
+        self.finished = True
+        records = []
+        if self.run:
+            records.append(self.run)
+        if self.discovered:
+            records.append({"op": "discovered", "urls": self.discovered})
+        records.extend(self.done.values())
+        records.extend(self.failures.values())
+        records.append({"op": "finished", "ts": time.time()})
+
+        _write_atomic(self.path, "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records))
+
+    def close(self):
+        """남은 기록 fsync 후 파일 닫기"""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
+
+
+class DeadLetterList:
+    """재시도 후에도 실패한 게시물 목록 (URL 키 기준, 실행이 바뀌어도 유지)"""
+
+    def __init__(self, dead_letter_file: str):
+        """
+        Args:
+            dead_letter_file: 목록 파일 경로 (예: data/journal/dead_letter.json)
+        """
+        self.path = Path(dead_letter_file)
+        self.entries: Dict[str, Dict] = {}
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.entries = {url_key(entry["url"]): entry for entry in json.load(f)}
+            except (json.JSONDecodeError, KeyError, TypeError):
+                print(f"⚠️  실패 목록을 읽을 수 없어 새로 만듭니다: {self.path}")
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, url: str, error: Exception):
+        """실패 게시물 추가 (이미 있으면 실패 횟수 증가)"""
+        key = url_key(url)
+        previous = self.entries.get(key, {})
+        self.entries[key] = {
+            "url": url,
+            "kind": getattr(error, "kind", "other"),
+            "status": getattr(error, "status", None),
+            "error": str(error),
+            "failures": previous.get("failures", 0) + 1,
+            "ts": time.time(),
+        }
+        self.save()
+
+    def remove(self, url: str):
+        """다시 수집에 성공한 게시물 제거"""
+        if self.entries.pop(url_key(url), None) is not None:
+            self.save()
+
+    def clear(self):
+        """목록 비우기 (새 수집을 시작할 때)"""
+        self.entries = {}
+        if self.path.exists():
+            self.path.unlink()
+
+    def urls(self, kinds: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Args:
+            kinds: 다시 수집할 에러 종류 (None이면 전체)
+
+        Returns:
+            URL 리스트 (실패 순서)
+        """
+        kinds = set(kinds) if kinds else None
+        entries = sorted(self.entries.values(), key=lambda entry: entry["ts"])
+        return [entry["url"] for entry in entries if kinds is None or entry["kind"] in kinds]
+
+    def save(self):
+        """원자적으로 파일 교체"""
+        _write_atomic(self.path, json.dumps(list(self.entries.values()), ensure_ascii=False, indent=2))
+
+
+def _write_atomic(path: Path, text: str):
+    """임시 파일에 쓰고 fsync 후 교체 (쓰는 도중 종료되어도 이전 내용 유지)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
@@ -1,67 +1,153 @@
 """
 FM Korea HTML 파싱 모듈
 BeautifulSoup을 사용한 게시물 데이터 추출
+
+데스크톱(www.fmkorea.com)과 모바일(m.fmkorea.com) 레이아웃별 선택자 프로필을 두고,
+페이지가 어느 레이아웃인지 자동으로 판별하여 같은 형식의 게시물 데이터를 만듦
 """
 
-from bs4 import BeautifulSoup
-from typing import Dict, Optional
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from typing import Dict, List, Optional, Tuple
 import re
 
+from metrics import span
+
+from .dates import parse_post_date
+
+# 레이아웃별 선택자 프로필
+# marker: 이 레이아웃에만 있는 요소 (판별용), title은 앞에서부터 처음 찾은 요소 사용
+PARSER_PROFILES = {
+    "desktop": {
+        "marker": ".rd_hd .side.fr",
+        "title": ("h1.np_18px", "span.np_18px_span"),
+        "content": ".xe_content",
+        "date": "span.date.m_no",
+        "views": ".rd_hd .side.fr span:nth-child(1) b",
+        "author": "a.member_plate",
+        "comments": ".rd_hd .side.fr span:nth-child(3) b",
+        "votes": "a.vote_label",
+    },
+    "mobile": {
+        # 모바일 스킨은 헤더 한 줄(.rd_hd .meta)에 작성자 / 작성일 / 조회 / 추천 / 댓글을 모아 표시
+        "marker": ".rd_hd .meta",
+        "title": ("h1.np_18px", "span.np_18px_span"),
+        "content": ".xe_content",
+        "date": ".rd_hd .meta span.date",
+        "views": ".rd_hd .meta .m_views b",
+        "author": ".rd_hd .meta a.member_plate",
+        "comments": ".rd_hd .meta .m_comments b",
+        "votes": ".rd_hd .meta .m_votes b",
+    },
+}
+
+# 회원 검색 결과 목록 선택자 (데스크톱 / 모바일 공통)
+LISTING_SELECTORS = {
+    "link": "a.hx",
+    "date": ".time",
+    "views": ".readNum",
+    "comments": ".replyNum",
+}
+
+# 본문 블록 (content와 함께 저장하는 문서 순서의 구조화 표현)
+# content는 예전과 같이 본문 문자열 조각을 줄바꿈으로 이은 것이고, 텍스트 블록은 그 범위를 끝 위치 n으로 가리킴
+# (범위: 직전 텍스트 블록 끝 + 줄바꿈 1자부터 n 앞까지)
+# - 정수 n: 문단 - 표시 텍스트가 content 범위와 같음
+# - ["p", n, text, links]: 인라인 태그 / 링크가 있는 문단 - text는 공백을 정리한 표시 텍스트 (범위와 같으면 null),
+#   links는 [[href, 시작, 끝], ...] (text 안 위치, 없으면 생략)
+# - ["quote", n, text, links]: 인용 - text / links는 문단과 같고 필요할 때만 붙음
+# - ["link", href, n, text]: 링크 하나뿐인 문단 (text는 필요할 때만)
+# - "img": 이미지 - content 끝 "[이미지]" 목록의 다음 URL
+# - ["embed", src]: 동영상 등 임베드 (iframe, video, audio, embed, object)
+BLOCK_TAGS = frozenset((
+    "p", "div", "section", "article", "figure", "figcaption", "center", "pre", "hr",
+    "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "li", "dl", "dt", "dd", "table", "tr", "td", "th",
+))
+EMBED_TAGS = frozenset(("iframe", "video", "audio", "embed", "object"))
+
+# content에 들어가는 문자열 종류 (get_text 기본값과 같음 - 주석 / 스크립트 / 스타일 문자열 제외)
+TEXT_TYPES = (NavigableString, CData)
+
+
+def detect_layout(soup: BeautifulSoup) -> str:
+    """
+    게시물 페이지 레이아웃 판별
+
+    Args:
+        soup: BeautifulSoup 객체
 
-def parse_post_html(html: str, url: str) -> Optional[Dict]:
+    Returns:
+        PARSER_PROFILES 키 (판별할 수 없으면 "desktop")
+    """
+    for name, profile in PARSER_PROFILES.items():
+        if soup.select_one(profile["marker"]):
+            return name
+    return "desktop"
+
+
+def _number(elem) -> Optional[int]:
+    """요소 텍스트의 첫 번째 숫자 (천 단위 쉼표 제거)"""
+    if not elem:
+        return None
+    match = re.search(r'(\d+)', elem.get_text(strip=True).replace(',', ''))
+    return int(match.group(1)) if match else None
+
+
+def parse_post_html(html: str, url: str, layout: Optional[str] = None) -> Optional[Dict]:
     """
     HTML에서 게시물 데이터 추출
     
     Args:
         html: HTML 문자열
         url: 게시물 URL
+        layout: 레이아웃 ("desktop" / "mobile", 기본: 자동 판별)
     
     Returns:
         게시물 데이터 딕셔너리 또는 None
     """
     try:
-        soup = BeautifulSoup(html, 'lxml')
+        with span("parse.soup"):
+            soup = BeautifulSoup(html, 'lxml')
+        
+        with span("parse.layout"):
+            profile = PARSER_PROFILES[layout or detect_layout(soup)]
         
         # 제목 추출 - h1.np_18px 또는 span.np_18px_span
-        title_elem = soup.select_one('h1.np_18px') or soup.select_one('span.np_18px_span')
-        title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
+        with span("parse.title"):
+            title_elem = None
+            for selector in profile["title"]:
+                title_elem = soup.select_one(selector)
+                if title_elem:
+                    break
+            title = title_elem.get_text(strip=True) if title_elem else "제목 없음"
         
         # 본문 추출 - div.xe_content (텍스트 + 이미지)
-        content_elem = soup.select_one('.xe_content')
-        content = ""
-        if content_elem:
-            # 텍스트 추출
-            text_content = content_elem.get_text(strip=True, separator='\n')
-            
-            # 이미지 URL도 추출 (이미지 기반 게시물 대응)
-            images = content_elem.find_all('img')
-            image_urls = [img.get('src') for img in images if img.get('src')]
-            
-            content = text_content
-            if image_urls:
-                content += "\n\n[이미지]\n" + "\n".join(image_urls)
+        with span("parse.content"):
+            content_elem = soup.select_one(profile["content"])
+            content, blocks = extract_content(content_elem) if content_elem else ("", [])
         
-        # 작성일 추출 - span.date.m_no
-        date_elem = soup.select_one('span.date.m_no')
-        date = date_elem.get_text(strip=True) if date_elem else ""
+        # 작성일 추출 - 데스크톱 span.date.m_no, 모바일 헤더의 span.date
+        with span("parse.date"):
+            date_elem = soup.select_one(profile["date"])
+            date = date_elem.get_text(strip=True) if date_elem else ""
+            # 정렬 / 구간 조회용 정규화 시각 (ISO 8601, 한국 시간 - 알 수 없는 표기면 None)
+            posted = parse_post_date(date)
+            timestamp = posted.isoformat() if posted else None
         
-        # 조회수 추출 - .rd_hd .side.fr 영역의 첫 번째 span
-        views = 0
-        views_elem = soup.select_one('.rd_hd .side.fr span:nth-child(1) b')
-        if views_elem:
-            views_text = views_elem.get_text(strip=True)
-            views_match = re.search(r'(\d+)', views_text.replace(',', ''))
-            if views_match:
-                views = int(views_match.group(1))
+        # 조회수 추출 - 데스크톱 .rd_hd .side.fr 영역의 첫 번째 span
+        with span("parse.views"):
+            views = _number(soup.select_one(profile["views"])) or 0
         
         # 메타데이터
-        metadata = extract_metadata(soup)
+        with span("parse.metadata"):
+            metadata = extract_metadata(soup, profile)
         
         return {
             "url": url,
             "title": title,
             "content": content,
+            "blocks": blocks,
             "date": date,
+            "timestamp": timestamp,
             "views": views,
             "metadata": metadata
         }
@@ -71,41 +157,255 @@ def parse_post_html(html: str, url: str) -> Optional[Dict]:
         return None
 
 
-def extract_metadata(soup: BeautifulSoup) -> Dict:
+class _ContentBuilder:
+    """
+    extract_content 상태 - content 조각(예전 get_text와 같은 규칙)과 블록별 표시 텍스트를 함께 쌓음
+
+    표시 텍스트는 인라인 태그 경계에서 줄을 나누지 않고 원문 공백만 한 칸으로 정리 ("삼성 <b>전자</b>" → "삼성 전자")
+    """
+
+    def __init__(self):
+        self.lines: List[str] = []    # content 조각 (공백을 벗긴 문자열 하나씩)
+        self.length = 0               # 줄바꿈을 포함한 content 길이
+        self.blocks: List = []
+        self.images: List[str] = []
+        self.quote = 0                # blockquote 깊이
+        self.embed = 0                # 임베드 태그 깊이 (안쪽 임베드는 따로 기록하지 않음)
+        self._reset()
+
+    def _reset(self):
+        self.first = None             # 현재 블록의 첫 content 조각 번호
+        self.display: List[str] = []  # 현재 블록 표시 텍스트
+        self.size = 0
+        self.space = False            # 다음 단어 앞에 공백
+        self.at_break = False         # 표시 텍스트가 줄바꿈으로 끝남
+        self.links: List[List] = []   # [href, 시작, 끝] (표시 텍스트 안 위치)
+        self.link: Optional[List] = None
+
+    def _append(self, piece: str):
+        self.display.append(piece)
+        self.size += len(piece)
+
+    def text(self, string: str):
+        stripped = string.strip()
+        if not stripped:
+            self.space = self.space or bool(self.size)
+            return
+
+        # content: 예전 get_text(strip=True, separator='\n')과 같은 조각
+        if self.first is None:
+            self.first = len(self.lines)
+        if self.length:
+            self.length += 1
+        self.lines.append(stripped)
+        self.length += len(stripped)
+
+        # 표시 텍스트
+        if string[0].isspace():
+            self.space = True
+        for index, word in enumerate(string.split()):
+            if (index or self.space) and self.size and not self.at_break:
+                self._append(" ")
+            if self.link is not None and self.link[1] is None:
+                self.link[1] = self.size
+            self._append(word)
+            self.at_break = False
+        self.space = string[-1].isspace()
+
+    def line_break(self):
+        if self.size and not self.at_break:
+            self._append("\n")
+            self.at_break = True
+        self.space = False
+
+    def open_link(self, href: str):
+        self.close_link()
+        self.link = [href, None]
+
+    def close_link(self):
+        if self.link is not None:
+            href, start = self.link
+            self.links.append([href, self.size if start is None else start, self.size])
+            self.link = None
+
+    def flush(self):
+        """현재 블록을 마무리 (블록 경계를 넘는 링크는 다음 블록에서 이어짐)"""
+        href = self.link[0] if self.link is not None else None
+        self.close_link()
+        if self.at_break:
+            self.display.pop()
+            self.size -= 1
+            for link in self.links:
+                link[1] = min(link[1], self.size)
+                link[2] = min(link[2], self.size)
+
+        if self.first is None:
+            # 텍스트 없는 링크
+            self.blocks.extend(["link", link[0], self.length] for link in self.links)
+        else:
+            text = "".join(self.display)
+            shown = None if text == "\n".join(self.lines[self.first:]) else text
+            kind = "quote" if self.quote else "p"
+            links = self.links
+            if kind == "p" and len(links) == 1 and links[0][1] == 0 and links[0][2] == self.size:
+                block = ["link", links[0][0], self.length]
+                if shown is not None:
+                    block.append(shown)
+            elif not links and shown is None:
+                block = self.length if kind == "p" else [kind, self.length]
+            else:
+                block = [kind, self.length, shown]
+                if links:
+                    block.append(links)
+            self.blocks.append(block)
+
+        self._reset()
+        if href is not None:
+            self.link = [href, None]
+
+    def walk(self, parent: Tag):
+        for child in parent.children:
+            kind = type(child)
+            if kind in TEXT_TYPES:
+                self.text(child)
+                continue
+            if kind is not Tag:
+                continue  # 주석 등
+
+            name = child.name
+            if name == "br":
+                self.line_break()
+            elif name == "img":
+                src = child.get('src')
+                if src:
+                    self.flush()
+                    self.blocks.append("img")
+                    self.images.append(src)
+            elif name in EMBED_TAGS:
+                source = child.get('src') or child.get('data')
+                if not source:
+                    inner = child.find('source')
+                    source = inner.get('src') if inner else None
+                if source and not self.embed:
+                    self.flush()
+                    self.blocks.append(["embed", source])
+                # 대체 텍스트도 예전 content처럼 포함
+                self.embed += 1
+                self.walk(child)
+                self.embed -= 1
+            elif name == "blockquote":
+                self.flush()
+                self.quote += 1
+                self.walk(child)
+                self.flush()
+                self.quote -= 1
+            elif name == "a" and child.get('href') and child.find('img') is None:
+                self.open_link(child['href'])
+                self.walk(child)
+                self.close_link()
+            elif name in BLOCK_TAGS:
+                if self.quote:
+                    # 인용 안의 문단은 줄바꿈으로 (인용 하나로 유지)
+                    self.line_break()
+                    self.walk(child)
+                    self.line_break()
+                else:
+                    self.flush()
+                    self.walk(child)
+                    self.flush()
+            else:
+                self.walk(child)
+
+
+def extract_content(content_elem: Tag) -> Tuple[str, List]:
+    """
+    본문 요소를 문서 순서대로 한 번 훑어 content 문자열과 블록 리스트 생성
+    
+    Args:
+        content_elem: 본문 요소 (.xe_content)
+    
+    Returns:
+        (content, blocks) - content는 예전과 같은 형식 (get_text(strip=True, separator='\\n') 뒤에 "[이미지]" 아래 이미지 URL),
+        blocks는 BLOCK_TAGS 위 주석의 형식
+    """
+    builder = _ContentBuilder()
+    builder.walk(content_elem)
+    builder.flush()
+    
+    content = "\n".join(builder.lines)
+    if builder.images:
+        # 이미지 기반 게시물 대응
+        content += "\n\n[이미지]\n" + "\n".join(builder.images)
+    return content, builder.blocks
+
+
+def extract_metadata(soup: BeautifulSoup, profile: Optional[Dict] = None) -> Dict:
     """
     추가 메타데이터 추출
     
     Args:
         soup: BeautifulSoup 객체
+        profile: 선택자 프로필 (기본: 자동 판별)
     
     Returns:
         메타데이터 딕셔너리
     """
     metadata = {}
+    profile = profile or PARSER_PROFILES[detect_layout(soup)]
     
     try:
         # 작성자 - a.member_plate
-        author_elem = soup.select_one('a.member_plate')
+        author_elem = soup.select_one(profile["author"])
         if author_elem:
             metadata['author'] = author_elem.get_text(strip=True)
         
-        # 댓글 수 - .rd_hd .side.fr 영역의 세 번째 span
-        comment_elem = soup.select_one('.rd_hd .side.fr span:nth-child(3) b')
-        if comment_elem:
-            comment_text = comment_elem.get_text(strip=True)
-            comment_match = re.search(r'(\d+)', comment_text.replace(',', ''))
-            if comment_match:
-                metadata['comments'] = int(comment_match.group(1))
+        # 댓글 수 - 데스크톱 .rd_hd .side.fr 영역의 세 번째 span
+        comments = _number(soup.select_one(profile["comments"]))
+        if comments is not None:
+            metadata['comments'] = comments
         
-        # 추천 수 - a.vote_label
-        vote_elem = soup.select_one('a.vote_label')
-        if vote_elem:
-            vote_text = vote_elem.get_text(strip=True)
-            vote_match = re.search(r'(\d+)', vote_text.replace(',', ''))
-            if vote_match:
-                metadata['votes'] = int(vote_match.group(1))
+        # 추천 수 - 데스크톱 a.vote_label
+        votes = _number(soup.select_one(profile["votes"]))
+        if votes is not None:
+            metadata['votes'] = votes
         
     except Exception as e:
         print(f"메타데이터 추출 에러: {e}")
     
     return metadata
+
+
+def parse_listing_html(html: str, base_url: str) -> List[Dict]:
+    """
+    회원 검색 결과 페이지에서 게시물 행 추출 (상세 페이지를 열지 않고 목록에 보이는 값만)
+    
+    Args:
+        html: 검색 결과 HTML
+        base_url: 상대 주소(/<document_srl>)에 붙일 사이트 주소
+    
+    Returns:
+        [{"url", "title", "date", "views", "comments"}] (목록 순서, 날짜는 목록 표기 그대로, 없는 값은 None)
+    """
+    with span("listing.parse"):
+        soup = BeautifulSoup(html, 'lxml')
+        rows = []
+        seen = set()
+        for link in soup.select(LISTING_SELECTORS["link"]):
+            href = link.get('href')
+            if not href or '/board/' in href:  # 댓글 링크 제외
+                continue
+            url = f"{base_url}{href}" if href.startswith('/') else href
+            if url in seen:
+                continue
+            seen.add(url)
+            
+            item = link.find_parent('li') or link.parent
+            date_elem = item.select_one(LISTING_SELECTORS["date"])
+            rows.append({
+                "url": url,
+                "title": link.get_text(strip=True),
+                "date": date_elem.get_text(strip=True) if date_elem else None,
+                "views": _number(item.select_one(LISTING_SELECTORS["views"])),
+                "comments": _number(item.select_one(LISTING_SELECTORS["comments"])),
+            })
+    return rows
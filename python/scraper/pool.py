@@ -0,0 +1,220 @@
+"""
+멀티 프로세스 수집 워커 풀
+조정자(coordinator)가 중복을 제거한 URL 목록을 N개 워커 프로세스에 나눠 주고,
+각 워커는 자기 브라우저로 collect_posts를 실행
+
+    - 요청 간격은 모든 워커가 공유하는 SharedRateLimiter로 제한 (전체 합산 초당 max_rps회)
+    - 게시물 파일(data/raw/post_*.json)은 워커가 직접 저장 (URL 해시 파일명이라 충돌 없음)
+    - 저장 / 실패 / 진행 이벤트는 큐로 조정자에게 전달되어 post_callback, failure_callback,
+      progress_callback이 조정자 프로세스 한 곳에서만 호출됨 (인덱스 / 저널 단일 기록자)
+"""
+
+import asyncio
+import multiprocessing
+import os
+import queue as queue_module
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+from .browser import get_delay_scale, is_mobile_mode, set_delay_scale, set_mobile_mode
+from .journal import url_key
+from .retry import CrawlError
+
+# 기본 워커 수와 전체 워커 합산 요청 한도 (초당, 환경 변수 FMK_MAX_RPS로 조정, 0이면 제한 없음)
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_RPS = float(os.environ.get("FMK_MAX_RPS", "1.0"))
+
+# 이벤트 없이 워커 생존 여부를 확인하는 주기 (초)
+POLL_INTERVAL = 1.0
+
+
+class SharedRateLimiter:
+    """프로세스 간 공유 요청 간격 제한 (다음 요청 시각을 공유 메모리에 예약)"""
+
+    def __init__(self, max_rps: float, ctx=None):
+        """
+        Args:
+            max_rps: 전체 워커 합산 초당 최대 요청 수 (0이면 제한 없음)
+            ctx: multiprocessing 컨텍스트 (워커와 같은 컨텍스트여야 함)
+        """
+        ctx = ctx or multiprocessing.get_context("spawn")
+        self.interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self._next = ctx.RawValue('d', 0.0)
+        self._lock = ctx.Lock()
+
+    def reserve(self) -> float:
+        """
+        다음 요청 시각 예약
+
+        Returns:
+            예약한 시각까지 기다려야 하는 시간 (초)
+        """
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next.value)
+            self._next.value = slot + self.interval
+        return slot - now
+
+    async def wait(self):
+        """예약한 시각까지 대기"""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def canonical_urls(urls: List[str]) -> List[str]:
+    """document_srl 기준으로 중복을 제거한 URL 목록 (처음 나온 순서 유지)"""
+    seen = set()
+    unique = []
+    for url in urls:
+        key = url_key(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(url)
+    return unique
+
+
+def exit_with_parent():
+    """조정자가 강제 종료되면 (UI의 중지 버튼 등) 워커도 종료"""
+    parent = multiprocessing.parent_process()
+    if parent is None:
+        return
+
+    def watch():
+        parent.join()
+        os._exit(1)
+
+    threading.Thread(target=watch, daemon=True).start()
+
+
+def _worker_main(worker_id: int, urls: List[str], output_dir: str, headless: bool,
+                 delay_scale: float, mobile: bool, rate_limiter: SharedRateLimiter, events):
+    """워커 프로세스 진입점: 할당된 URL을 수집하며 이벤트를 큐로 전달"""
+    from .collector import collect_posts
+
+    exit_with_parent()
+    sys.stdout.reconfigure(line_buffering=True)
+    set_delay_scale(delay_scale)
+    set_mobile_mode(mobile)
+    saved = 0
+
+    def on_progress(message, progress):
+        events.put(("started", worker_id))
+
+    def on_saved(post, filepath):
+        nonlocal saved
+        saved += 1
+        events.put(("saved", worker_id, post, filepath))
+
+    def on_failed(url, error):
+        events.put(("failed", worker_id, url, error.kind, str(error), error.status))
+
+    try:
+        asyncio.run(collect_posts(
+            urls=urls,
+            output_dir=output_dir,
+            progress_callback=on_progress,
+            post_callback=on_saved,
+            failure_callback=on_failed,
+            headless=headless,
+            rate_limiter=rate_limiter
+        ))
+    except Exception as e:
+        print(f"❌ 워커 {worker_id} 에러: {e}")
+    finally:
+        events.put(("done", worker_id, saved))
+
+
+async def collect_posts_parallel(
+    urls: List[str],
+    output_dir: str = "data/raw",
+    workers: int = DEFAULT_WORKERS,
+    progress_callback: Optional[Callable] = None,
+    post_callback: Optional[Callable] = None,
+    failure_callback: Optional[Callable] = None,
+    headless: bool = False,
+    max_rps: float = DEFAULT_MAX_RPS
+) -> List[str]:
+    """
+    게시물 URL 리스트를 여러 워커 프로세스로 나눠 수집 (collect_posts와 같은 콜백 규약)
+
+    Args:
+        urls: 게시물 URL 리스트
+        output_dir: 저장 디렉토리
+        workers: 워커 프로세스 수 (각자 브라우저 1개)
+        progress_callback: 진행률 콜백 함수 (전체 워커 합산)
+        post_callback: 게시물 저장 직후 조정자에서 호출되는 콜백 함수 (post_data, filepath)
+        failure_callback: 재시도 후에도 실패한 게시물마다 조정자에서 호출되는 콜백 함수 (url, CrawlError)
+        headless: 헤드리스 모드 여부
+        max_rps: 전체 워커 합산 초당 최대 요청 수 (0이면 제한 없음)
+
+    Returns:
+        저장된 파일 경로 리스트 (저장된 순서)
+    """
+    urls = canonical_urls(urls)
+    if not urls:
+        return []
+    workers = max(1, min(workers, len(urls)))
+
+    ctx = multiprocessing.get_context("spawn")
+    events = ctx.Queue()
+    rate_limiter = SharedRateLimiter(max_rps, ctx)
+    procs = [
+        ctx.Process(
+            target=_worker_main,
+            args=(i, urls[i::workers], output_dir, headless, get_delay_scale(), is_mobile_mode(), rate_limiter, events),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    print(f"👷 워커 {workers}개로 {len(urls)}개 게시물 수집 (초당 최대 {max_rps:g}회)" if max_rps > 0
+          else f"👷 워커 {workers}개로 {len(urls)}개 게시물 수집")
+    for proc in procs:
+        proc.start()
+
+    loop = asyncio.get_running_loop()
+    saved_files = []
+    started = 0
+    total = len(urls)
+    running = set(range(workers))
+
+    try:
+        while running:
+            try:
+                event = await loop.run_in_executor(None, events.get, True, POLL_INTERVAL)
+            except queue_module.Empty:
+                # 완료 이벤트 없이 죽은 워커 정리
+                for i in list(running):
+                    if not procs[i].is_alive():
+                        print(f"⚠️  워커 {i}가 비정상 종료되었습니다 (종료 코드 {procs[i].exitcode})")
+                        running.discard(i)
+                continue
+
+            kind = event[0]
+            if kind == "started":
+                started += 1
+                if progress_callback:
+                    progress_callback(f"게시물 {started}/{total} 수집 중... (워커 {workers}개)", 50 + (started / total * 50))
+            elif kind == "saved":
+                _, _, post, filepath = event
+                saved_files.append(filepath)
+                if post_callback:
+                    post_callback(post, filepath)
+            elif kind == "failed":
+                _, _, url, error_kind, message, status = event
+                if failure_callback:
+                    failure_callback(url, CrawlError(error_kind, message, status=status))
+            elif kind == "done":
+                running.discard(event[1])
+    finally:
+        for proc in procs:
+            await asyncio.to_thread(proc.join, 5)
+            if proc.is_alive():
+                proc.terminate()
+
+    print(f"\n🎉 워커 {workers}개 합계 {len(saved_files)}개 게시물 파일 저장 완료")
+    return saved_files
@@ -0,0 +1,220 @@
+"""
+수집 재시도 정책
+에러 분류 (timeout / network / http / challenge / parse), 지수 백오프 + 지터,
+에러 종류별 실패 비율이 치솟으면 전체 수집을 일시 정지하는 서킷 브레이커
+"""
+
+import asyncio
+import random
+from collections import Counter, deque
+from typing import Dict, Optional
+
+# 에러 종류
+ERROR_KINDS = ("timeout", "network", "http", "challenge", "parse", "other")
+
+# 에러 종류별 최대 시도 횟수 (첫 시도 포함)
+DEFAULT_MAX_ATTEMPTS = {
+    "timeout": 4,
+    "network": 4,
+    "http": 4,
+    "challenge": 3,
+    "parse": 2,
+    "other": 2,
+}
+
+# 재시도해도 결과가 같은 HTTP 상태 (없는 글, 삭제된 글, 권한 없음)
+PERMANENT_HTTP_STATUS = {401, 403, 404, 410}
+
+
+class CrawlError(Exception):
+    """분류된 게시물 수집 실패"""
+
+    def __init__(self, kind: str, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Args:
+            kind: 에러 종류 (ERROR_KINDS)
+            message: 에러 메시지
+            status: HTTP 상태 코드 (http 에러)
+            retry_after: 서버가 요청한 대기 시간 (초, Retry-After 헤더)
+        """
+        super().__init__(message)
+        self.kind = kind
+        self.status = status
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 연속으로 열려 수집을 중단"""
+
+
+def classify_error(exc: Exception) -> CrawlError:
+    """
+    예외를 CrawlError로 분류
+
+    Args:
+        exc: 수집 중 발생한 예외 (Playwright 예외 포함)
+
+    Returns:
+        CrawlError
+    """
+    if isinstance(exc, CrawlError):
+        return exc
+
+    message = str(exc).strip().splitlines()[0] if str(exc).strip() else type(exc).__name__
+    # Playwright의 TimeoutError는 내장 TimeoutError를 상속하지 않으므로 이름으로 판별
+    if isinstance(exc, asyncio.TimeoutError) or type(exc).__name__ == "TimeoutError":
+        return CrawlError("timeout", message)
+    if "net::ERR_" in message or isinstance(exc, ConnectionError):
+        return CrawlError("network", message)
+    return CrawlError("other", message)
+
+
+def http_error(status: int, headers: Optional[Dict[str, str]] = None) -> CrawlError:
+    """
+    HTTP 에러 응답 → CrawlError (Retry-After 헤더가 초 단위면 반영)
+
+    Args:
+        status: HTTP 상태 코드
+        headers: 응답 헤더 (소문자 키)
+
+    Returns:
+        CrawlError
+    """
+    retry_after = None
+    value = (headers or {}).get("retry-after", "")
+    if value.strip().isdigit():
+        retry_after = float(value)
+    return CrawlError("http", f"HTTP {status}", status=status, retry_after=retry_after)
+
+
+def is_challenge_html(html: str) -> bool:
+    """Cloudflare 챌린지 대기 페이지인지 여부"""
+    return "challenges.cloudflare.com" in html or "<title>Just a moment" in html
+
+
+class RetryPolicy:
+    """에러 종류별 재시도 횟수 + 지수 백오프 (full jitter)"""
+
+    def __init__(
+        self,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        max_attempts: Optional[Dict[str, int]] = None,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Args:
+            base_delay: 첫 재시도 대기 상한 (초, 재시도마다 2배)
+            max_delay: 대기 상한 (초)
+            max_attempts: 에러 종류별 최대 시도 횟수 (DEFAULT_MAX_ATTEMPTS 덮어쓰기)
+            rng: 지터용 난수 생성기
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = {**DEFAULT_MAX_ATTEMPTS, **(max_attempts or {})}
+        self.rng = rng or random.Random()
+
+    def attempts_for(self, error: CrawlError) -> int:
+        """이 에러에 허용되는 최대 시도 횟수"""
+        if error.kind == "http" and error.status in PERMANENT_HTTP_STATUS:
+            return 1
+        return self.max_attempts.get(error.kind, 1)
+
+    def should_retry(self, error: CrawlError, attempt: int) -> bool:
+        """
+        Args:
+            error: 방금 실패한 에러
+            attempt: 방금 끝난 시도 번호 (1부터)
+
+        Returns:
+            다시 시도할지 여부
+        """
+        return attempt < self.attempts_for(error)
+
+    def backoff(self, error: CrawlError, attempt: int) -> float:
+        """
+        다음 시도까지 대기 시간 (초): [0, min(max_delay, base_delay * 2^(attempt-1))] 균등 분포
+        서버가 Retry-After를 보냈으면 그보다 짧게 기다리지 않음
+
+        Args:
+            error: 방금 실패한 에러
+            attempt: 방금 끝난 시도 번호 (1부터)
+        """
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = self.rng.uniform(0, cap)
+        if error.retry_after is not None:
+            delay = max(delay, min(error.retry_after, self.max_delay))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    에러 종류별 서킷 브레이커
+    최근 window번의 시도 중 한 종류의 실패 비율이 threshold 이상이면 열림 → 전체 수집 일시 정지
+    연속으로 열릴 때마다 정지 시간을 2배로 늘리고, max_trips번 연속으로 열리면 수집 중단
+    """
+
+    def __init__(
+        self,
+        window: int = 20,
+        threshold: float = 0.5,
+        min_samples: int = 8,
+        cooldown: float = 60.0,
+        max_cooldown: float = 600.0,
+        max_trips: int = 5
+    ):
+        """
+        Args:
+            window: 실패 비율을 계산할 최근 시도 수
+            threshold: 열림 기준 실패 비율 (에러 종류별)
+            min_samples: 판정에 필요한 최소 시도 수
+            cooldown: 첫 일시 정지 시간 (초)
+            max_cooldown: 일시 정지 시간 상한 (초)
+            max_trips: 성공 없이 연속으로 열릴 수 있는 횟수
+        """
+        self.window = window
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.max_trips = max_trips
+        self.trips = 0
+        self._outcomes = deque(maxlen=window)
+
+    def record_success(self):
+        """성공 기록 (연속 열림 횟수 초기화)"""
+        self._outcomes.append(None)
+        self.trips = 0
+
+    def record_failure(self, kind: str):
+        """실패 기록"""
+        self._outcomes.append(kind)
+
+    def tripped(self) -> Optional[str]:
+        """
+        Returns:
+            실패 비율이 기준을 넘은 에러 종류 (없으면 None)
+        """
+        if len(self._outcomes) < self.min_samples:
+            return None
+        counts = Counter(kind for kind in self._outcomes if kind)
+        for kind, count in counts.most_common():
+            if count / len(self._outcomes) >= self.threshold:
+                return kind
+        return None
+
+    def open(self) -> float:
+        """
+        서킷 열기: 최근 기록을 비우고 (정지 후 새로 판정) 일시 정지 시간 반환
+
+        Returns:
+            일시 정지 시간 (초)
+
+        Raises:
+            CircuitOpenError: 성공 없이 max_trips번 연속으로 열린 경우
+        """
+        self.trips += 1
+        self._outcomes.clear()
+        if self.trips > self.max_trips:
+            raise CircuitOpenError(f"서킷 브레이커가 {self.max_trips}회 연속으로 열려 수집을 중단합니다")
+        return min(self.max_cooldown, self.cooldown * (2 ** (self.trips - 1)))
@@ -0,0 +1,177 @@
+"""
+새 게시물 감시 모드
+브라우저 세션 하나를 계속 유지하면서 회원마다 검색 결과 1페이지만 주기적으로(지터 포함) 확인하고,
+로컬 저장소(data/raw)에 없는 document_srl만 상세 수집
+
+폴링 한 번의 비용은 회원당 검색 결과 HTTP 요청 한 번 (렌더링 없음, 컨텍스트 쿠키 공유)
+쿠키 만료로 챌린지가 오면 그때만 탭에서 로딩해 통과
+"""
+
+import json
+import random
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set
+
+from .assetcache import open_asset_cache
+from .browser import create_stealth_browser, random_delay
+from .collector import (
+    BASE_URL, asset_cache_dir, canonical_url, fetch_listing, fetch_with_retry, member_search_url, save_post,
+)
+from .journal import url_key
+from .parser import parse_listing_html
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy, classify_error
+from .watchdog import PageWatchdog
+
+# 폴링 주기 (초)와 지터 비율 (주기의 ±20% 범위에서 무작위)
+WATCH_INTERVAL = 300.0
+WATCH_JITTER = 0.2
+
+# 같은 폴링에서 회원 사이 대기 (초)
+MEMBER_GAP = (2.0, 4.0)
+
+
+def load_known_posts(output_dir: str) -> Set[str]:
+    """
+    로컬 저장소에 이미 있는 게시물 키 (document_srl, 없으면 URL)
+
+    Args:
+        output_dir: 게시물 JSON 디렉토리
+
+    Returns:
+        게시물 키 집합
+    """
+    known = set()
+    for path in Path(output_dir).glob("post_*.json"):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                known.add(url_key(json.load(f)["url"]))
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+    return known
+
+
+def next_poll_delay(interval: float, jitter: float) -> float:
+    """다음 폴링까지 대기 시간 (interval ± interval * jitter)"""
+    return max(0.0, interval * random.uniform(1 - jitter, 1 + jitter))
+
+
+async def watch_members(
+    member_ids: List[str],
+    output_dir: str = "data/raw",
+    interval: float = WATCH_INTERVAL,
+    jitter: float = WATCH_JITTER,
+    max_polls: int = 0,
+    new_post_callback: Optional[Callable] = None,
+    failure_callback: Optional[Callable] = None,
+    poll_callback: Optional[Callable] = None,
+    base_url: str = BASE_URL,
+    headless: bool = False,
+    retry_policy: Optional[RetryPolicy] = None,
+    circuit_breaker: Optional[CircuitBreaker] = None
+) -> Dict:
+    """
+    회원들의 새 게시물을 감시하며 수집 (max_polls번 폴링하거나 서킷 브레이커가 수집을 중단할 때까지)
+
+    Args:
+        member_ids: 감시할 회원번호 리스트
+        output_dir: 게시물 JSON 디렉토리 (기존 파일은 유지, 여기 없는 게시물만 수집)
+        interval: 폴링 주기 (초)
+        jitter: 주기 지터 비율 (0이면 고정 주기)
+        max_polls: 폴링 횟수 (0이면 무한)
+        new_post_callback: 새 게시물 저장 직후 호출되는 콜백 함수 (member_id, post_data, filepath)
+        failure_callback: 재시도 후에도 실패한 게시물마다 호출되는 콜백 함수 (url, CrawlError)
+        poll_callback: 폴링 한 번이 끝날 때마다 호출되는 콜백 함수 (poll, new_files)
+        base_url: 사이트 주소
+        headless: 헤드리스 모드 여부
+        retry_policy: 재시도 정책 (기본: RetryPolicy())
+        circuit_breaker: 서킷 브레이커 (기본: CircuitBreaker())
+
+    Returns:
+        {"polls", "listings", "listing_errors", "new_posts", "failed"}
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    retry_policy = retry_policy or RetryPolicy()
+    circuit_breaker = circuit_breaker or CircuitBreaker()
+
+    known = load_known_posts(str(output_path))
+    # 이번 감시 중 최종 실패한 게시물 (삭제 / 권한 없음 등 - 다음 폴링에서 다시 시도하지 않음)
+    given_up: Set[str] = set()
+    stats = {"polls": 0, "listings": 0, "listing_errors": 0, "new_posts": 0, "failed": 0}
+    print(f"👀 회원 {len(member_ids)}명 감시 시작 (저장된 게시물 {len(known)}개, 주기 {interval:.0f}초 ±{jitter:.0%})")
+
+    def on_failed(url, error):
+        given_up.add(url_key(url))
+        stats["failed"] += 1
+        if failure_callback:
+            failure_callback(url, error)
+
+    browser = await create_stealth_browser(headless=headless)
+    asset_cache = open_asset_cache(asset_cache_dir(output_dir))
+    # 폴링 사이에도 같은 컨텍스트(쿠키 / 캐시)를 유지
+    watchdog = PageWatchdog(browser, asset_cache=asset_cache)
+
+    try:
+        while not max_polls or stats["polls"] < max_polls:
+            if stats["polls"]:
+                delay = next_poll_delay(interval, jitter)
+                await random_delay(delay, delay)
+            stats["polls"] += 1
+            new_files = []
+
+            for index, member_id in enumerate(member_ids):
+                if index:
+                    await random_delay(*MEMBER_GAP)
+
+                url = member_search_url(member_id, 1, base_url)
+                try:
+                    html = await watchdog.run(lambda page: fetch_listing(page, url))
+                except Exception as e:
+                    error = classify_error(e)
+                    circuit_breaker.record_failure(error.kind)
+                    stats["listing_errors"] += 1
+                    print(f"⚠️  회원 {member_id} 검색 결과 확인 실패 ({error.kind}): {error} - 다음 폴링에서 다시 확인")
+                    continue
+                circuit_breaker.record_success()
+                stats["listings"] += 1
+
+                rows = parse_listing_html(html, base_url)
+                unseen = []
+                for row in rows:
+                    key = url_key(canonical_url(row["url"]))
+                    if key not in known and key not in given_up:
+                        unseen.append(canonical_url(row["url"]))
+                if not unseen:
+                    continue
+                print(f"🆕 회원 {member_id}: 새 게시물 {len(unseen)}개")
+
+                # 오래된 글부터 저장 (목록은 최신순)
+                for post_url in reversed(unseen):
+                    post_data = await fetch_with_retry(
+                        watchdog, post_url, retry_policy, circuit_breaker, failure_callback=on_failed
+                    )
+                    if not post_data:
+                        continue
+                    filepath = save_post(post_data, output_path, post_url)
+                    known.add(url_key(post_url))
+                    new_files.append(filepath)
+                    stats["new_posts"] += 1
+                    print(f"✅ 저장: {Path(filepath).name} - {post_data.get('title', 'N/A')[:50]}...")
+                    if new_post_callback:
+                        new_post_callback(member_id, post_data, filepath)
+
+            print(f"🔄 폴링 {stats['polls']}회: 새 게시물 {len(new_files)}개 (누적 {stats['new_posts']}개)")
+            if poll_callback:
+                poll_callback(stats["polls"], new_files)
+
+    except CircuitOpenError as e:
+        print(f"⛔ {e} (감시 종료, 새 게시물 {stats['new_posts']}개 저장)")
+    finally:
+        if asset_cache:
+            print(asset_cache.summary())
+        try:
+            await browser.close()
+        except:
+            pass
+
+    return stats
@@ -0,0 +1,253 @@
+"""
+수집 페이지 감시자
+게시물 한 건마다 제한 시간을 강제하고, 멈춘 탭은 닫고 새로 만들며,
+N번 탐색하거나 탭 메모리(CDP Performance.getMetrics)가 기준을 넘으면 탭/컨텍스트를 교체하여
+긴 수집에서도 처리 속도와 메모리를 일정하게 유지
+
+게시물 본문(.xe_content)은 서버에서 렌더링되므로, JS 컨텍스트에서 Cloudflare 통과 쿠키를 얻은 뒤에는
+JavaScript를 끈 두 번째 컨텍스트에 쿠키를 복사하여 사이트 / 광고 스크립트 실행 없이 게시물을 로딩
+"""
+
+import asyncio
+import os
+from typing import Awaitable, Callable, Optional
+
+from playwright.async_api import Browser, BrowserContext, CDPSession, Page
+
+from .browser import create_context
+from .retry import CrawlError
+from metrics import span
+
+# 게시물 한 건 제한 시간 (초) - goto 30초 + 챌린지 대기 + 랜덤 지연보다 넉넉하게
+ITEM_DEADLINE = 90.0
+
+# 교체 주기 (탐색 횟수)
+RECYCLE_PAGE_EVERY = 100
+RECYCLE_CONTEXT_EVERY = 500
+
+# 탭 JS 힙 사용량 기준 (MB)과 측정 주기 (탐색 횟수)
+MEMORY_LIMIT_MB = 512
+MEMORY_CHECK_EVERY = 10
+
+# 멈춘 탭을 닫을 때 기다리는 시간 (초)
+CLOSE_TIMEOUT = 5.0
+
+# JavaScript를 끈 컨텍스트로 게시물 로딩 (환경 변수 FMK_STATIC_POSTS=0이면 항상 JS 컨텍스트 사용)
+STATIC_PAGES = os.environ.get("FMK_STATIC_POSTS", "1") != "0"
+
+
+class PageWatchdog:
+    """
+    탭 하나를 재사용하되 제한 시간 / 탐색 횟수 / 메모리 기준으로 교체
+
+    static_pages면 JS 컨텍스트와 쿠키를 공유하는 JavaScript 없는 컨텍스트(탭 하나)를 함께 관리하고,
+    run(task, javascript=False)로 그 탭에서 작업 실행 (JS 탭이 한 번 성공해 쿠키를 얻은 뒤부터 사용 가능)
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        item_deadline: float = ITEM_DEADLINE,
+        recycle_page_every: int = RECYCLE_PAGE_EVERY,
+        recycle_context_every: int = RECYCLE_CONTEXT_EVERY,
+        memory_limit_mb: float = MEMORY_LIMIT_MB,
+        memory_check_every: int = MEMORY_CHECK_EVERY,
+        static_pages: bool = STATIC_PAGES,
+        asset_cache=None
+    ):
+        """
+        Args:
+            browser: Browser 인스턴스 (컨텍스트를 새로 만들 때 사용)
+            item_deadline: 게시물 한 건 제한 시간 (초)
+            recycle_page_every: 이 횟수만큼 탐색하면 탭 교체 (0이면 끔)
+            recycle_context_every: 이 횟수만큼 탐색하면 컨텍스트 교체 (0이면 끔)
+            memory_limit_mb: 탭 JS 힙 사용량이 이 값을 넘으면 컨텍스트 교체 (0이면 끔)
+            memory_check_every: 메모리 측정 주기 (탐색 횟수)
+            static_pages: JavaScript를 끈 두 번째 컨텍스트 사용 여부
+            asset_cache: 새 컨텍스트마다 연결할 정적 에셋 캐시 (AssetCache)
+        """
+        self.browser = browser
+        self.item_deadline = item_deadline
+        self.recycle_page_every = recycle_page_every
+        self.recycle_context_every = recycle_context_every
+        self.memory_limit_mb = memory_limit_mb
+        self.memory_check_every = memory_check_every
+        self.static_pages = static_pages
+        self.asset_cache = asset_cache
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.static_context: Optional[BrowserContext] = None
+        self.static_page: Optional[Page] = None
+        self._cdp: Optional[CDPSession] = None
+        self._cleared = False
+        self._page_navigations = 0
+        self._static_navigations = 0
+        self._context_navigations = 0
+        self.stats = {
+            "navigations": 0, "static_navigations": 0, "js_fallbacks": 0, "hung": 0,
+            "page_recycles": 0, "context_recycles": 0, "peak_heap_mb": 0.0,
+        }
+
+    @property
+    def static_ready(self) -> bool:
+        """JavaScript 없는 탭을 쓸 수 있는지 (JS 탭에서 쿠키를 얻은 뒤)"""
+        return self.static_pages and self._cleared
+
+    async def run(self, task: Callable[[Page], Awaitable], javascript: bool = True):
+        """
+        현재 탭으로 작업 실행 (제한 시간을 넘기면 탭을 교체하고 timeout 에러)
+
+        Args:
+            task: 탭을 받아 실행할 코루틴 함수 (예: lambda page: fetch_post(page, url))
+            javascript: False면 JavaScript를 끈 컨텍스트의 탭 사용 (static_ready일 때만)
+
+        Returns:
+            task 결과
+
+        Raises:
+            CrawlError: 제한 시간 초과 (kind="timeout")
+        """
+        static = not javascript and self.static_ready
+        page = await (self._ensure_static_page() if static else self._ensure_page())
+        try:
+            result = await asyncio.wait_for(task(page), timeout=self.item_deadline)
+            if not static and self.static_pages:
+                try:
+                    await self.share_cookies()
+                except Exception as e:
+                    # 쿠키를 복사할 수 없으면 JavaScript 없는 탭은 쓰지 않음 (수집 결과에는 영향 없음)
+                    print(f"⚠️  JavaScript 없는 컨텍스트 준비 실패 - JS 탭만 사용: {e}")
+                    self.static_pages = False
+            return result
+        except asyncio.TimeoutError:
+            self.stats["hung"] += 1
+            print(f"⏰ {self.item_deadline:.0f}초 제한 시간 초과 - 탭 교체")
+            await self.recycle_page(static)
+            raise CrawlError("timeout", f"게시물 제한 시간 {self.item_deadline:.0f}초 초과")
+        finally:
+            await self._after_navigation(static)
+
+    async def _ensure_page(self) -> Page:
+        if self.context is None:
+            self.context = await self._new_context()
+            self._context_navigations = 0
+        if self.page is None or self.page.is_closed():
+            self.page = await self.context.new_page()
+            self._cdp = None
+            self._page_navigations = 0
+        return self.page
+
+    async def _ensure_static_page(self) -> Page:
+        if self.static_context is None:
+            await self.share_cookies()
+        if self.static_page is None or self.static_page.is_closed():
+            self.static_page = await self.static_context.new_page()
+            self._static_navigations = 0
+        return self.static_page
+
+    async def _new_context(self, javascript: bool = True) -> BrowserContext:
+        context = await create_context(self.browser, javascript=javascript)
+        if self.asset_cache:
+            await self.asset_cache.attach(context)
+        return context
+
+    async def share_cookies(self):
+        """JS 컨텍스트의 쿠키(cf_clearance 등)를 JavaScript 없는 컨텍스트에 복사"""
+        if self.context is None:
+            return
+        with span("post.cookies"):
+            if self.static_context is None:
+                self.static_context = await self._new_context(javascript=False)
+            await self.static_context.add_cookies(await self.context.cookies())
+        self._cleared = True
+
+    async def _after_navigation(self, static: bool = False):
+        """탐색 횟수 / 메모리 기준에 따라 탭 또는 컨텍스트 교체"""
+        self.stats["navigations"] += 1
+        self._context_navigations += 1
+
+        if self.recycle_context_every and self._context_navigations >= self.recycle_context_every:
+            await self.recycle_context()
+            return
+
+        if static:
+            # JavaScript가 없는 탭은 힙이 거의 늘지 않으므로 탐색 횟수로만 교체
+            self.stats["static_navigations"] += 1
+            self._static_navigations += 1
+            if self.recycle_page_every and self._static_navigations >= self.recycle_page_every:
+                await self.recycle_page(static=True)
+            return
+
+        self._page_navigations += 1
+
+        if self.memory_limit_mb and self.page is not None and self._page_navigations % self.memory_check_every == 0:
+            heap_mb = await self.heap_used_mb()
+            if heap_mb is not None:
+                self.stats["peak_heap_mb"] = max(self.stats["peak_heap_mb"], round(heap_mb, 1))
+                if heap_mb > self.memory_limit_mb:
+                    print(f"♻️  탭 메모리 {heap_mb:.0f}MB > {self.memory_limit_mb:.0f}MB - 컨텍스트 교체")
+                    await self.recycle_context()
+                    return
+
+        if self.recycle_page_every and self._page_navigations >= self.recycle_page_every:
+            await self.recycle_page()
+
+    async def heap_used_mb(self) -> Optional[float]:
+        """
+        현재 탭의 JS 힙 사용량 (CDP Performance.getMetrics)
+
+        Returns:
+            MB 단위 사용량 (측정 불가 시 None)
+        """
+        try:
+            if self._cdp is None:
+                self._cdp = await self.context.new_cdp_session(self.page)
+                await self._cdp.send("Performance.enable")
+            result = await asyncio.wait_for(self._cdp.send("Performance.getMetrics"), timeout=CLOSE_TIMEOUT)
+        except Exception:
+            # CDP를 지원하지 않는 브라우저이거나 탭이 응답하지 않음
+            self._cdp = None
+            return None
+        metrics = {item["name"]: item["value"] for item in result.get("metrics", [])}
+        if "JSHeapUsedSize" not in metrics:
+            return None
+        return metrics["JSHeapUsedSize"] / 1024 / 1024
+
+    async def recycle_page(self, static: bool = False):
+        """
+        탭 닫고 다음 작업에서 새로 생성 (닫기도 멈추면 컨텍스트째 교체)
+
+        Args:
+            static: JavaScript 없는 탭을 교체
+        """
+        if static:
+            page, self.static_page = self.static_page, None
+        else:
+            page, self.page, self._cdp = self.page, None, None
+        if page is None:
+            return
+        self.stats["page_recycles"] += 1
+        with span("post.recycle"):
+            try:
+                await asyncio.wait_for(page.close(), timeout=CLOSE_TIMEOUT)
+            except Exception:
+                await self.recycle_context()
+
+    async def recycle_context(self):
+        """컨텍스트(쿠키 / 캐시 / 탭 전체) 닫고 다음 작업에서 새로 생성"""
+        self.stats["context_recycles"] += 1
+        await self.close()
+
+    async def close(self):
+        """현재 컨텍스트 닫기 (JavaScript 없는 컨텍스트도 함께 닫고 쿠키는 다시 얻음)"""
+        contexts = [self.context, self.static_context]
+        self.context, self.page, self._cdp = None, None, None
+        self.static_context, self.static_page, self._cleared = None, None, False
+        for context in contexts:
+            if context is None:
+                continue
+            with span("post.recycle"):
+                try:
+                    await asyncio.wait_for(context.close(), timeout=CLOSE_TIMEOUT)
+                except Exception as e:
+                    print(f"⚠️  컨텍스트 닫기 실패 (무시): {e}")
@@ -0,0 +1,17 @@
+"""분산 수집 작업 큐 (SQLite 파일 / Redis 호환 서버, 각 모듈은 처음 사용할 때 로딩)"""
+
+from lazyimport import lazy_exports
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    'WORK_QUEUES': '.base',
+    'WorkQueue': '.base',
+    'register_work_queue': '.base',
+    'open_work_queue': '.base',
+    'member_item': '.base',
+    'post_item': '.base',
+    'SQLiteWorkQueue': '.sqlite_queue',
+    'RedisWorkQueue': '.redis_queue',
+    'run_worker': '.worker',
+    'run_distributed': '.coordinator',
+    'materialize_posts': '.coordinator',
+})
@@ -0,0 +1,193 @@
+"""
+분산 수집 작업 큐 공통 규약
+여러 머신의 워커가 같은 큐에서 작업을 임대(lease)하고, 하트비트로 임대를 연장하며,
+임대가 만료된 작업은 다른 워커가 다시 가져감
+
+작업 종류:
+    member  회원 게시물 검색 (payload: member_id, max_pages, since, until) → 찾은 게시물을 post 작업으로 추가
+    post    게시물 수집 (payload: url, member) → 결과는 document_srl 키로 upsert
+
+같은 키의 작업 추가와 같은 document_srl의 게시물 저장은 몇 번을 반복해도 결과가 같으므로
+임대 만료 등으로 같은 작업이 두 번 처리되어도 문제 없음
+
+새 저장소는 WorkQueue를 상속하고 @register_work_queue("스킴")으로 등록하면 open_work_queue에서 사용 가능
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Type
+from urllib.parse import urlparse
+
+from postkeys import get_post_id
+
+# 임대 기간 (초) - 워커는 이 시간의 1/3마다 하트비트로 연장
+LEASE_TTL = 120.0
+
+# 작업당 최대 임대 횟수 (넘으면 failed)
+MAX_ATTEMPTS = 5
+
+# 최대 임대 횟수를 다 쓴 채 임대가 만료된 작업의 실패 사유 (error_kind: timeout)
+LEASE_EXPIRED_ERROR = "임대 만료 - 워커가 최대 시도 횟수 안에 작업을 끝내지 못했습니다"
+
+# 시도했지만 완료 / 실패 기록 없이 반환된 작업이 최대 임대 횟수를 다 썼을 때의 실패 사유 (error_kind: other)
+RELEASE_EXHAUSTED_ERROR = "결과 저장 실패 - 최대 시도 횟수 안에 작업을 끝내지 못했습니다"
+
+# 작업 상태
+STATES = ("pending", "leased", "done", "failed")
+
+WORK_QUEUES: Dict[str, Type["WorkQueue"]] = {}
+
+
+def register_work_queue(scheme: str):
+    """
+    작업 큐 저장소 등록 데코레이터
+
+    Args:
+        scheme: 큐 주소 스킴 (예: sqlite, redis)
+    """
+    def decorator(cls):
+        cls.scheme = scheme
+        WORK_QUEUES[scheme] = cls
+        return cls
+    return decorator
+
+
+def open_work_queue(queue_url: str) -> "WorkQueue":
+    """
+    큐 주소로 작업 큐 열기
+
+    Args:
+        queue_url: "sqlite:///공유/경로/work.sqlite", "redis://localhost:6379/0" 또는 파일 경로
+
+    Returns:
+        WorkQueue 인스턴스
+    """
+    from . import redis_queue, sqlite_queue  # noqa: F401 (저장소 등록)
+
+    scheme = urlparse(queue_url).scheme
+    if len(scheme) <= 1:
+        # 스킴 없는 경로 (Windows 드라이브 문자 포함)는 SQLite 파일
+        return WORK_QUEUES["sqlite"](queue_url)
+    if scheme not in WORK_QUEUES:
+        raise ValueError(f"알 수 없는 작업 큐: {queue_url} (지원: {', '.join(WORK_QUEUES)})")
+    return WORK_QUEUES[scheme].from_url(queue_url)
+
+
+def member_item(member_id: str, max_pages: int, since: Optional[datetime] = None, until: Optional[datetime] = None) -> Dict:
+    """회원 게시물 검색 작업 (작성일 구간은 ISO 8601 문자열로 저장, 없으면 None)"""
+    payload = {
+        "member_id": member_id,
+        "max_pages": max_pages,
+        "since": since.isoformat() if since else None,
+        "until": until.isoformat() if until else None,
+    }
+    return {"key": f"member:{member_id}", "kind": "member", "payload": payload}
+
+
+def post_item(url: str, member_id: Optional[str] = None) -> Dict:
+    """게시물 수집 작업 (키: document_srl, 없으면 URL)"""
+    srl = get_post_id({"url": url})
+    return {"key": f"post:{srl or url}", "kind": "post", "payload": {"url": url, "member": member_id}}
+
+
+class WorkQueue:
+    """
+    작업 큐 기본 클래스
+
+    작업은 {"key", "kind", "payload", "attempts"} 딕셔너리로 주고받음
+    """
+
+    scheme = ""
+
+    @classmethod
+    def from_url(cls, queue_url: str) -> "WorkQueue":
+        raise NotImplementedError
+
+    def put(self, items: List[Dict]) -> int:
+        """
+        작업 추가 (이미 있는 키는 상태를 유지하고 payload만 갱신 - 다시 실행할 때 바뀐 max_pages / since / until 반영)
+
+        Returns:
+            새로 추가된 작업 수
+        """
+        raise NotImplementedError
+
+    def requeue(self, member_ids: List[str]):
+        """회원 검색 작업과 그 회원의 게시물 작업을 다시 pending으로 (새로 수집할 때)"""
+        raise NotImplementedError
+
+    def lease(self, owner: str, limit: int = 1, ttl: float = LEASE_TTL) -> List[Dict]:
+        """
+        처리할 작업 임대 (pending이거나 임대가 만료된 작업, member 작업 우선)
+        임대가 만료됐는데 이미 max_attempts번 임대한 작업은 다시 임대하지 않고 failed (error_kind: timeout)
+
+        Args:
+            owner: 워커 ID
+            limit: 최대 개수
+            ttl: 임대 기간 (초)
+
+        Returns:
+            임대한 작업 리스트 (attempts는 이번 임대 포함)
+        """
+        raise NotImplementedError
+
+    def heartbeat(self, keys: List[str], owner: str, ttl: float = LEASE_TTL) -> List[str]:
+        """
+        임대 연장
+
+        Returns:
+            아직 이 워커가 임대 중인 키 (만료되어 다른 워커가 가져간 키는 제외)
+        """
+        raise NotImplementedError
+
+    def complete(self, key: str, owner: str):
+        """작업 완료 (임대를 잃었어도 완료로 기록 - 결과 저장이 멱등이므로)"""
+        raise NotImplementedError
+
+    def fail(self, key: str, owner: str, error: str, kind: str = "other", retry_after: Optional[float] = None):
+        """
+        작업 실패 기록
+
+        Args:
+            key: 작업 키
+            owner: 워커 ID
+            error: 에러 메시지
+            kind: 에러 종류 (scraper.retry.ERROR_KINDS)
+            retry_after: 다시 시도할 때까지 대기 시간 (초, None이거나 최대 시도 횟수를 넘으면 failed)
+        """
+        raise NotImplementedError
+
+    def release(self, keys: List[str], owner: str, attempted: bool = False):
+        """
+        처리하지 못한 작업을 바로 pending으로 반환
+
+        Args:
+            keys: 작업 키 리스트
+            owner: 워커 ID
+            attempted: False면 시작하지 못한 작업 (이번 임대를 횟수에서 뺌),
+                True면 시도했지만 결과를 기록하지 못한 작업 (임대 횟수 유지, 최대 시도 횟수를 다 썼으면 failed)
+        """
+        raise NotImplementedError
+
+    def upsert_post(self, post: Dict, member_id: Optional[str] = None, owner: Optional[str] = None):
+        """게시물 결과 저장 (document_srl 키, 같은 게시물은 덮어쓰기)"""
+        raise NotImplementedError
+
+    def posts(self, member_ids: Optional[List[str]] = None) -> Iterator[Dict]:
+        """저장된 게시물 (member_ids가 있으면 해당 회원의 게시물만)"""
+        raise NotImplementedError
+
+    def failures(self, member_ids: Optional[List[str]] = None) -> List[Dict]:
+        """failed 상태의 게시물 작업 ({"key", "url", "kind", "error", "attempts"})"""
+        raise NotImplementedError
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """작업 종류별 상태별 개수 ({"member": {"pending": 1, ...}, "post": {...}})"""
+        raise NotImplementedError
+
+    def idle(self) -> bool:
+        """pending / leased 작업이 하나도 없는지 여부"""
+        counts = self.counts()
+        return not any(states.get("pending", 0) or states.get("leased", 0) for states in counts.values())
+
+    def close(self):
+        pass
@@ -0,0 +1,142 @@
+"""
+분산 수집 조정자
+회원 검색 작업을 큐에 넣고, 이 머신에서 로컬 워커를 띄운 뒤 (다른 머신의 워커도 같은 큐에 참여 가능)
+큐 상태를 진행률로 보고하고, 큐가 비면 수집된 게시물을 data/raw로 내려받음
+"""
+
+import asyncio
+import hashlib
+import json
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from exporter.cache import write_if_changed
+
+from .base import member_item, open_work_queue
+from .worker import default_worker_id, worker_process_main
+
+# 기본 로컬 워커 수와 큐 상태 확인 주기 (초)
+DEFAULT_WORKERS = 1
+STATUS_INTERVAL = 1.0
+
+
+def materialize_posts(queue, member_ids: List[str], output_dir: str, post_callback: Optional[Callable] = None) -> List[str]:
+    """
+    큐에 저장된 게시물을 수집기와 같은 파일명(post_<URL 해시>.json)으로 저장
+
+    Args:
+        queue: 작업 큐
+        member_ids: 내려받을 회원번호 리스트
+        output_dir: 저장 디렉토리
+        post_callback: 저장 직후 호출되는 콜백 함수 (post_data, filepath)
+
+    Returns:
+        저장된 파일 경로 리스트
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    saved_files = []
+    for post in queue.posts(member_ids):
+        filepath = output_path / f"post_{hashlib.md5(post['url'].encode()).hexdigest()[:8]}.json"
+        write_if_changed(filepath, json.dumps(post, ensure_ascii=False, indent=2).encode('utf-8'))
+        saved_files.append(str(filepath))
+        if post_callback:
+            post_callback(post, str(filepath))
+    return saved_files
+
+
+async def run_distributed(
+    queue_url: str,
+    member_ids: List[str],
+    max_pages: int = 10,
+    output_dir: str = "data/raw",
+    workers: int = DEFAULT_WORKERS,
+    refresh: bool = True,
+    progress_callback: Optional[Callable] = None,
+    post_callback: Optional[Callable] = None,
+    failure_callback: Optional[Callable] = None,
+    headless: bool = False,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> List[str]:
+    """
+    회원 목록을 작업 큐로 분산 수집
+
+    Args:
+        queue_url: 작업 큐 주소 (모든 워커가 접근 가능해야 함)
+        member_ids: 회원번호 리스트
+        max_pages: 회원당 최대 검색 페이지 수
+        output_dir: 게시물 파일 저장 디렉토리
+        workers: 이 머신에서 띄울 워커 프로세스 수 (0이면 다른 머신의 워커만 사용)
+        refresh: 이미 완료된 회원 / 게시물도 다시 수집 (False면 큐에 남은 작업만 이어서 처리)
+        progress_callback: 진행률 콜백 함수
+        post_callback: 내려받은 게시물마다 호출되는 콜백 함수 (post_data, filepath)
+        failure_callback: 최종 실패한 게시물마다 호출되는 콜백 함수 (url, CrawlError)
+        headless: 헤드리스 모드 여부
+        since: 이 시각 이후 작성된 게시물만 (회원 검색 작업에 기록)
+        until: 이 시각 이전 작성된 게시물만
+
+    Returns:
+        저장된 파일 경로 리스트
+    """
+    from scraper import get_delay_scale, is_mobile_mode
+    from scraper.retry import CrawlError
+
+    queue = open_work_queue(queue_url)
+    added = queue.put([member_item(member_id, max_pages, since, until) for member_id in member_ids])
+    if refresh:
+        queue.requeue(member_ids)
+    print(f"🗂️  작업 큐: {queue_url} (회원 {len(member_ids)}명, 새 작업 {added}개)")
+
+    ctx = multiprocessing.get_context("spawn")
+    procs = [
+        ctx.Process(
+            target=worker_process_main,
+            args=(queue_url, default_worker_id(i), output_dir, headless, get_delay_scale(), is_mobile_mode()),
+            daemon=True,
+        )
+        for i in range(workers)
+    ]
+    for proc in procs:
+        proc.start()
+
+    try:
+        while True:
+            counts = queue.counts()
+            members = counts.get("member", {})
+            posts = counts.get("post", {})
+            members_total = sum(members.values())
+            posts_total = sum(posts.values())
+            posts_finished = posts.get("done", 0) + posts.get("failed", 0)
+            if progress_callback:
+                if members.get("pending") or members.get("leased") or not posts_total:
+                    members_finished = members.get("done", 0) + members.get("failed", 0)
+                    progress_callback(f"회원 {members_finished}/{members_total}명 검색 중...",
+                                      members_finished / max(members_total, 1) * 50)
+                else:
+                    progress_callback(f"게시물 {posts_finished}/{posts_total} 수집 중... (워커 {workers}개)",
+                                      50 + posts_finished / posts_total * 45)
+
+            if queue.idle():
+                break
+            if procs and not any(proc.is_alive() for proc in procs):
+                print("⚠️  로컬 워커가 모두 종료되었습니다 (남은 작업은 다른 워커가 처리하거나 다시 실행하면 이어서 처리)")
+                break
+            await asyncio.sleep(STATUS_INTERVAL)
+    finally:
+        for proc in procs:
+            proc.join(timeout=10)
+            if proc.is_alive():
+                proc.terminate()
+
+    saved_files = materialize_posts(queue, member_ids, output_dir, post_callback)
+    failures = queue.failures(member_ids)
+    if failure_callback:
+        for failure in failures:
+            failure_callback(failure["url"], CrawlError(failure["kind"], failure["error"]))
+    queue.close()
+
+    print(f"\n🎉 분산 수집 완료: 게시물 {len(saved_files)}개, 실패 {len(failures)}개")
+    return saved_files
@@ -0,0 +1,252 @@
+"""
+Redis 호환 작업 큐 (선택)
+로컬 Redis / Valkey / KeyDB 등 Redis 프로토콜 서버를 작업 큐로 사용 (pip install redis 필요)
+임대 / 연장 / 실패 처리는 Lua 스크립트로 원자적으로 실행
+
+키 구조 (접두어 기본값 "fmk:wq:"):
+    item:<키>        작업 해시 (kind, payload, member, state, attempts, owner, expires, error, error_kind)
+    ready            pending 작업 정렬 집합 (점수: 실행 가능 시각, member 작업은 먼저)
+    leases           임대 중인 작업 정렬 집합 (점수: 임대 만료 시각)
+    kind:<종류>      종류별 작업 키 집합
+    member:<회원>    회원별 작업 키 집합
+    posts            document_srl → 게시물 JSON 해시
+    post_member      document_srl → 회원번호 해시
+"""
+
+import json
+import time
+from typing import Dict, Iterator, List, Optional
+
+from postkeys import get_post_id
+
+from .base import (
+    LEASE_EXPIRED_ERROR, LEASE_TTL, MAX_ATTEMPTS, RELEASE_EXHAUSTED_ERROR, STATES, WorkQueue, register_work_queue,
+)
+
+# member 작업이 post 작업보다 먼저 임대되도록 ready 점수에서 빼는 값
+MEMBER_PRIORITY = 1e10
+
+_PUT = """
+local prefix = ARGV[1]
+if redis.call('EXISTS', prefix .. 'item:' .. ARGV[2]) == 1 then
+    -- 이미 있는 작업은 상태를 유지하고 payload만 이번 실행 값으로 갱신
+    redis.call('HSET', prefix .. 'item:' .. ARGV[2], 'payload', ARGV[4])
+    return 0
+end
+redis.call('HSET', prefix .. 'item:' .. ARGV[2], 'kind', ARGV[3], 'payload', ARGV[4], 'member', ARGV[5],
+           'state', 'pending', 'attempts', 0)
+redis.call('ZADD', prefix .. 'ready', tonumber(ARGV[6]), ARGV[2])
+redis.call('SADD', prefix .. 'kind:' .. ARGV[3], ARGV[2])
+if ARGV[5] ~= '' then redis.call('SADD', prefix .. 'member:' .. ARGV[5], ARGV[2]) end
+return 1
+"""
+
+_LEASE = """
+local prefix, now, limit, owner, expires = ARGV[1], tonumber(ARGV[2]), tonumber(ARGV[3]), ARGV[4], ARGV[5]
+local max_attempts, member_score = tonumber(ARGV[6]), tonumber(ARGV[8])
+for _, key in ipairs(redis.call('ZRANGEBYSCORE', prefix .. 'leases', '-inf', now)) do
+    local item = prefix .. 'item:' .. key
+    redis.call('ZREM', prefix .. 'leases', key)
+    if tonumber(redis.call('HGET', item, 'attempts') or 0) >= max_attempts then
+        -- 최대 시도 횟수를 다 쓴 채 임대가 만료된 작업은 다시 임대하지 않음
+        redis.call('HSET', item, 'state', 'failed', 'error', ARGV[7], 'error_kind', 'timeout')
+    else
+        redis.call('HSET', item, 'state', 'pending')
+        -- 다시 넣을 때도 member 작업이 먼저 임대되도록 종류별 점수 유지
+        redis.call('ZADD', prefix .. 'ready', redis.call('HGET', item, 'kind') == 'member' and member_score or 0, key)
+    end
+end
+local taken = {}
+for _, key in ipairs(redis.call('ZRANGEBYSCORE', prefix .. 'ready', '-inf', now, 'LIMIT', 0, limit)) do
+    local item = prefix .. 'item:' .. key
+    redis.call('ZREM', prefix .. 'ready', key)
+    redis.call('ZADD', prefix .. 'leases', expires, key)
+    redis.call('HSET', item, 'state', 'leased', 'owner', owner, 'expires', expires)
+    local attempts = redis.call('HINCRBY', item, 'attempts', 1)
+    table.insert(taken, {key, redis.call('HGET', item, 'kind'), redis.call('HGET', item, 'payload'), attempts})
+end
+return taken
+"""
+
+_HEARTBEAT = """
+local prefix, owner, expires = ARGV[1], ARGV[2], ARGV[3]
+local held = {}
+for i = 4, #ARGV do
+    local item = prefix .. 'item:' .. ARGV[i]
+    if redis.call('HGET', item, 'state') == 'leased' and redis.call('HGET', item, 'owner') == owner then
+        redis.call('HSET', item, 'expires', expires)
+        redis.call('ZADD', prefix .. 'leases', expires, ARGV[i])
+        table.insert(held, ARGV[i])
+    end
+end
+return held
+"""
+
+_FINISH = """
+local prefix, key, state, available_at = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+local item = prefix .. 'item:' .. key
+if redis.call('EXISTS', item) == 0 then return 0 end
+if ARGV[8] ~= '1' and state ~= 'done' and redis.call('HGET', item, 'state') == 'done' then return 0 end
+redis.call('ZREM', prefix .. 'leases', key)
+redis.call('ZREM', prefix .. 'ready', key)
+redis.call('HSET', item, 'state', state, 'owner', ARGV[5], 'error', ARGV[6], 'error_kind', ARGV[7])
+if state == 'pending' then redis.call('ZADD', prefix .. 'ready', tonumber(available_at), key) end
+return 1
+"""
+
+_RELEASE = """
+local prefix, owner, attempted, max_attempts = ARGV[1], ARGV[2], ARGV[3] == '1', tonumber(ARGV[4])
+local member_score = tonumber(ARGV[6])
+for i = 7, #ARGV do
+    local item = prefix .. 'item:' .. ARGV[i]
+    if redis.call('HGET', item, 'state') == 'leased' and redis.call('HGET', item, 'owner') == owner then
+        redis.call('ZREM', prefix .. 'leases', ARGV[i])
+        if attempted and tonumber(redis.call('HGET', item, 'attempts') or 0) >= max_attempts then
+            redis.call('HSET', item, 'state', 'failed', 'error', ARGV[5], 'error_kind', 'other')
+        else
+            redis.call('HSET', item, 'state', 'pending')
+            if not attempted then redis.call('HINCRBY', item, 'attempts', -1) end
+            redis.call('ZADD', prefix .. 'ready', redis.call('HGET', item, 'kind') == 'member' and member_score or 0, ARGV[i])
+        end
+    end
+end
+return 1
+"""
+
+
+@register_work_queue("redis")
+class RedisWorkQueue(WorkQueue):
+    """Redis 호환 서버 작업 큐"""
+
+    def __init__(self, client, prefix: str = "fmk:wq:", max_attempts: int = MAX_ATTEMPTS):
+        """
+        Args:
+            client: redis.Redis 클라이언트 (decode_responses=True)
+            prefix: 키 접두어 (여러 큐를 한 서버에 둘 때 구분)
+            max_attempts: 작업당 최대 임대 횟수
+        """
+        self.client = client
+        self.prefix = prefix
+        self.max_attempts = max_attempts
+        self._put = client.register_script(_PUT)
+        self._lease = client.register_script(_LEASE)
+        self._heartbeat = client.register_script(_HEARTBEAT)
+        self._finish = client.register_script(_FINISH)
+        self._release = client.register_script(_RELEASE)
+
+    @classmethod
+    def from_url(cls, queue_url: str) -> "RedisWorkQueue":
+        try:
+            import redis
+        except ImportError:
+            raise ImportError("Redis 작업 큐를 사용하려면 redis 패키지가 필요합니다 (pip install redis)")
+        return cls(redis.Redis.from_url(queue_url, decode_responses=True))
+
+    def _item(self, key: str) -> str:
+        return f"{self.prefix}item:{key}"
+
+    def put(self, items: List[Dict]) -> int:
+        added = 0
+        for item in items:
+            member = item["payload"].get("member") or item["payload"].get("member_id") or ""
+            score = -MEMBER_PRIORITY if item["kind"] == "member" else 0
+            added += self._put(args=[
+                self.prefix, item["key"], item["kind"], json.dumps(item["payload"], ensure_ascii=False), member, score
+            ])
+        return added
+
+    def requeue(self, member_ids: List[str]):
+        for member_id in member_ids:
+            for key in self.client.smembers(f"{self.prefix}member:{member_id}"):
+                kind = self.client.hget(self._item(key), "kind")
+                self._finish(args=[self.prefix, key, "pending", -MEMBER_PRIORITY if kind == "member" else 0, "", "", "", 1])
+                self.client.hset(self._item(key), "attempts", 0)
+
+    def lease(self, owner: str, limit: int = 1, ttl: float = LEASE_TTL) -> List[Dict]:
+        now = time.time()
+        rows = self._lease(args=[
+            self.prefix, now, limit, owner, now + ttl, self.max_attempts, LEASE_EXPIRED_ERROR, -MEMBER_PRIORITY
+        ])
+        return [
+            {"key": key, "kind": kind, "payload": json.loads(payload), "attempts": int(attempts)}
+            for key, kind, payload, attempts in rows
+        ]
+
+    def heartbeat(self, keys: List[str], owner: str, ttl: float = LEASE_TTL) -> List[str]:
+        if not keys:
+            return []
+        return list(self._heartbeat(args=[self.prefix, owner, time.time() + ttl, *keys]))
+
+    def complete(self, key: str, owner: str):
+        self._finish(args=[self.prefix, key, "done", 0, owner, "", "", 0])
+
+    def fail(self, key: str, owner: str, error: str, kind: str = "other", retry_after: Optional[float] = None):
+        attempts = int(self.client.hget(self._item(key), "attempts") or 0)
+        retry = retry_after is not None and attempts < self.max_attempts
+        self._finish(args=[
+            self.prefix, key, "pending" if retry else "failed", time.time() + (retry_after or 0), owner, error, kind, 0
+        ])
+
+    def release(self, keys: List[str], owner: str, attempted: bool = False):
+        if keys:
+            self._release(args=[
+                self.prefix, owner, 1 if attempted else 0, self.max_attempts, RELEASE_EXHAUSTED_ERROR, -MEMBER_PRIORITY,
+                *keys
+            ])
+
+    def upsert_post(self, post: Dict, member_id: Optional[str] = None, owner: Optional[str] = None):
+        srl = str(get_post_id(post) or post["url"])
+        pipe = self.client.pipeline()
+        pipe.hset(f"{self.prefix}posts", srl, json.dumps(post, ensure_ascii=False))
+        if member_id:
+            pipe.hset(f"{self.prefix}post_member", srl, member_id)
+        pipe.execute()
+
+    def _post_srls(self, member_ids: Optional[List[str]]) -> List[str]:
+        if not member_ids:
+            return sorted(self.client.hkeys(f"{self.prefix}posts"))
+        wanted = set(member_ids)
+        owners = self.client.hgetall(f"{self.prefix}post_member")
+        return sorted(srl for srl, member in owners.items() if member in wanted)
+
+    def posts(self, member_ids: Optional[List[str]] = None) -> Iterator[Dict]:
+        for srl in self._post_srls(member_ids):
+            data = self.client.hget(f"{self.prefix}posts", srl)
+            if data:
+                yield json.loads(data)
+
+    def failures(self, member_ids: Optional[List[str]] = None) -> List[Dict]:
+        failed = []
+        for key in sorted(self.client.smembers(f"{self.prefix}kind:post")):
+            item = self.client.hgetall(self._item(key))
+            if item.get("state") != "failed" or (member_ids and item.get("member") not in member_ids):
+                continue
+            failed.append({
+                "key": key,
+                "url": json.loads(item["payload"])["url"],
+                "kind": item.get("error_kind") or "other",
+                "error": item.get("error", ""),
+                "attempts": int(item.get("attempts", 0)),
+            })
+        return failed
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        now = time.time()
+        counts: Dict[str, Dict[str, int]] = {}
+        for kind in ("member", "post"):
+            keys = list(self.client.smembers(f"{self.prefix}kind:{kind}"))
+            if not keys:
+                continue
+            pipe = self.client.pipeline()
+            for key in keys:
+                pipe.hmget(self._item(key), "state", "expires")
+            states = {state: 0 for state in STATES}
+            for state, expires in pipe.execute():
+                if state == "leased" and expires and float(expires) < now:
+                    state = "pending"
+                states[state] = states.get(state, 0) + 1
+            counts[kind] = {state: count for state, count in states.items() if count}
+        return counts
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,247 @@
+"""
+SQLite 작업 큐 (기본값)
+공유 폴더(네트워크 드라이브)의 SQLite 파일 하나로 여러 머신의 워커가 협업
+
+네트워크 파일 시스템에서는 WAL 모드의 공유 메모리가 동작하지 않으므로 rollback 저널을 사용하고,
+임대는 BEGIN IMMEDIATE 트랜잭션 안에서 골라서 갱신하여 두 워커가 같은 작업을 동시에 가져가지 않도록 함
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from postkeys import get_post_id
+
+from .base import LEASE_EXPIRED_ERROR, LEASE_TTL, MAX_ATTEMPTS, RELEASE_EXHAUSTED_ERROR, WorkQueue, register_work_queue
+
+# 다른 워커가 쓰기 잠금을 잡고 있을 때 기다리는 시간 (초)
+BUSY_TIMEOUT = 30.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    member TEXT,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    available_at REAL NOT NULL DEFAULT 0,
+    error TEXT,
+    error_kind TEXT,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_ready ON items (state, available_at);
+CREATE INDEX IF NOT EXISTS items_member ON items (member);
+CREATE TABLE IF NOT EXISTS posts (
+    srl TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    member TEXT,
+    data TEXT NOT NULL,
+    worker TEXT,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS posts_member ON posts (member);
+"""
+
+
+@register_work_queue("sqlite")
+class SQLiteWorkQueue(WorkQueue):
+    """SQLite 파일 작업 큐"""
+
+    def __init__(self, db_path: str = "data/queue/work.sqlite", max_attempts: int = MAX_ATTEMPTS):
+        """
+        Args:
+            db_path: 큐 파일 경로 (여러 머신이 쓰려면 공유 폴더)
+            max_attempts: 작업당 최대 임대 횟수
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        # 트랜잭션은 직접 관리 (BEGIN IMMEDIATE)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=BUSY_TIMEOUT, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=DELETE")
+        self.conn.executescript(SCHEMA)
+
+    @classmethod
+    def from_url(cls, queue_url: str) -> "SQLiteWorkQueue":
+        # sqlite:///상대경로, sqlite:////절대경로, sqlite:///C:/경로
+        path = queue_url.split("://", 1)[1]
+        path = path[1:] if path.startswith("/") else path
+        return cls(path)
+
+    def _write(self, func):
+        """쓰기 트랜잭션 (다른 워커와 직렬화)"""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = func()
+            self.conn.execute("COMMIT")
+            return result
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def put(self, items: List[Dict]) -> int:
+        now = time.time()
+
+        def insert():
+            added = 0
+            for item in items:
+                exists = self.conn.execute("SELECT 1 FROM items WHERE key = ?", (item["key"],)).fetchone()
+                # 이미 있는 작업은 상태를 유지하고 payload(max_pages / since / until 등)만 이번 실행 값으로 갱신
+                self.conn.execute(
+                    """INSERT INTO items (key, kind, payload, member, updated) VALUES (?, ?, ?, ?, ?)
+                       ON CONFLICT (key) DO UPDATE SET payload = excluded.payload, updated = excluded.updated""",
+                    (item["key"], item["kind"], json.dumps(item["payload"], ensure_ascii=False),
+                     item["payload"].get("member") or item["payload"].get("member_id"), now)
+                )
+                added += not exists
+            return added
+
+        return self._write(insert)
+
+    def requeue(self, member_ids: List[str]):
+        marks = ",".join("?" * len(member_ids))
+        self._write(lambda: self.conn.execute(
+            f"""UPDATE items SET state = 'pending', attempts = 0, available_at = 0,
+                lease_owner = NULL, lease_expires = NULL, error = NULL, error_kind = NULL, updated = ?
+                WHERE member IN ({marks})""",
+            (time.time(), *member_ids)
+        ))
+
+    def lease(self, owner: str, limit: int = 1, ttl: float = LEASE_TTL) -> List[Dict]:
+        def take():
+            now = time.time()
+            # 임대가 만료된 채 최대 시도 횟수를 다 쓴 작업 (워커 중단 / 멈춤)은 다시 임대하지 않고 실패 처리
+            self.conn.execute(
+                """UPDATE items SET state = 'failed', lease_owner = NULL, lease_expires = NULL,
+                   error = ?, error_kind = 'timeout', updated = ?
+                   WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?""",
+                (LEASE_EXPIRED_ERROR, now, now, self.max_attempts)
+            )
+            rows = self.conn.execute(
+                """SELECT key, kind, payload, attempts FROM items
+                   WHERE (state = 'pending' AND available_at <= ?) OR (state = 'leased' AND lease_expires < ?)
+                   ORDER BY kind = 'post', rowid LIMIT ?""",
+                (now, now, limit)
+            ).fetchall()
+            for key, *_ in rows:
+                self.conn.execute(
+                    """UPDATE items SET state = 'leased', lease_owner = ?, lease_expires = ?,
+                       attempts = attempts + 1, updated = ? WHERE key = ?""",
+                    (owner, now + ttl, now, key)
+                )
+            return [
+                {"key": key, "kind": kind, "payload": json.loads(payload), "attempts": attempts + 1}
+                for key, kind, payload, attempts in rows
+            ]
+
+        return self._write(take)
+
+    def heartbeat(self, keys: List[str], owner: str, ttl: float = LEASE_TTL) -> List[str]:
+        def extend():
+            now = time.time()
+            held = []
+            for key in keys:
+                cursor = self.conn.execute(
+                    """UPDATE items SET lease_expires = ?, updated = ?
+                       WHERE key = ? AND state = 'leased' AND lease_owner = ?""",
+                    (now + ttl, now, key, owner)
+                )
+                if cursor.rowcount:
+                    held.append(key)
+            return held
+
+        return self._write(extend)
+
+    def complete(self, key: str, owner: str):
+        self._write(lambda: self.conn.execute(
+            """UPDATE items SET state = 'done', lease_owner = ?, lease_expires = NULL,
+               error = NULL, error_kind = NULL, updated = ? WHERE key = ?""",
+            (owner, time.time(), key)
+        ))
+
+    def fail(self, key: str, owner: str, error: str, kind: str = "other", retry_after: Optional[float] = None):
+        def record():
+            now = time.time()
+            row = self.conn.execute("SELECT attempts, state FROM items WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] == "done":
+                # 다른 워커가 이미 완료한 작업
+                return
+            retry = retry_after is not None and row[0] < self.max_attempts
+            self.conn.execute(
+                """UPDATE items SET state = ?, available_at = ?, lease_owner = NULL, lease_expires = NULL,
+                   error = ?, error_kind = ?, updated = ? WHERE key = ?""",
+                ("pending" if retry else "failed", now + (retry_after or 0), error, kind, now, key)
+            )
+
+        self._write(record)
+
+    def release(self, keys: List[str], owner: str, attempted: bool = False):
+        def give_back():
+            now = time.time()
+            for key in keys:
+                if attempted:
+                    self.conn.execute(
+                        """UPDATE items SET state = 'failed', lease_owner = NULL, lease_expires = NULL,
+                           error = ?, error_kind = 'other', updated = ?
+                           WHERE key = ? AND state = 'leased' AND lease_owner = ? AND attempts >= ?""",
+                        (RELEASE_EXHAUSTED_ERROR, now, key, owner, self.max_attempts)
+                    )
+                self.conn.execute(
+                    """UPDATE items SET state = 'pending', attempts = MAX(attempts - ?, 0),
+                       lease_owner = NULL, lease_expires = NULL, updated = ?
+                       WHERE key = ? AND state = 'leased' AND lease_owner = ?""",
+                    (0 if attempted else 1, now, key, owner)
+                )
+
+        self._write(give_back)
+
+    def upsert_post(self, post: Dict, member_id: Optional[str] = None, owner: Optional[str] = None):
+        srl = str(get_post_id(post) or post["url"])
+        self._write(lambda: self.conn.execute(
+            """INSERT INTO posts (srl, url, member, data, worker, updated) VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT (srl) DO UPDATE SET url = excluded.url, member = COALESCE(excluded.member, member),
+               data = excluded.data, worker = excluded.worker, updated = excluded.updated""",
+            (srl, post["url"], member_id, json.dumps(post, ensure_ascii=False), owner, time.time())
+        ))
+
+    def _member_filter(self, member_ids: Optional[List[str]]) -> tuple:
+        if not member_ids:
+            return "", ()
+        return f" AND member IN ({','.join('?' * len(member_ids))})", tuple(member_ids)
+
+    def posts(self, member_ids: Optional[List[str]] = None) -> Iterator[Dict]:
+        where, params = self._member_filter(member_ids)
+        for (data,) in self.conn.execute(f"SELECT data FROM posts WHERE 1 = 1{where} ORDER BY srl", params):
+            yield json.loads(data)
+
+    def failures(self, member_ids: Optional[List[str]] = None) -> List[Dict]:
+        where, params = self._member_filter(member_ids)
+        rows = self.conn.execute(
+            f"""SELECT key, payload, error_kind, error, attempts FROM items
+                WHERE kind = 'post' AND state = 'failed'{where} ORDER BY rowid""",
+            params
+        ).fetchall()
+        return [
+            {"key": key, "url": json.loads(payload)["url"], "kind": kind or "other", "error": error or "", "attempts": attempts}
+            for key, payload, kind, error, attempts in rows
+        ]
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        now = time.time()
+        counts: Dict[str, Dict[str, int]] = {}
+        rows = self.conn.execute(
+            """SELECT kind, CASE WHEN state = 'leased' AND lease_expires < ? THEN 'pending' ELSE state END AS s, COUNT(*)
+               FROM items GROUP BY kind, s""",
+            (now,)
+        )
+        for kind, state, count in rows:
+            counts.setdefault(kind, {})[state] = counts.get(kind, {}).get(state, 0) + count
+        return counts
+
+    def close(self):
+        self.conn.close()
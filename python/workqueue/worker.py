@@ -0,0 +1,206 @@
+"""
+분산 수집 워커
+작업 큐에서 작업을 임대하여 기존 수집 함수(collect_posts_by_member / collect_posts)로 처리
+여러 머신에서 같은 큐 주소로 `main.py worker <큐 주소>`를 실행하면 함께 수집
+"""
+
+import asyncio
+import os
+import socket
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from .base import LEASE_TTL, WorkQueue, open_work_queue, post_item
+
+# 한 번에 임대하는 게시물 작업 수 (브라우저 한 번 실행으로 처리, 회원 검색 작업은 하나씩)
+BATCH_SIZE = 10
+
+# 처리할 작업이 없을 때 큐를 다시 확인하는 주기 (초)
+POLL_INTERVAL = 2.0
+
+# 큐 수준 재시도 대기 (초, 임대 횟수마다 2배) - 수집기 안의 즉시 재시도와 별개로 나중에 다른 워커가 다시 시도
+REQUEUE_DELAY = 60.0
+MAX_REQUEUE_DELAY = 3600.0
+
+
+def default_worker_id(index: int = 0) -> str:
+    """머신 / 프로세스를 구분하는 워커 ID"""
+    return f"{socket.gethostname()}-{os.getpid()}-{index}"
+
+
+def requeue_delay(error, attempts: int) -> Optional[float]:
+    """
+    실패한 작업을 큐에 되돌릴 때 대기 시간
+
+    Args:
+        error: CrawlError
+        attempts: 지금까지의 임대 횟수
+
+    Returns:
+        대기 시간 (초, 재시도해도 소용없는 에러면 None)
+    """
+    from scraper.retry import RetryPolicy
+
+    if RetryPolicy().attempts_for(error) <= 1:
+        return None
+    delay = min(MAX_REQUEUE_DELAY, REQUEUE_DELAY * (2 ** (attempts - 1)))
+    return max(delay, error.retry_after or 0)
+
+
+async def _keep_leases(queue: WorkQueue, held: Set[str], owner: str, ttl: float):
+    """처리 중인 작업의 임대를 ttl/3마다 연장"""
+    while True:
+        await asyncio.sleep(ttl / 3)
+        if not held:
+            continue
+        still = set(queue.heartbeat(list(held), owner, ttl))
+        lost = held - still
+        if lost:
+            # 다른 워커가 가져갔을 수 있지만 결과 저장은 멱등이므로 계속 진행
+            print(f"⚠️  임대 만료: {len(lost)}개 작업 (중복 처리되어도 결과는 같음)")
+            held -= lost
+
+
+async def _process_member(queue: WorkQueue, item: Dict, owner: str, held: Set[str], stats: Dict,
+                          output_dir: str, headless: bool):
+    """회원 게시물 검색 → post 작업 추가"""
+    from scraper import collect_posts_by_member
+    from scraper.retry import CrawlError
+
+    payload = item["payload"]
+    member_id = payload["member_id"]
+    urls = await collect_posts_by_member(
+        member_id=member_id,
+        max_pages=payload["max_pages"],
+        headless=headless,
+        output_dir=output_dir,
+        since=datetime.fromisoformat(payload["since"]) if payload.get("since") else None,
+        until=datetime.fromisoformat(payload["until"]) if payload.get("until") else None
+    )
+    if not urls:
+        error = CrawlError("other", f"회원 {member_id}의 게시물을 찾을 수 없습니다")
+        queue.fail(item["key"], owner, str(error), error.kind, requeue_delay(error, item["attempts"]))
+    else:
+        added = queue.put([post_item(url, member_id) for url in urls])
+        queue.complete(item["key"], owner)
+        print(f"📥 회원 {member_id}: 게시물 {len(urls)}개 발견 (새 작업 {added}개)")
+        stats["members"] += 1
+    held.discard(item["key"])
+
+
+async def _process_posts(queue: WorkQueue, items: List[Dict], owner: str, held: Set[str], attempted: Set[str],
+                         stats: Dict, output_dir: str, headless: bool):
+    """게시물 수집 → document_srl 키로 결과 upsert"""
+    from scraper import collect_posts
+    from scraper.journal import url_key
+
+    # 저장된 post["url"]은 리디렉션 후 주소일 수 있으므로 큐 / 저널과 같은 document_srl 키로 찾음
+    by_key = {url_key(item["payload"]["url"]): item for item in items}
+    started = iter(items)
+
+    def on_progress(message, progress):
+        # collect_posts는 URL마다 수집 시작 전에 순서대로 진행률을 알림
+        item = next(started, None)
+        if item:
+            attempted.add(item["key"])
+
+    def on_saved(post, filepath):
+        item = by_key[url_key(post["url"])]
+        queue.upsert_post(post, item["payload"].get("member"), owner)
+        queue.complete(item["key"], owner)
+        held.discard(item["key"])
+        stats["posts"] += 1
+
+    def on_failed(url, error):
+        item = by_key[url_key(url)]
+        queue.fail(item["key"], owner, str(error), error.kind, requeue_delay(error, item["attempts"]))
+        held.discard(item["key"])
+        stats["failed"] += 1
+
+    await collect_posts(
+        urls=[item["payload"]["url"] for item in items],
+        output_dir=output_dir,
+        progress_callback=on_progress,
+        post_callback=on_saved,
+        failure_callback=on_failed,
+        headless=headless
+    )
+
+
+async def run_worker(
+    queue: WorkQueue,
+    worker_id: Optional[str] = None,
+    output_dir: str = "data/raw",
+    batch_size: int = BATCH_SIZE,
+    ttl: float = LEASE_TTL,
+    follow: bool = False,
+    headless: bool = False
+) -> Dict:
+    """
+    큐가 빌 때까지 작업 처리
+
+    Args:
+        queue: 작업 큐
+        worker_id: 워커 ID (기본: 호스트-PID)
+        output_dir: 게시물 파일 저장 디렉토리 (이 머신의 로컬 사본)
+        batch_size: 한 번에 임대하는 작업 수
+        ttl: 임대 기간 (초)
+        follow: 큐가 비어도 종료하지 않고 새 작업을 기다림
+        headless: 헤드리스 모드 여부
+
+    Returns:
+        처리 통계 {"worker", "members", "posts", "failed"}
+    """
+    worker_id = worker_id or default_worker_id()
+    stats = {"worker": worker_id, "members": 0, "posts": 0, "failed": 0}
+    print(f"👷 워커 {worker_id} 시작")
+
+    while True:
+        # 회원 검색은 오래 걸리므로 한 워커가 여러 회원을 몰아 가져가지 않도록 하나만 임대
+        items = queue.lease(worker_id, limit=1, ttl=ttl)
+        if items and items[0]["kind"] == "post" and batch_size > 1:
+            items += queue.lease(worker_id, limit=batch_size - 1, ttl=ttl)
+        if not items:
+            if not follow and queue.idle():
+                break
+            await asyncio.sleep(POLL_INTERVAL)
+            continue
+
+        held = {item["key"] for item in items}
+        attempted: Set[str] = set()
+        heartbeat = asyncio.create_task(_keep_leases(queue, held, worker_id, ttl))
+        try:
+            for item in items:
+                if item["kind"] == "member":
+                    attempted.add(item["key"])
+                    await _process_member(queue, item, worker_id, held, stats, output_dir, headless)
+            posts = [item for item in items if item["kind"] == "post"]
+            if posts:
+                await _process_posts(queue, posts, worker_id, held, attempted, stats, output_dir, headless)
+        finally:
+            heartbeat.cancel()
+            # 처리하지 못한 작업 (수집 중단 등)은 바로 다른 워커가 가져갈 수 있도록 반환
+            # 시작하지 못한 작업만 임대 횟수를 돌려받음 (시도했는데 결과가 없으면 횟수를 써서 결국 failed)
+            queue.release([key for key in held if key not in attempted], worker_id)
+            queue.release([key for key in held if key in attempted], worker_id, attempted=True)
+
+    print(f"✅ 워커 {worker_id} 종료: 회원 {stats['members']}명, 게시물 {stats['posts']}개, 실패 {stats['failed']}개")
+    return stats
+
+
+def worker_process_main(queue_url: str, worker_id: str, output_dir: str, headless: bool, delay_scale: float,
+                        mobile: bool = False):
+    """조정자가 띄우는 로컬 워커 프로세스 진입점"""
+    from scraper import set_delay_scale, set_mobile_mode
+    from scraper.pool import exit_with_parent
+
+    exit_with_parent()
+    sys.stdout.reconfigure(line_buffering=True)
+    set_delay_scale(delay_scale)
+    set_mobile_mode(mobile)
+    queue = open_work_queue(queue_url)
+    try:
+        asyncio.run(run_worker(queue, worker_id, output_dir=output_dir, headless=headless))
+    finally:
+        queue.close()
@@ -1,20 +1,198 @@
-use std::process::{Command, Stdio};
 use std::path::PathBuf;
-use tauri::{AppHandle, Manager};
+use std::process::Stdio;
+use std::sync::Mutex;
+use std::time::Duration;
 
-use std::io::{BufRead, BufReader};
-use tauri::Emitter;
+use serde::Serialize;
+use serde_json::Value;
+use tauri::{AppHandle, Emitter, Manager, State};
+use tokio::io::{AsyncBufReadExt, AsyncRead, BufReader};
+use tokio::process::Command;
+use tokio::sync::{mpsc, oneshot};
+use tokio::time::MissedTickBehavior;
+
+/// Python 이벤트 프로토콜의 레코드 구분 문자 (python/events/protocol.py)
+const RECORD_SEPARATOR: char = '\u{1e}';
+
+/// 웹뷰로 이벤트를 묶어서 보내는 간격 (초당 최대 10회 emit)
+const BATCH_INTERVAL: Duration = Duration::from_millis(100);
+
+/// 배치 하나에 담는 사람용 로그 최대 줄 수 (초과분은 개수만 전달)
+const MAX_LOGS_PER_BATCH: usize = 200;
+
+/// 자식 프로세스 종료 후 남은 출력을 기다리는 최대 시간
+/// (Chromium 같은 손자 프로세스가 파이프를 물고 있으면 읽기 작업이 끝나지 않음)
+const DRAIN_TIMEOUT: Duration = Duration::from_secs(2);
+
+/// 실행 중인 스크래핑 작업
+struct RunHandle {
+    /// 중지 신호 송신기 (stop_scraping이 가져가면 None)
+    cancel: Option<oneshot::Sender<()>>,
+}
+
+/// 스크래핑 작업 상태 (한 번에 하나만 실행)
+#[derive(Default)]
+pub struct ScrapingState {
+    run: Mutex<Option<RunHandle>>,
+}
+
+/// 자식 프로세스 출력 한 줄
+enum Incoming {
+    Event(Value),
+    Log(String),
+}
+
+/// 웹뷰로 보내는 배치 ('scraping-batch' 이벤트)
+#[derive(Serialize, Clone, Default)]
+struct EventBatch {
+    /// 이 구간의 마지막 진행률 이벤트 (중간 값은 버림)
+    progress: Option<Value>,
+    /// 진행률 외 이벤트 (log, metric, result, error) - 순서 유지
+    events: Vec<Value>,
+    /// 사람용 로그 줄
+    logs: Vec<String>,
+    /// MAX_LOGS_PER_BATCH를 넘어 버린 로그 줄 수
+    dropped_logs: usize,
+}
+
+impl EventBatch {
+    fn push(&mut self, incoming: Incoming) {
+        match incoming {
+            Incoming::Event(event) => {
+                if event.get("type").and_then(Value::as_str) == Some("progress") {
+                    self.progress = Some(event);
+                } else {
+                    self.events.push(event);
+                }
+            }
+            Incoming::Log(line) => {
+                if self.logs.len() < MAX_LOGS_PER_BATCH {
+                    self.logs.push(line);
+                } else {
+                    self.dropped_logs += 1;
+                }
+            }
+        }
+    }
+
+    fn is_empty(&self) -> bool {
+        self.progress.is_none() && self.events.is_empty() && self.logs.is_empty() && self.dropped_logs == 0
+    }
+}
+
+/// 'scraping-complete' 이벤트
+#[derive(Serialize, Clone)]
+struct CompletePayload {
+    code: Option<i32>,
+    cancelled: bool,
+}
+
+/// RS(0x1E)로 시작하는 줄은 기계용 이벤트, 나머지는 사람용 로그
+fn classify_line(line: String) -> Incoming {
+    match line.strip_prefix(RECORD_SEPARATOR) {
+        Some(payload) => match serde_json::from_str::<Value>(payload) {
+            Ok(event) => Incoming::Event(event),
+            Err(e) => Incoming::Log(format!("[ERROR] 이벤트 파싱 실패: {} ({})", e, payload)),
+        },
+        None => Incoming::Log(line),
+    }
+}
+
+/// 단일 로그 줄을 배치 형식으로 즉시 전송 (자식 프로세스 밖에서 생긴 메시지용)
+fn emit_log(app_handle: &AppHandle, line: String) {
+    let mut batch = EventBatch::default();
+    batch.push(Incoming::Log(line));
+    let _ = app_handle.emit("scraping-batch", batch);
+}
+
+/// 파이프에서 줄을 읽어 채널로 전달
+///
+/// UTF-8이 아닌 줄(예: Windows cp949 traceback)도 손실 변환해 계속 읽음 - 중간에 멈추면
+/// 파이프가 비워지지 않아 Python 자식 프로세스가 가득 찬 stdout / stderr 버퍼에서 멈출 수 있음
+/// EOF나 I/O 에러에서만 종료하고, 웹뷰 쪽 채널이 닫혀도 파이프는 끝까지 비움
+async fn read_lines<R: AsyncRead + Unpin>(reader: R, tx: mpsc::Sender<Incoming>, is_stderr: bool) {
+    let mut reader = BufReader::new(reader);
+    let mut buf = Vec::new();
+    let mut forwarding = true;
+    loop {
+        buf.clear();
+        match reader.read_until(b'\n', &mut buf).await {
+            Ok(0) | Err(_) => break,
+            Ok(_) => {}
+        }
+        if !forwarding {
+            continue;
+        }
+        let line = String::from_utf8_lossy(&buf)
+            .trim_end_matches(|c| c == '\n' || c == '\r')
+            .to_string();
+        let incoming = if is_stderr {
+            // stderr도 로그로 전송
+            Incoming::Log(format!("[ERROR] {}", line))
+        } else {
+            classify_line(line)
+        };
+        if tx.send(incoming).await.is_err() {
+            forwarding = false;
+        }
+    }
+}
+
+/// 채널에서 받은 출력을 BATCH_INTERVAL 단위로 묶어 웹뷰에 전송
+async fn forward_batches(app_handle: AppHandle, mut rx: mpsc::Receiver<Incoming>) {
+    let mut batch = EventBatch::default();
+    let mut ticker = tokio::time::interval(BATCH_INTERVAL);
+    ticker.set_missed_tick_behavior(MissedTickBehavior::Delay);
+
+    loop {
+        tokio::select! {
+            incoming = rx.recv() => match incoming {
+                Some(incoming) => batch.push(incoming),
+                None => break,
+            },
+            _ = ticker.tick() => {
+                if !batch.is_empty() {
+                    let _ = app_handle.emit("scraping-batch", std::mem::take(&mut batch));
+                }
+            }
+        }
+    }
+
+    if !batch.is_empty() {
+        let _ = app_handle.emit("scraping-batch", batch);
+    }
+}
+
+/// 작업 종료 처리: 상태 해제 후 완료 이벤트 전송
+fn finish_run(app_handle: &AppHandle, payload: CompletePayload) {
+    if let Ok(mut run) = app_handle.state::<ScrapingState>().run.lock() {
+        *run = None;
+    }
+    let _ = app_handle.emit("scraping-complete", payload);
+}
 
 #[tauri::command]
 pub async fn start_scraping(
     app_handle: AppHandle,
+    state: State<'_, ScrapingState>,
     mode: String,
     data: String,
     max_pages: Option<u32>,
 ) -> Result<(), String> {
     // 디버그: 함수 호출 확인
     println!("🔍 [RUST] start_scraping called with mode={}, data={}, max_pages={:?}", mode, data, max_pages);
-    let _ = app_handle.emit("scraping-log", format!("🔍 [RUST] start_scraping called with mode={}, data={}", mode, data));
+
+    // 한 번에 하나의 작업만 실행
+    let (cancel_tx, cancel_rx) = oneshot::channel();
+    {
+        let mut run = state.run.lock().map_err(|e| e.to_string())?;
+        if run.is_some() {
+            return Err("이미 실행 중인 작업이 있습니다".to_string());
+        }
+        *run = Some(RunHandle { cancel: Some(cancel_tx) });
+    }
+
+    emit_log(&app_handle, format!("🔍 [RUST] start_scraping called with mode={}, data={}", mode, data));
     
     // 리소스 디렉토리 가져오기 (프로덕션) 또는 개발 경로 사용
     let (python_path, script_path, project_root) = if cfg!(debug_assertions) {
@@ -29,10 +207,15 @@ pub async fn start_scraping(
         (python_path, script_path, project_root)
     } else {
         // 프로덕션 모드: 번들된 리소스 사용
-        let resource_dir = app_handle
-            .path()
-            .resource_dir()
-            .map_err(|e| e.to_string())?;
+        let resource_dir = match app_handle.path().resource_dir() {
+            Ok(dir) => dir,
+            Err(e) => {
+                if let Ok(mut run) = state.run.lock() {
+                    *run = None;
+                }
+                return Err(e.to_string());
+            }
+        };
         
         let python_path = if cfg!(target_os = "windows") {
             resource_dir.join("python-embed").join("python.exe")
@@ -56,62 +239,81 @@ pub async fn start_scraping(
         args.push(pages.to_string());
     }
     
-    // 비동기 스레드에서 실행
+    // 비동기 작업에서 실행 (파이프 읽기, 배치 전송, 중지 대기)
     let app_handle_clone = app_handle.clone();
 
-    std::thread::spawn(move || {
+    tauri::async_runtime::spawn(async move {
         let mut child = match Command::new(&python_path)
             .args(&args)
             .current_dir(&project_root) // CWD 명시적 설정
             .env("PYTHONIOENCODING", "utf-8") // UTF-8 인코딩 강제
             .stdout(Stdio::piped())
             .stderr(Stdio::piped())
+            .kill_on_drop(true)
             .spawn()
         {
             Ok(child) => child,
             Err(e) => {
                 let error_msg = format!("Failed to spawn python process: {}. Python path: {:?}, Project root: {:?}", e, python_path, project_root);
-                let _ = app_handle_clone.emit("scraping-log", error_msg);
+                emit_log(&app_handle_clone, error_msg);
+                finish_run(&app_handle_clone, CompletePayload { code: None, cancelled: false });
                 return;
             }
         };
 
-        // stdout 처리
-        let app_handle_stdout = app_handle_clone.clone();
+        // stdout / stderr 읽기 → 채널 → 배치 전송
+        let (tx, rx) = mpsc::channel(1024);
+        let mut readers = Vec::new();
         if let Some(stdout) = child.stdout.take() {
-            std::thread::spawn(move || {
-                let reader = BufReader::new(stdout);
-                for line in reader.lines() {
-                    if let Ok(line) = line {
-                        // 로그 이벤트 전송
-                        let _ = app_handle_stdout.emit("scraping-log", line);
-                    }
-                }
-            });
+            readers.push(tauri::async_runtime::spawn(read_lines(stdout, tx.clone(), false)));
         }
-        
-        // stderr 처리 (에러 메시지도 UI에 표시)
-        let app_handle_stderr = app_handle_clone.clone();
         if let Some(stderr) = child.stderr.take() {
-            std::thread::spawn(move || {
-                let reader = BufReader::new(stderr);
-                for line in reader.lines() {
-                    if let Ok(line) = line {
-                        // stderr도 로그로 전송
-                        let _ = app_handle_stderr.emit("scraping-log", format!("[ERROR] {}", line));
-                    }
-                }
-            });
+            readers.push(tauri::async_runtime::spawn(read_lines(stderr, tx.clone(), true)));
         }
-        
-        let _ = child.wait();
-        // 완료 이벤트 전송
-        let _ = app_handle_clone.emit("scraping-complete", "done");
+        drop(tx);
+        let batcher = tauri::async_runtime::spawn(forward_batches(app_handle_clone.clone(), rx));
+
+        // 종료 또는 중지 요청 대기
+        let exited = tokio::select! {
+            status = child.wait() => Some(status.ok()),
+            _ = cancel_rx => None,
+        };
+        let cancelled = exited.is_none();
+        let status = match exited {
+            Some(status) => status,
+            None => {
+                let _ = child.kill().await;
+                child.wait().await.ok()
+            }
+        };
+
+        // 남은 출력 전송 (파이프가 닫히지 않으면 읽기 작업 중단)
+        if tokio::time::timeout(DRAIN_TIMEOUT, batcher).await.is_err() {
+            for reader in &readers {
+                reader.abort();
+            }
+        }
+
+        finish_run(&app_handle_clone, CompletePayload {
+            code: status.and_then(|s| s.code()),
+            cancelled,
+        });
     });
     
     Ok(())
 }
 
+#[tauri::command]
+pub fn stop_scraping(state: State<'_, ScrapingState>) -> Result<bool, String> {
+    // 실행 중인 작업에 중지 신호 전송 (실행 중이 아니면 false)
+    let mut run = state.run.lock().map_err(|e| e.to_string())?;
+    let cancel = run.as_mut().and_then(|handle| handle.cancel.take());
+    Ok(match cancel {
+        Some(tx) => tx.send(()).is_ok(),
+        None => false,
+    })
+}
+
 #[tauri::command]
 pub async fn open_explorer(path: String) -> Result<(), String> {
     use std::process::Command;
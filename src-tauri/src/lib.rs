@@ -3,6 +3,7 @@ mod commands;
 #[cfg_attr(mobile, tauri::mobile_entry_point)]
 pub fn run() {
   tauri::Builder::default()
+    .manage(commands::ScrapingState::default())
     .setup(|app| {
       if cfg!(debug_assertions) {
         app.handle().plugin(
@@ -15,6 +16,7 @@ pub fn run() {
     })
     .invoke_handler(tauri::generate_handler![
       commands::start_scraping,
+      commands::stop_scraping,
       commands::get_app_dir,
       commands::open_explorer
     ])
@@ -2,6 +2,28 @@
 
 import { useState, useEffect, useRef } from "react";
 
+// Python 이벤트 프로토콜 v1 (python/events/protocol.py)
+const EVENT_PROTOCOL_VERSION = 1;
+
+type ScrapingEvent = { v: number; ts: number } & (
+    | { type: "progress"; message: string; progress: number }
+    | { type: "log"; level: string; message: string }
+    | { type: "metric"; metrics: any; final: boolean }
+    | { type: "result"; saved_files?: string[]; [key: string]: any }
+    | { type: "error"; message: string }
+    | { type: "new_post"; member_id: string; url: string; title: string; date: string; file: string }
+);
+
+// Rust가 100ms 단위로 묶어서 보내는 배치 (src-tauri/src/commands.rs)
+type ScrapingBatch = {
+    progress: ScrapingEvent | null;
+    events: ScrapingEvent[];
+    logs: string[];
+    dropped_logs: number;
+};
+
+type ScrapingComplete = { code: number | null; cancelled: boolean };
+
 export default function Home() {
     const [inputMode, setInputMode] = useState<"member" | "urls">("member");
     const [memberId, setMemberId] = useState("3902132645");
@@ -14,13 +36,13 @@ export default function Home() {
     const [isTauriMode, setIsTauriMode] = useState(false);
 
     // 리스너 관리용 Ref
-    const unlistenLogRef = useRef<(() => void) | null>(null);
+    const unlistenBatchRef = useRef<(() => void) | null>(null);
     const unlistenCompleteRef = useRef<(() => void) | null>(null);
 
     // 컴포넌트 언마운트 시 리스너 정리
     useEffect(() => {
         return () => {
-            if (unlistenLogRef.current) unlistenLogRef.current();
+            if (unlistenBatchRef.current) unlistenBatchRef.current();
             if (unlistenCompleteRef.current) unlistenCompleteRef.current();
         };
     }, []);
@@ -45,9 +67,9 @@ export default function Home() {
         if (isRunning) return;
 
         // 기존 리스너 정리
-        if (unlistenLogRef.current) {
-            unlistenLogRef.current();
-            unlistenLogRef.current = null;
+        if (unlistenBatchRef.current) {
+            unlistenBatchRef.current();
+            unlistenBatchRef.current = null;
         }
         if (unlistenCompleteRef.current) {
             unlistenCompleteRef.current();
@@ -66,30 +88,31 @@ export default function Home() {
                 const { invoke } = await import('@tauri-apps/api/core');
                 const { listen } = await import('@tauri-apps/api/event');
 
-                // 로그 리스너
+                // 이벤트 배치 리스너 (구간당 최신 진행률 1개 + 나머지 이벤트 + 사람용 로그)
                 console.log('👂 Setting up event listeners...');
-                unlistenLogRef.current = await listen<string>('scraping-log', (event) => {
-                    const line = event.payload;
-                    console.log('📨 Received log:', line);
-                    try {
-                        const json = JSON.parse(line);
-                        if (json.progress !== undefined) {
-                            setProgress(json.progress);
-                            setStatus(json.status || "처리 중...");
-                        }
-                        if (json.saved_files) {
-                            setResults(json);
-                        }
-                    } catch (e) {
-                        console.log("Text log:", line);
+                unlistenBatchRef.current = await listen<ScrapingBatch>('scraping-batch', (event) => {
+                    const batch = event.payload;
+                    if (batch.logs.length > 0) {
+                        console.log("Text log:\n" + batch.logs.join("\n"));
+                    }
+                    if (batch.dropped_logs > 0) {
+                        console.log(`(${batch.dropped_logs} log lines skipped)`);
+                    }
+                    if (batch.progress) {
+                        handleScrapingEvent(batch.progress);
                     }
+                    batch.events.forEach(handleScrapingEvent);
                 });
 
                 // 완료 리스너
-                unlistenCompleteRef.current = await listen('scraping-complete', () => {
-                    console.log('✅ Scraping complete event received');
-                    setProgress(100);
-                    setStatus("완료!");
+                unlistenCompleteRef.current = await listen<ScrapingComplete>('scraping-complete', (event) => {
+                    console.log('✅ Scraping complete event received', event.payload);
+                    if (event.payload.cancelled) {
+                        setStatus("⏹️ 중지됨");
+                    } else {
+                        setProgress(100);
+                        setStatus("완료!");
+                    }
                     setIsRunning(false);
                 });
 
@@ -119,6 +142,47 @@ export default function Home() {
         }
     };
 
+    const handleScrapingEvent = (event: ScrapingEvent) => {
+        if (event.v !== EVENT_PROTOCOL_VERSION) {
+            console.warn('⚠️ Unknown event protocol version:', event.v);
+        }
+        switch (event.type) {
+            case "progress":
+                setProgress(event.progress);
+                setStatus(event.message || "처리 중...");
+                break;
+            case "result":
+                if (event.saved_files) {
+                    setResults(event);
+                }
+                break;
+            case "error":
+                setStatus("❌ " + event.message);
+                break;
+            case "log":
+                console.log(`📨 [${event.level}]`, event.message);
+                break;
+            case "metric":
+                console.log('📊 Metrics:', event.metrics);
+                break;
+            case "new_post":
+                setStatus(`🆕 새 게시물: ${event.title}`);
+                break;
+        }
+    };
+
+    const handleStop = async () => {
+        try {
+            const { invoke } = await import('@tauri-apps/api/core');
+            const stopped = await invoke<boolean>('stop_scraping');
+            if (stopped) {
+                setStatus("중지 중...");
+            }
+        } catch (e) {
+            console.error(e);
+        }
+    };
+
     const openFile = async (path: string) => {
         try {
             if (isTauriMode) {
@@ -224,6 +288,16 @@ export default function Home() {
                         {isRunning ? "실행 중..." : "🚀 분석 시작"}
                     </button>
 
+                    {/* Stop Button */}
+                    {isRunning && isTauriMode && (
+                        <button
+                            onClick={handleStop}
+                            className="w-full mt-3 py-3 rounded-lg font-medium bg-gray-700 text-gray-300 hover:bg-red-700 hover:text-white transition-all"
+                        >
+                            ⏹️ 중지
+                        </button>
+                    )}
+
                     {/* Progress */}
                     {isRunning && (
                         <div className="mt-6 space-y-3">